@@ -3,8 +3,13 @@ extends Node
 signal enemy_destroyed(pos)
 signal wave_announcement(wave_num)
 
+# Compiled by `scons process-assets`; without it the type resources are loaded one by one
+const SPAWN_TABLE_PATH = "res://resources/enemies/spawn_table.tres"
+const ENEMY_TYPES_DIR = "res://resources/enemies/"
+
 var enemy_scene: PackedScene
 var enemy_types: Dictionary = {}
+var spawn_table: EnemySpawnTable
 
 var wave_number = 1
 var enemies_per_wave = 2  # Start easier
@@ -18,6 +23,9 @@ var total_enemies_destroyed: int = 0
 var cleanup_timer: Timer = null
 var cleanup_interval: float = 10.0  # Check every 10 seconds
 
+# Live enemies with a spatial index; replaces scans of the "enemies" group
+var enemy_registry = EnemyRegistry.new()
+
 func setup_for_game(container: Node):
 	enemies_container = container
 	# Load the enemy scene dynamically when the game starts
@@ -31,33 +39,31 @@ func setup_for_game(container: Node):
 	setup_cleanup_timer()
 
 func load_enemy_types():
-	# Load all enemy type configurations with error checking
-	var type_files = {
-		"scout_fighter": "res://resources/enemies/scout_fighter.tres",
-		"guard_drone": "res://resources/enemies/guard_drone.tres",
-		"heavy_gunner": "res://resources/enemies/heavy_gunner.tres",
-		"interceptor": "res://resources/enemies/interceptor.tres",
-		"fortress_ship": "res://resources/enemies/fortress_ship.tres",
-		"support_carrier": "res://resources/enemies/support_carrier.tres",
-		"elite_scout_fighter": "res://resources/enemies/elite_scout_fighter.tres",
-		"elite_guard_drone": "res://resources/enemies/elite_guard_drone.tres",
-		"elite_heavy_gunner": "res://resources/enemies/elite_heavy_gunner.tres"
-	}
-
-	for type_name in type_files.keys():
-		var file_path = type_files[type_name]
-		if ResourceLoader.exists(file_path):
-			var resource = load(file_path)
-			if resource:
-				enemy_types[type_name] = resource
-				print("Loaded enemy type: ", type_name)
-			else:
-				print("Failed to load enemy type resource: ", type_name)
-		else:
-			print("Enemy type file not found: ", file_path)
+	if spawn_table:
+		return
+
+	if ResourceLoader.exists(SPAWN_TABLE_PATH):
+		spawn_table = load(SPAWN_TABLE_PATH)
+	if not spawn_table:
+		spawn_table = EnemySpawnTable.from_enemy_types(load_enemy_type_resources())
+	enemy_types = spawn_table.enemy_types
 
 	print("Total enemy types loaded: ", enemy_types.size())
 
+func load_enemy_type_resources() -> Dictionary:
+	var types = {}
+	for file_name in DirAccess.get_files_at(ENEMY_TYPES_DIR):
+		# Exported projects list remapped resources as *.tres.remap
+		file_name = file_name.trim_suffix(".remap")
+		if file_name.get_extension() != "tres" or ENEMY_TYPES_DIR + file_name == SPAWN_TABLE_PATH:
+			continue
+		var resource = load(ENEMY_TYPES_DIR + file_name)
+		if resource is EnemyTypeData:
+			types[file_name.get_basename()] = resource
+		else:
+			print("Failed to load enemy type resource: ", file_name)
+	return types
+
 func reset_game_state():
 	wave_number = 1
 	enemies_per_wave = 4  # Start with more enemies
@@ -65,6 +71,30 @@ func reset_game_state():
 	game_over = false
 	total_enemies_spawned = 0
 	total_enemies_destroyed = 0
+	enemy_registry.reset_stats()
+
+func register_enemy(enemy: Node2D):
+	"""Called by Enemy._ready(), so pooled reuse and drones are covered too"""
+	enemy_registry.register(enemy)
+
+func unregister_enemy(enemy: Node2D):
+	"""Called when an enemy is destroyed or leaves the tree; repeated calls are ignored"""
+	enemy_registry.unregister(enemy)
+
+func get_enemy_count() -> int:
+	return enemy_registry.count()
+
+func get_enemies() -> Array:
+	return enemy_registry.get_enemies()
+
+func get_enemies_in_radius(center: Vector2, radius: float, filter: Callable = Callable()) -> Array:
+	return enemy_registry.query_radius(center, radius, filter)
+
+func find_nearest_enemy(center: Vector2, max_range: float, filter: Callable = Callable()) -> Node2D:
+	return enemy_registry.find_nearest(center, max_range, filter)
+
+func get_registry_stats() -> Dictionary:
+	return enemy_registry.get_stats()
 
 func spawn_random_enemies():
 	if game_over or not enemies_container:
@@ -86,7 +116,7 @@ func spawn_enemy(x_offset = 0, enemy_type_name: String = ""):
 		print("Cannot spawn enemy: missing enemy_scene")
 		return
 
-	var enemy = enemy_scene.instantiate()
+	var enemy = NodePool.acquire("enemy")
 
 	var x_pos = randf_range(50, 750) + x_offset
 	x_pos = clamp(x_pos, 50, 750)
@@ -114,37 +144,17 @@ func spawn_enemy(x_offset = 0, enemy_type_name: String = ""):
 
 	# Track spawned enemies
 	total_enemies_spawned += 1
-	print("[EnemyManager] Spawned enemy #", total_enemies_spawned, " - Active: ", get_tree().get_nodes_in_group("enemies").size())
+	print("[EnemyManager] Spawned enemy #", total_enemies_spawned, " - Active: ", get_enemy_count())
 
 func get_random_enemy_type_for_wave() -> String:
-	# Get available enemy types for current wave
-	var available_types = get_available_enemy_types()
-
-	if available_types.is_empty():
+	# Binary search in the precomputed cumulative weights of the wave's band
+	var type_name = spawn_table.pick_type(wave_number, randi()) if spawn_table else ""
+	if type_name == "":
 		return "scout_fighter"  # Fallback
-
-	# Create weighted selection
-	var weighted_pool = []
-	for type_name in available_types:
-		var enemy_data = enemy_types[type_name]
-		var weight = int(enemy_data.spawn_weight * 10)  # Convert to integer for weighted selection
-		for i in weight:
-			weighted_pool.append(type_name)
-
-	if weighted_pool.is_empty():
-		return available_types[0]
-
-	return weighted_pool[randi() % weighted_pool.size()]
+	return type_name
 
 func get_available_enemy_types() -> Array:
-	var available = []
-
-	for type_name in enemy_types.keys():
-		var enemy_data = enemy_types[type_name]
-		if enemy_data.can_spawn_on_wave(wave_number):
-			available.append(type_name)
-
-	return available
+	return spawn_table.get_available_types(wave_number) if spawn_table else []
 
 func _on_wave_timer_timeout():
 	advance_wave()
@@ -234,7 +244,7 @@ func show_wave_announcement():
 func _on_enemy_destroyed(pos):
 	emit_signal("enemy_destroyed", pos)
 	total_enemies_destroyed += 1
-	print("[EnemyManager] Enemy destroyed #", total_enemies_destroyed, " - Remaining: ", get_tree().get_nodes_in_group("enemies").size() - 1)
+	print("[EnemyManager] Enemy destroyed #", total_enemies_destroyed, " - Remaining: ", get_enemy_count())
 
 func set_game_over(is_over: bool):
 	game_over = is_over
@@ -258,7 +268,7 @@ func _on_cleanup_timer_timeout():
 
 func perform_enemy_cleanup_sweep():
 	"""Periodic sweep to clean up orphaned enemies"""
-	var enemies = get_tree().get_nodes_in_group("enemies")
+	var enemies = get_enemies()
 	var viewport_size = get_viewport().get_visible_rect().size
 	var cleaned_count = 0
 	var active_count = 0
@@ -274,7 +284,7 @@ func perform_enemy_cleanup_sweep():
 		if (enemy_pos.x < -max_distance or enemy_pos.x > viewport_size.x + max_distance or
 		    enemy_pos.y < -max_distance or enemy_pos.y > viewport_size.y + max_distance):
 			print("[EnemyManager] Cleanup sweep found orphaned enemy at: ", enemy_pos)
-			enemy.call_deferred("queue_free")
+			NodePool.release(enemy)
 			cleaned_count += 1
 		else:
 			active_count += 1
@@ -0,0 +1,155 @@
+extends Node
+
+# Pooled scenes; Game pre-warms them so spawning and firing reuse nodes instead of instantiating
+const POOLED_SCENES = {
+	"bullet": "res://scenes/projectiles/Bullet.tscn",
+	"plasma_bullet": "res://scenes/projectiles/PlasmaBullet.tscn",
+	"enemy_bullet": "res://scenes/projectiles/EnemyBullet.tscn",
+	"enemy": "res://scenes/enemies/Enemy.tscn"
+}
+const PREWARM_COUNTS = {"bullet": 64, "plasma_bullet": 16, "enemy_bullet": 128, "enemy": 48}
+
+# Released nodes beyond this many idle ones per pool are freed instead of kept
+const MAX_IDLE_PER_POOL = 256
+
+# Restored on release along with the script variables, which _ready() may rely on
+const RESET_PROPERTIES = ["rotation", "scale", "modulate", "visible"]
+
+const POOL_KEY_META = "pool_key"
+
+var pools = {}  # pool key -> {"scene", "idle", "active", "defaults", "stats"}
+
+func get_pool(key: String):
+	"""Pool state for a key, created on first use; null for unknown keys or missing scenes"""
+	if pools.has(key):
+		return pools[key]
+	if not POOLED_SCENES.has(key) or not ResourceLoader.exists(POOLED_SCENES[key]):
+		return null
+
+	pools[key] = {
+		"scene": load(POOLED_SCENES[key]),
+		"idle": [],
+		"active": {},  # node -> true while acquired
+		"defaults": {},  # property -> value of a fresh instance
+		"stats": new_pool_stats()
+	}
+	return pools[key]
+
+func new_pool_stats() -> Dictionary:
+	return {"created": 0, "acquired": 0, "reused": 0, "released": 0, "discarded": 0, "high_water": 0}
+
+func prewarm(counts: Dictionary = PREWARM_COUNTS):
+	"""Instantiate idle nodes up to counts[key] for each pool"""
+	for key in counts:
+		var pool = get_pool(key)
+		if pool == null:
+			continue
+		prune(pool)
+		while pool["idle"].size() + pool["active"].size() < counts[key]:
+			pool["idle"].append(create_node(key, pool))
+
+func create_node(key: String, pool: Dictionary) -> Node:
+	var node = pool["scene"].instantiate()
+	node.set_meta(POOL_KEY_META, key)
+	pool["stats"]["created"] += 1
+
+	# The first instance records the values release() restores
+	if pool["defaults"].is_empty():
+		for property in node.get_property_list():
+			if property["usage"] & PROPERTY_USAGE_SCRIPT_VARIABLE or property["name"] in RESET_PROPERTIES:
+				pool["defaults"][property["name"]] = node.get(property["name"])
+	return node
+
+func acquire(key: String) -> Node:
+	"""An idle node of a pooled scene, or a new one; configure it, then add it to the tree
+
+	Reused nodes run _ready() again when they re-enter the tree.
+	"""
+	var pool = get_pool(key)
+	if pool == null:
+		push_error("NodePool: unknown pool '%s'" % key)
+		return null
+
+	var node: Node
+	while node == null and not pool["idle"].is_empty():
+		node = pool["idle"].pop_back()
+		if not is_instance_valid(node):
+			node = null
+	if node:
+		node.request_ready()
+		pool["stats"]["reused"] += 1
+	else:
+		node = create_node(key, pool)
+
+	pool["active"][node] = true
+	pool["stats"]["acquired"] += 1
+	pool["stats"]["high_water"] = max(pool["stats"]["high_water"], pool["active"].size())
+	return node
+
+func release(node: Node):
+	"""Return a node to its pool at the end of the frame; nodes not from a pool are freed"""
+	if not is_instance_valid(node):
+		return
+	if not node.has_meta(POOL_KEY_META):
+		node.call_deferred("queue_free")
+		return
+
+	var pool = pools.get(node.get_meta(POOL_KEY_META))
+	if pool == null or not pool["active"].has(node):
+		return  # Already released this frame
+	pool["active"].erase(node)
+	pool["stats"]["released"] += 1
+	# Removing areas from the tree is not allowed while physics callbacks run
+	call_deferred("_park", node, pool)
+
+func _park(node: Node, pool: Dictionary):
+	if not is_instance_valid(node):
+		return
+	if node.get_parent():
+		node.get_parent().remove_child(node)
+
+	if pool["idle"].size() >= MAX_IDLE_PER_POOL:
+		pool["stats"]["discarded"] += 1
+		node.free()
+		return
+
+	if node.has_method("reset_for_pool"):
+		node.reset_for_pool()
+	for property in pool["defaults"]:
+		var value = pool["defaults"][property]
+		node.set(property, value.duplicate() if value is Array or value is Dictionary else value)
+	pool["idle"].append(node)
+
+func prune(pool: Dictionary):
+	"""Forget active nodes that were freed with their scene instead of released"""
+	for node in pool["active"].keys():
+		if not is_instance_valid(node):
+			pool["active"].erase(node)
+
+func get_pool_stats() -> Dictionary:
+	"""Per-pool counters plus current active/idle sizes and the reuse rate"""
+	var result = {}
+	for key in pools:
+		var pool = pools[key]
+		prune(pool)
+		var pool_stats = pool["stats"].duplicate()
+		pool_stats["active"] = pool["active"].size()
+		pool_stats["idle"] = pool["idle"].size()
+		pool_stats["reuse_rate"] = float(pool_stats["reused"]) / pool_stats["acquired"] if pool_stats["acquired"] > 0 else 0.0
+		result[key] = pool_stats
+	return result
+
+func reset_pool_stats():
+	"""Zero the counters; high-water marks restart from the current active count"""
+	for key in pools:
+		prune(pools[key])
+		pools[key]["stats"] = new_pool_stats()
+		pools[key]["stats"]["high_water"] = pools[key]["active"].size()
+
+func _exit_tree():
+	# Idle nodes are outside the tree, so nothing else frees them
+	for key in pools:
+		for node in pools[key]["idle"]:
+			if is_instance_valid(node):
+				node.free()
+		pools[key]["idle"].clear()
@@ -1,49 +1,201 @@
 extends Node
 
-var audio_players = {}
+# Sounds pre-rendered by `scons process-assets` (site_scons/assets.py)
+const AUDIO_BANK_PATH = "res://resources/audio/synth_bank.bin"
+const AUDIO_BANK_VERSION = 1
+
+# Overlapping voices per sound type; the oldest voice is stolen when all are busy
+const VOICES_PER_SOUND = {"shoot": 4, "laser": 2, "enemy_hit": 4, "enemy_destroy": 4, "bomb": 2, "powerup": 2}
+const DEFAULT_VOICES = 1
+
+# Synthesized streams kept for reuse (least recently used are evicted first)
+const STREAM_CACHE_BUDGET_BYTES = 2 * 1024 * 1024
+
+# Sounds with noise get this many cached variants (noise seeds 0..n-1, like the bank)
+const NOISY_SOUNDS = ["shoot", "laser", "enemy_hit", "enemy_destroy", "bomb"]
+const SYNTH_VARIANTS = 4
+
+var voice_pools = {}  # sound name -> Array of AudioStreamPlayer voices
+var voice_started = {}  # busy voice -> voice_clock when it started
+var voice_clock = 0  # Orders voice starts for stealing; never reset, unlike stats
 var sample_rate = 44100.0
-var active_streams = []
+var baked_streams = {}  # sound name -> Array of baked AudioStreamWAV variants
+var stream_cache = {}  # "sound:variant" -> synthesized AudioStreamWAV, least recently used first
+var stream_cache_bytes = 0
+var stream_cache_budget = STREAM_CACHE_BUDGET_BYTES
+var noise_seed = 0  # Seeds noise(); the bank bakes a few seeds of every noisy sound
+var stats = {"plays": 0, "bank_hits": 0, "cache_hits": 0, "cache_misses": 0,
+			 "evictions": 0, "voice_steals": 0, "peak_voices": 0}
 
 func _ready():
-	# Create audio players for different sound types (including menu sounds)
+	# Create a voice pool for each sound type (including menu sounds)
 	var sound_types = ["shoot", "laser", "enemy_hit", "enemy_destroy", "player_hit", "powerup", "bomb", "wave_start",
 					  "menu_navigate", "menu_hover", "menu_select", "menu_back", "menu_music"]
 	for sound_type in sound_types:
-		var player = AudioStreamPlayer.new()
-		player.name = sound_type
-		player.bus = "Master"
-		add_child(player)
-		audio_players[sound_type] = player
-
-func play_sound(sound_name: String, volume_db: float = 0.0, pitch: float = 1.0):
-	if sound_name in audio_players:
-		var player = audio_players[sound_name]
-
-		# Clean up old stream before assigning new one
-		if player.stream:
-			var old_stream = player.stream
-			if old_stream in active_streams:
-				active_streams.erase(old_stream)
-			# Clear PCM data to free memory
-			if is_instance_valid(old_stream):
-				old_stream.data.clear()
-
-		var stream = generate_sound(sound_name)
-		if stream:
-			active_streams.append(stream)
-			player.stream = stream
-			player.volume_db = volume_db
-			player.pitch_scale = pitch
-			player.play()
-
-			# Connect to finished signal to cleanup stream when done
-			if not player.finished.is_connected(_on_sound_finished):
-				player.finished.connect(_on_sound_finished.bind(player))
+		var voices = []
+		for i in range(VOICES_PER_SOUND.get(sound_type, DEFAULT_VOICES)):
+			var player = AudioStreamPlayer.new()
+			player.name = sound_type if i == 0 else "%s_%d" % [sound_type, i]
+			player.bus = "Master"
+			player.finished.connect(_on_voice_finished.bind(player))
+			add_child(player)
+			voices.append(player)
+		voice_pools[sound_type] = voices
+
+	load_audio_bank()
+
+func play_sound(sound_name: String, volume_db: float = 0.0, pitch: float = 1.0) -> AudioStreamPlayer:
+	"""Play a sound on a free voice of its pool; returns the voice, or null for unknown sounds"""
+	if not sound_name in voice_pools:
+		return null
+
+	var stream = get_sound_stream(sound_name)
+	if stream == null:
+		return null
+
+	var voice = acquire_voice(sound_name)
+	voice.stream = stream
+	voice.volume_db = volume_db
+	voice.pitch_scale = pitch
+	voice.play()
+
+	stats["plays"] += 1
+	voice_clock += 1
+	voice_started[voice] = voice_clock
+	stats["peak_voices"] = max(stats["peak_voices"], voice_started.size())
+	return voice
 
 func play_random_pitch(sound_name: String, volume_db: float = 0.0, pitch_range: float = 0.1):
 	var random_pitch = randf_range(1.0 - pitch_range, 1.0 + pitch_range)
 	play_sound(sound_name, volume_db, random_pitch)
 
+func acquire_voice(sound_name: String) -> AudioStreamPlayer:
+	"""A free voice from the sound's pool, or steal the one that started longest ago"""
+	var oldest = null
+	for voice in voice_pools[sound_name]:
+		if not voice_started.has(voice):
+			return voice
+		if oldest == null or voice_started[voice] < voice_started[oldest]:
+			oldest = voice
+
+	oldest.stop()
+	voice_started.erase(oldest)
+	stats["voice_steals"] += 1
+	return oldest
+
+func get_sound_stream(sound_name: String) -> AudioStreamWAV:
+	"""A random baked variant when the bank has the sound, otherwise a cached synthesized variant"""
+	if baked_streams.has(sound_name):
+		stats["bank_hits"] += 1
+		return baked_streams[sound_name].pick_random()
+
+	var variant = randi() % SYNTH_VARIANTS if sound_name in NOISY_SOUNDS else 0
+	var key = "%s:%d" % [sound_name, variant]
+	var stream = stream_cache.get(key)
+	if stream:
+		# Re-insert to mark it most recently used (dictionaries keep insertion order)
+		stream_cache.erase(key)
+		stream_cache[key] = stream
+		stats["cache_hits"] += 1
+		return stream
+
+	stats["cache_misses"] += 1
+	noise_seed = variant
+	# Misses are bounded by the cache size, so the generators are kept off hot paths
+	stream = generate_sound(sound_name)  # lint-ignore: hot-path
+	cache_stream(key, stream)
+	return stream
+
+func cache_stream(key: String, stream: AudioStreamWAV):
+	"""Add a synthesized stream, evicting least recently used ones beyond the memory budget"""
+	stream_cache[key] = stream
+	stream_cache_bytes += stream.data.size()
+	# Evicted streams that are still playing stay alive until their voice lets go
+	while stream_cache_bytes > stream_cache_budget and stream_cache.size() > 1:
+		var oldest_key = stream_cache.keys()[0]
+		stream_cache_bytes -= stream_cache[oldest_key].data.size()
+		stream_cache.erase(oldest_key)
+		stats["evictions"] += 1
+
+func clear_stream_cache():
+	stream_cache.clear()
+	stream_cache_bytes = 0
+
+func get_audio_stats() -> Dictionary:
+	"""Stream cache and voice pool counters (hit rate counts bank and cache hits)"""
+	var result = stats.duplicate()
+	var lookups = stats["bank_hits"] + stats["cache_hits"] + stats["cache_misses"]
+	result["hit_rate"] = float(stats["bank_hits"] + stats["cache_hits"]) / lookups if lookups > 0 else 0.0
+	result["active_voices"] = voice_started.size()
+	result["cached_streams"] = stream_cache.size()
+	result["cache_bytes"] = stream_cache_bytes
+	return result
+
+func reset_audio_stats():
+	for key in stats:
+		stats[key] = 0
+
+func load_audio_bank() -> bool:
+	"""Load every baked sound variant with a single file read and decompression"""
+	if not FileAccess.file_exists(AUDIO_BANK_PATH):
+		return false
+
+	var file = FileAccess.open(AUDIO_BANK_PATH, FileAccess.READ)
+	if file == null:
+		return false
+	if file.get_buffer(4).get_string_from_ascii() != "CSB1" or file.get_32() != AUDIO_BANK_VERSION:
+		push_warning("Audio bank %s has an unknown format, synthesizing at runtime" % AUDIO_BANK_PATH)
+		return false
+
+	var bank_mix_rate = file.get_32()
+	var entry_count = file.get_32()
+	var pcm_size = file.get_32()
+	var entries = []
+	for i in range(entry_count):
+		var entry = {}
+		entry["name"] = file.get_buffer(file.get_8()).get_string_from_utf8()
+		entry["seed"] = file.get_32()
+		entry["looped"] = file.get_8() == 1
+		entry["offset"] = file.get_32()
+		entry["samples"] = file.get_32()
+		entries.append(entry)
+
+	var pcm = file.get_buffer(file.get_length() - file.get_position()).decompress(pcm_size, FileAccess.COMPRESSION_GZIP)
+	file.close()
+	if pcm.size() != pcm_size:
+		push_warning("Audio bank %s is corrupt, synthesizing at runtime" % AUDIO_BANK_PATH)
+		return false
+
+	for entry in entries:
+		var stream = AudioStreamWAV.new()
+		stream.format = AudioStreamWAV.FORMAT_16_BITS
+		stream.mix_rate = bank_mix_rate
+		stream.stereo = false
+		stream.data = pcm.slice(entry["offset"] * 2, (entry["offset"] + entry["samples"]) * 2)
+		if entry["looped"]:
+			stream.loop_mode = AudioStreamWAV.LOOP_FORWARD
+			stream.loop_begin = 0
+			stream.loop_end = entry["samples"]
+		stream.set_meta("baked", true)
+		stream.set_meta("noise_seed", entry["seed"])
+		if not baked_streams.has(entry["name"]):
+			baked_streams[entry["name"]] = []
+		baked_streams[entry["name"]].append(stream)
+	return true
+
+func noise(index: int, channel: int) -> float:
+	"""Hash noise in [0, 1) for a sample index, reproducible from noise_seed
+
+	site_scons/assets.py (synth_noise) uses the same hash so baked sounds match.
+	"""
+	var x = (((index << 2) | channel) + (noise_seed & 0x7FFFFFFF) * 0x9E3779B1) & 0xFFFFFFFF
+	x ^= x >> 16
+	x = (x * 0x7FEB352D) & 0xFFFFFFFF
+	x ^= x >> 15
+	x = (x * 0x31848BAB) & 0xFFFFFFFF
+	x ^= x >> 16
+	return float(x) / 4294967296.0
+
 func generate_sound(sound_type: String) -> AudioStreamWAV:
 	match sound_type:
 		"shoot":
@@ -75,7 +227,8 @@ func generate_sound(sound_type: String) -> AudioStreamWAV:
 		_:
 			return create_beep(0.1, 440)
 
-func create_laser_shot(duration: float, start_freq: float, end_freq: float, with_reverb: bool = false) -> AudioStreamWAV:
+func create_laser_shot(duration: float, start_freq: float, end_freq: float,
+		with_reverb: bool = false) -> AudioStreamWAV:
 	var stream = AudioStreamWAV.new()
 	stream.format = AudioStreamWAV.FORMAT_16_BITS
 	stream.mix_rate = int(sample_rate)
@@ -98,7 +251,7 @@ func create_laser_shot(duration: float, start_freq: float, end_freq: float, with
 		sample += sign(sin(2.0 * PI * freq * t)) * 0.2  # Square wave
 		
 		# Add some noise for texture
-		sample += (randf() - 0.5) * 0.1 * (1.0 - progress)
+		sample += (noise(i, 0) - 0.5) * 0.1 * (1.0 - progress)
 		
 		# Envelope (quick attack, gradual decay)
 		var envelope = 1.0 - progress
@@ -133,7 +286,7 @@ func create_hit_sound(duration: float) -> AudioStreamWAV:
 		var progress = float(i) / num_samples
 		
 		# White noise burst with pitch bend
-		var sample = (randf() - 0.5)
+		var sample = (noise(i, 0) - 0.5)
 		
 		# Add some tonal elements
 		sample += sin(2.0 * PI * (200 + progress * 100) * t) * 0.3
@@ -165,9 +318,9 @@ func create_explosion(duration: float) -> AudioStreamWAV:
 		# Brown noise (low frequency noise)
 		var sample = 0.0
 		if i == 0:
-			sample = randf() - 0.5
+			sample = noise(i, 0) - 0.5
 		else:
-			sample = (randf() - 0.5) * 0.1
+			sample = (noise(i, 0) - 0.5) * 0.1
 		
 		# Add low frequency rumble
 		sample += sin(2.0 * PI * (50 - progress * 30) * t) * 0.5
@@ -175,7 +328,7 @@ func create_explosion(duration: float) -> AudioStreamWAV:
 		
 		# Add crack at the beginning
 		if progress < 0.05:
-			sample += (randf() - 0.5) * (1.0 - progress * 20)
+			sample += (noise(i, 1) - 0.5) * (1.0 - progress * 20)
 		
 		# Exponential decay
 		var envelope = pow(1.0 - progress, 1.5)
@@ -206,10 +359,10 @@ func create_big_explosion(duration: float) -> AudioStreamWAV:
 		
 		# Initial blast
 		if progress < 0.1:
-			sample += (randf() - 0.5) * (1.0 - progress * 10)
+			sample += (noise(i, 0) - 0.5) * (1.0 - progress * 10)
 		
 		# Brown noise
-		sample += (randf() - 0.5) * 0.3
+		sample += (noise(i, 1) - 0.5) * 0.3
 		
 		# Multiple low frequency layers for rumble
 		sample += sin(2.0 * PI * (30 - progress * 20) * t) * 0.6
@@ -373,60 +526,32 @@ func create_beep(duration: float, freq: float) -> AudioStreamWAV:
 	return stream
 
 func stop_sound(sound_name: String):
-	if sound_name in audio_players:
-		var player = audio_players[sound_name]
-		player.stop()
-		# Clean up stream reference when stopping
-		if player.stream and player.stream in active_streams:
-			active_streams.erase(player.stream)
-		player.stream = null
+	if sound_name in voice_pools:
+		for voice in voice_pools[sound_name]:
+			voice.stop()
+			voice_started.erase(voice)
+			# Drop the reference so evicted streams can be freed
+			voice.stream = null
 
 func stop_all_sounds():
-	for player in audio_players.values():
-		if is_instance_valid(player):
-			player.stop()
-			# Clean up stream reference when stopping all
-			if player.stream:
-				var stream = player.stream
-				if stream in active_streams:
-					active_streams.erase(stream)
-				# Clear PCM data to free memory
-				if is_instance_valid(stream):
-					stream.data.clear()
-				player.stream = null
-
-func _on_sound_finished(player: AudioStreamPlayer):
-	# Clean up stream reference when sound finishes playing
-	if player.stream:
-		var stream = player.stream
-		if stream in active_streams:
-			active_streams.erase(stream)
-		# Clear PCM data to free memory
-		if is_instance_valid(stream):
-			stream.data.clear()
-		player.stream = null
+	for sound_name in voice_pools:
+		stop_sound(sound_name)
+
+func _on_voice_finished(voice: AudioStreamPlayer):
+	voice_started.erase(voice)
+	voice.stream = null
 
 func _exit_tree():
-	# Clean up all active streams on exit
 	stop_all_sounds()
+	clear_stream_cache()
+	baked_streams.clear()
 
-	# Explicitly free all AudioStreamWAV resources
-	for stream in active_streams:
-		if is_instance_valid(stream):
-			stream.data.clear()  # Clear PCM data
-	active_streams.clear()
-
-	# Clean up audio players
-	for player in audio_players.values():
-		if is_instance_valid(player):
-			if player.stream:
-				# Ensure stream reference is cleared before freeing player
-				var stream = player.stream
-				player.stream = null
-				if is_instance_valid(stream):
-					stream.data.clear()
-			player.call_deferred("queue_free")
-	audio_players.clear()
+	for voices in voice_pools.values():
+		for voice in voices:
+			if is_instance_valid(voice):
+				voice.call_deferred("queue_free")
+	voice_pools.clear()
+	voice_started.clear()
 
 # Menu Audio Generation Functions - Professional Title Screen System
 
@@ -435,10 +560,7 @@ func preload_menu_sounds():
 	# This helps avoid audio delays during menu navigation
 	var menu_sounds = ["menu_navigate", "menu_hover", "menu_select", "menu_back"]
 	for sound in menu_sounds:
-		var stream = generate_sound(sound)
-		if audio_players.has(sound):
-			active_streams.append(stream)
-			audio_players[sound].stream = stream
+		get_sound_stream(sound)
 
 func create_menu_navigate_sound() -> AudioStreamWAV:
 	"""Generate subtle navigation sound for menu movement"""
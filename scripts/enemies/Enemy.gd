@@ -33,16 +33,16 @@ var engine_glow_intensity = 1.0
 var target_engine_intensity = 1.0
 var time_since_spawn = 0.0
 var visual_layers = []  # For multi-layer rendering
+var damage_tween: Tween
 
 func _ready():
 	add_to_group("enemies")
 	initial_x = position.x
 
-	# Debug tracking
+	# Register for spatial queries and debug tracking
 	if has_node("/root/EnemyManager"):
-		var enemy_manager = get_node("/root/EnemyManager")
-		if "total_enemies_spawned" in enemy_manager:
-			print("[Enemy] Created - Total enemies: ", get_tree().get_nodes_in_group("enemies").size())
+		EnemyManager.register_enemy(self)
+		print("[Enemy] Created - Total enemies: ", EnemyManager.get_enemy_count())
 
 	# Initialize from enemy type data if provided
 	if enemy_type_data:
@@ -174,9 +174,11 @@ func take_damage(damage):
 	# Visual damage feedback - flash white then return to normal
 	update_damage_visuals()
 
-	var tween = create_tween()
-	tween.tween_property(self, "modulate", Color(2.0, 2.0, 2.0, 1), 0.05)  # Bright white flash
-	tween.tween_property(self, "modulate", Color(1, 1, 1, 1), 0.15)  # Return to normal
+	if damage_tween:
+		damage_tween.kill()
+	damage_tween = create_tween()
+	damage_tween.tween_property(self, "modulate", Color(2.0, 2.0, 2.0, 1), 0.05)  # Bright white flash
+	damage_tween.tween_property(self, "modulate", Color(1, 1, 1, 1), 0.15)  # Return to normal
 
 	if health <= 0:
 		destroy()
@@ -205,12 +207,41 @@ func destroy():
 	if has_node("/root/SoundManager"):
 		SoundManager.play_random_pitch("enemy_destroy", -8.0, 0.15)
 
+	# Dying enemies are no longer targets; listeners see the remaining count
+	if has_node("/root/EnemyManager"):
+		EnemyManager.unregister_enemy(self)
+
 	enemy_destroyed.emit(position)
 
 	# Debug tracking
-	print("[Enemy] Destroyed - Remaining enemies: ", get_tree().get_nodes_in_group("enemies").size() - 1)
+	if has_node("/root/EnemyManager"):
+		print("[Enemy] Destroyed - Remaining enemies: ", EnemyManager.get_enemy_count())
+
+	NodePool.release(self)
 
-	call_deferred("queue_free")
+func _exit_tree():
+	# Covers off-screen cleanup, pooling and scene changes as well as destroy()
+	if has_node("/root/EnemyManager"):
+		EnemyManager.unregister_enemy(self)
+
+func reset_for_pool():
+	# Called by NodePool before the script variables are restored; drop what _ready() and firing added
+	if damage_tween:
+		damage_tween.kill()
+	# Spawners connect again on reuse (drones are not connected at all)
+	for connection in enemy_destroyed.get_connections():
+		enemy_destroyed.disconnect(connection["callable"])
+	for child in get_children():
+		if child.owner != self:
+			remove_child(child)
+			child.queue_free()
+	$Sprite.position = Vector2.ZERO
+
+	# Timers only autostart on their first ready, so re-arm the scene's shoot timer
+	$ShootTimer.stop()
+	$ShootTimer.wait_time = 2.0
+	$ShootTimer.autostart = true
+	$ShootTimer.request_ready()
 
 func _on_area_entered(area):
 	if area.is_in_group("player_bullets"):
@@ -270,9 +301,8 @@ func shoot():
 			pass  # No weapon
 
 func fire_single_shot():
-	var bullet_scene = preload("res://scenes/projectiles/EnemyBullet.tscn") if ResourceLoader.exists("res://scenes/projectiles/EnemyBullet.tscn") else null
-	if bullet_scene:
-		var bullet = bullet_scene.instantiate()
+	var bullet = NodePool.acquire("enemy_bullet")
+	if bullet:
 		bullet.position = position + Vector2(0, 20)
 
 		# Check if this is an elite enemy
@@ -290,8 +320,7 @@ func fire_single_shot():
 		get_parent().get_parent().get_node("Bullets").add_child(bullet)
 
 func fire_spread_shot():
-	var bullet_scene = preload("res://scenes/projectiles/EnemyBullet.tscn") if ResourceLoader.exists("res://scenes/projectiles/EnemyBullet.tscn") else null
-	if bullet_scene:
+	if NodePool.get_pool("enemy_bullet"):
 		# Check if this is an elite enemy
 		var is_elite = false
 		if enemy_type_data and enemy_type_data.enemy_name:
@@ -301,7 +330,7 @@ func fire_spread_shot():
 		# Fire 3 bullets in spread pattern (5 for elites)
 		var bullet_count = 5 if is_elite else 3
 		for i in range(bullet_count):
-			var bullet = bullet_scene.instantiate()
+			var bullet = NodePool.acquire("enemy_bullet")
 			bullet.position = position + Vector2(0, 20)
 
 			if player:
@@ -322,12 +351,11 @@ func fire_spread_shot():
 			get_parent().get_parent().get_node("Bullets").add_child(bullet)
 
 func fire_multi_directional():
-	var bullet_scene = preload("res://scenes/projectiles/EnemyBullet.tscn") if ResourceLoader.exists("res://scenes/projectiles/EnemyBullet.tscn") else null
-	if bullet_scene:
+	if NodePool.get_pool("enemy_bullet"):
 		var player = get_tree().get_first_node_in_group("player")
 		# Fire 8 bullets in all directions (for fortress ship)
 		for i in range(8):
-			var bullet = bullet_scene.instantiate()
+			var bullet = NodePool.acquire("enemy_bullet")
 			bullet.position = position
 
 			# Mix of aimed and radial bullets
@@ -361,11 +389,11 @@ func spawn_drone():
 	if not enemy_type_data or not enemy_type_data.spawns_enemies:
 		return
 
-	var enemy_scene = preload("res://scenes/enemies/Enemy.tscn") if ResourceLoader.exists("res://scenes/enemies/Enemy.tscn") else null
-	if enemy_scene:
-		var drone = enemy_scene.instantiate()
+	var drone = NodePool.acquire("enemy")
+	if drone:
 		# Load scout fighter data
-		var scout_data = preload("res://resources/enemies/scout_fighter.tres") if ResourceLoader.exists("res://resources/enemies/scout_fighter.tres") else null
+		var scout_data = preload("res://resources/enemies/scout_fighter.tres") \
+			if ResourceLoader.exists("res://resources/enemies/scout_fighter.tres") else null
 		if scout_data:
 			drone.enemy_type_data = scout_data
 			drone.current_wave = current_wave
@@ -1075,7 +1103,7 @@ func check_off_screen_cleanup(delta):
 		if should_cleanup and not is_dying:
 			print("[Enemy] Force cleanup - ", cleanup_reason, " at position: ", position)
 			is_dying = true
-			call_deferred("queue_free")
+			NodePool.release(self)
 	else:
 		# Enemy returned on-screen, reset timer
 		if is_off_screen:
@@ -0,0 +1,136 @@
+extends RefCounted
+
+class_name EnemyRegistry
+
+## Live enemies indexed by a uniform grid for nearest and in-radius queries.
+## Enemies register in _ready() and unregister when destroyed or when they
+## leave the tree (EnemyManager owns the instance). They move every frame, so
+## the grid is rebuilt lazily, at most once per frame, by the first query.
+
+# About the homing range of a low-level plasma shot, so most queries touch 4-9 cells
+const CELL_SIZE = 128.0
+
+# Enemies may have moved since the grid was built this frame; widen the cell range by this
+const MOVE_SLACK = 16.0
+
+var enemies: Array = []
+var index_of: Dictionary = {}  # enemy -> index in enemies
+var cells: Dictionary = {}  # Vector2i cell -> Array of enemies
+var built_frame = -1
+var stats = new_stats()
+
+func new_stats() -> Dictionary:
+	return {"registered": 0, "unregistered": 0, "peak": 0, "rebuilds": 0, "queries": 0, "candidates": 0}
+
+func register(enemy: Node2D) -> bool:
+	if index_of.has(enemy):
+		return false
+	index_of[enemy] = enemies.size()
+	enemies.append(enemy)
+	stats["registered"] += 1
+	stats["peak"] = max(stats["peak"], enemies.size())
+
+	# Queries later this frame should see the new enemy without a rebuild
+	if built_frame == Engine.get_process_frames():
+		get_cell(cell_of(enemy.global_position)).append(enemy)
+	return true
+
+func unregister(enemy: Node2D) -> bool:
+	"""Remove an enemy in O(1) by moving the last one into its slot"""
+	if not index_of.has(enemy):
+		return false
+	var index = index_of[enemy]
+	var last = enemies.pop_back()
+	if last != enemy:
+		enemies[index] = last
+		index_of[last] = index
+	index_of.erase(enemy)
+	stats["unregistered"] += 1
+
+	if built_frame == Engine.get_process_frames():
+		for cell in cells.values():
+			cell.erase(enemy)
+	return true
+
+func has(enemy: Node2D) -> bool:
+	return index_of.has(enemy)
+
+func count() -> int:
+	return enemies.size()
+
+func get_enemies() -> Array:
+	"""A copy, safe to iterate while enemies are destroyed"""
+	return enemies.duplicate()
+
+func clear():
+	enemies.clear()
+	index_of.clear()
+	cells.clear()
+	built_frame = -1
+
+func cell_of(pos: Vector2) -> Vector2i:
+	return Vector2i(floori(pos.x / CELL_SIZE), floori(pos.y / CELL_SIZE))
+
+func get_cell(cell: Vector2i) -> Array:
+	if not cells.has(cell):
+		cells[cell] = []
+	return cells[cell]
+
+func ensure_built():
+	var frame = Engine.get_process_frames()
+	if built_frame == frame:
+		return
+	built_frame = frame
+	stats["rebuilds"] += 1
+	cells.clear()
+	for enemy in enemies:
+		if is_instance_valid(enemy):
+			get_cell(cell_of(enemy.global_position)).append(enemy)
+
+func query_radius(center: Vector2, radius: float, filter: Callable = Callable()) -> Array:
+	"""Enemies within radius of center, optionally only those filter accepts"""
+	ensure_built()
+	stats["queries"] += 1
+	var result = []
+	var radius_squared = radius * radius
+	var first = cell_of(center - Vector2.ONE * (radius + MOVE_SLACK))
+	var last = cell_of(center + Vector2.ONE * (radius + MOVE_SLACK))
+	for x in range(first.x, last.x + 1):
+		for y in range(first.y, last.y + 1):
+			var cell = cells.get(Vector2i(x, y))
+			if cell == null:
+				continue
+			for enemy in cell:
+				stats["candidates"] += 1
+				if not is_instance_valid(enemy):
+					continue
+				if center.distance_squared_to(enemy.global_position) > radius_squared:
+					continue
+				if filter.is_valid() and not filter.call(enemy):
+					continue
+				result.append(enemy)
+	return result
+
+func find_nearest(center: Vector2, max_range: float, filter: Callable = Callable()) -> Node2D:
+	"""Closest enemy strictly within max_range that filter accepts, or null"""
+	var nearest: Node2D = null
+	var nearest_distance = max_range * max_range
+	for enemy in query_radius(center, max_range):
+		var distance = center.distance_squared_to(enemy.global_position)
+		if distance >= nearest_distance:
+			continue
+		if filter.is_valid() and not filter.call(enemy):
+			continue
+		nearest = enemy
+		nearest_distance = distance
+	return nearest
+
+func get_stats() -> Dictionary:
+	var result = stats.duplicate()
+	result["active"] = enemies.size()
+	result["cells"] = cells.size()
+	return result
+
+func reset_stats():
+	stats = new_stats()
+	stats["peak"] = enemies.size()
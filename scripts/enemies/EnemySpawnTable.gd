@@ -0,0 +1,73 @@
+extends Resource
+
+class_name EnemySpawnTable
+
+## Enemy types with precomputed spawn weights per wave band.
+## Compiled by `scons process-assets` (site_scons/assets.py) into
+## res://resources/enemies/spawn_table.tres; from_enemy_types() builds the same
+## table at runtime when the compiled one is missing.
+
+# spawn_weight is turned into integer tickets (0.15 -> 1, 1.0 -> 10)
+const WEIGHT_SCALE = 10
+
+@export var enemy_types: Dictionary = {}  # type name -> EnemyTypeData
+@export var band_start_waves: PackedInt32Array = PackedInt32Array()  # Ascending first wave of each band
+# Band i owns entries band_offsets[i]..band_offsets[i + 1] - 1
+@export var band_offsets: PackedInt32Array = PackedInt32Array()
+@export var entry_types: PackedStringArray = PackedStringArray()
+@export var entry_cumulative: PackedInt32Array = PackedInt32Array()  # Running ticket total within the band
+
+static func from_enemy_types(types: Dictionary) -> EnemySpawnTable:
+	var table = EnemySpawnTable.new()
+	table.enemy_types = types
+
+	var start_waves = []
+	for enemy_data in types.values():
+		if not enemy_data.min_wave in start_waves:
+			start_waves.append(enemy_data.min_wave)
+	start_waves.sort()
+
+	var type_names = types.keys()
+	type_names.sort()
+	for start_wave in start_waves:
+		table.band_start_waves.append(start_wave)
+		table.band_offsets.append(table.entry_types.size())
+		var total = 0
+		for type_name in type_names:
+			var tickets = int(types[type_name].spawn_weight * WEIGHT_SCALE)
+			if types[type_name].can_spawn_on_wave(start_wave) and tickets > 0:
+				total += tickets
+				table.entry_types.append(type_name)
+				table.entry_cumulative.append(total)
+	table.band_offsets.append(table.entry_types.size())
+	return table
+
+func get_band(wave_number: int) -> int:
+	"""Index of the band containing wave_number, or -1 before the first band"""
+	return band_start_waves.bsearch(wave_number, false) - 1
+
+func pick_type(wave_number: int, roll: int) -> String:
+	"""Weighted type for the wave from a non-negative random roll (e.g. randi()); "" if none can spawn"""
+	var band = get_band(wave_number)
+	if band < 0:
+		return ""
+	var first = band_offsets[band]
+	var last = band_offsets[band + 1] - 1
+	if last < first:
+		return ""
+
+	# First entry whose running total exceeds the ticket drawn
+	var ticket = roll % entry_cumulative[last]
+	while first < last:
+		var middle = (first + last) >> 1
+		if entry_cumulative[middle] > ticket:
+			last = middle
+		else:
+			first = middle + 1
+	return entry_types[first]
+
+func get_available_types(wave_number: int) -> Array:
+	var band = get_band(wave_number)
+	if band < 0:
+		return []
+	return Array(entry_types.slice(band_offsets[band], band_offsets[band + 1]))
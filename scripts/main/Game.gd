@@ -1,8 +1,7 @@
 extends Node2D
 
-@export var bullet_scene: PackedScene = preload("res://scenes/projectiles/Bullet.tscn") if ResourceLoader.exists("res://scenes/projectiles/Bullet.tscn") else null
-@export var chain_bullet_scene: PackedScene = preload("res://scenes/projectiles/PlasmaBullet.tscn") if ResourceLoader.exists("res://scenes/projectiles/PlasmaBullet.tscn") else null
-@export var powerup_scene: PackedScene = preload("res://scenes/pickups/PowerUp.tscn") if ResourceLoader.exists("res://scenes/pickups/PowerUp.tscn") else null
+@export var powerup_scene: PackedScene = preload("res://scenes/pickups/PowerUp.tscn") \
+	if ResourceLoader.exists("res://scenes/pickups/PowerUp.tscn") else null
 
 var lives = 3
 var bombs = 3
@@ -13,6 +12,8 @@ var starfield_background
 
 func _ready():
 	randomize()
+	# Instantiate pooled bullets and enemies up front rather than mid-wave
+	NodePool.prewarm()
 	setup_starfield_background()
 	spawn_player()
 	update_ui()
@@ -37,7 +38,8 @@ func _process(delta):
 	pass
 
 func spawn_player():
-	var player_scene = preload("res://scenes/player/Player.tscn") if ResourceLoader.exists("res://scenes/player/Player.tscn") else null
+	var player_scene = preload("res://scenes/player/Player.tscn") \
+		if ResourceLoader.exists("res://scenes/player/Player.tscn") else null
 	if player_scene:
 		# Remove old player instance if it exists
 		if current_player and is_instance_valid(current_player):
@@ -125,17 +127,17 @@ func spawn_powerup(pos):
 		$PowerUps.add_child(powerup)
 
 func _on_player_shoot(bullet_position, bullet_direction, weapon_type = "vulcan"):
-	var scene_to_use
+	var pool_key
 	match weapon_type:
 		"vulcan":
-			scene_to_use = bullet_scene
+			pool_key = "bullet"
 		"chain":
-			scene_to_use = chain_bullet_scene
+			pool_key = "plasma_bullet"
 		_:
-			scene_to_use = bullet_scene
+			pool_key = "bullet"
 
-	if scene_to_use:
-		var bullet = scene_to_use.instantiate()
+	var bullet = NodePool.acquire(pool_key)
+	if bullet:
 		bullet.position = bullet_position
 		bullet.direction = bullet_direction
 
@@ -169,7 +171,7 @@ func clear_screen_with_bomb():
 	# Clear all enemy bullets too
 	for bullet in $Bullets.get_children():
 		if bullet.is_in_group("enemy_bullets"):
-			bullet.call_deferred("queue_free")
+			NodePool.release(bullet)
 
 	# Create massive bomb explosion effect
 	EffectManager.create_explosion("bomb", Vector2(400, 450), $Effects)
@@ -302,12 +304,14 @@ func update_ui():
 	$UI/HUD/BombsLabel.text = "Bombs: " + str(bombs)
 	
 	# Show weapon level if player exists
-	if current_player and is_instance_valid(current_player) and current_player.has_method("get") and "weapon_type" in current_player:
+	if current_player and is_instance_valid(current_player) and current_player.has_method("get") \
+			and "weapon_type" in current_player:
 		if not $UI/HUD.has_node("WeaponLabel"):
 			var weapon_label = Label.new()
 			weapon_label.name = "WeaponLabel"
 			weapon_label.add_theme_font_size_override("font_size", 24)
 			weapon_label.position = Vector2(10, 130)
 			$UI/HUD.add_child(weapon_label)
-		$UI/HUD/WeaponLabel.text = "Weapon: " + current_player.weapon_type.to_upper() + " LV" + str(current_player.weapon_level)
+		$UI/HUD/WeaponLabel.text = "Weapon: " + current_player.weapon_type.to_upper() \
+			+ " LV" + str(current_player.weapon_level)
 
@@ -30,11 +30,11 @@ func _on_area_entered(area):
 		# Only damage enemies that are visible on screen
 		if area.has_method("is_visible_for_damage") and area.is_visible_for_damage():
 			area.take_damage(damage)
-			call_deferred("queue_free")
+			NodePool.release(self)
 		elif not area.has_method("is_visible_for_damage"):
 			# Fallback for any enemies without the new method
 			area.take_damage(damage)
-			call_deferred("queue_free")
+			NodePool.release(self)
 
 func update_bullet_color():
 	# Change bullet color based on damage level
@@ -52,4 +52,4 @@ func update_bullet_color():
 			modulate = Color(0.2, 0.6, 1, 1)   # Blue (Level 20)
 
 func _on_screen_exited():
-	call_deferred("queue_free")
\ No newline at end of file
+	NodePool.release(self)
\ No newline at end of file
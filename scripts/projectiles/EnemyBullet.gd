@@ -50,7 +50,7 @@ func _process(delta):
 	position += direction * speed * delta
 
 func _on_screen_exited():
-	call_deferred("queue_free")
+	NodePool.release(self)
 
 func set_aimed_at_player(player_pos: Vector2):
 	# Calculate direction to player
@@ -110,7 +110,7 @@ func _process(delta):
 
 	lifetime += delta
 	if lifetime > max_lifetime:
-		call_deferred("queue_free")
+		NodePool.release(self)
 
 func update_pulsing_animation(delta):
 	# Create smooth pulsing effect using sine waves
@@ -172,25 +172,12 @@ func update_homing_target():
 
 	# Only find a target if we don't have one yet
 	if not target_enemy or not is_instance_valid(target_enemy):
-		var enemies = get_tree().get_nodes_in_group("enemies")
 		var best_enemy: Area2D = null
 		var best_score = INF
 
-		for enemy in enemies:
-			if not is_instance_valid(enemy) or enemy in hit_enemies:
-				continue
-
-			# ONLY target visible enemies - skip offscreen entirely
-			var is_visible = true
-			if enemy.has_method("is_visible_for_damage"):
-				is_visible = enemy.is_visible_for_damage()
-
-			if not is_visible:
-				continue  # Skip offscreen enemies completely
-
+		# Only enemies within homing range, from EnemyManager's spatial index
+		for enemy in EnemyManager.get_enemies_in_radius(global_position, homing_range, can_target):
 			var distance = global_position.distance_to(enemy.global_position)
-			if distance > homing_range:
-				continue
 
 			# Score based on distance and angle (prefer enemies ahead)
 			var to_enemy = (enemy.global_position - global_position).normalized()
@@ -208,6 +195,14 @@ func update_homing_target():
 
 		target_enemy = best_enemy
 
+func can_target(enemy: Area2D) -> bool:
+	"""Enemies not hit yet that are visible on screen (offscreen ones are skipped entirely)"""
+	if enemy in hit_enemies:
+		return false
+	if enemy.has_method("is_visible_for_damage"):
+		return enemy.is_visible_for_damage()
+	return true
+
 func _on_area_entered(area):
 	if area.is_in_group("enemies") and not area in hit_enemies:
 		# Only damage enemies that are visible on screen
@@ -228,7 +223,7 @@ func _on_area_entered(area):
 			chain_lightning(area.global_position, chains_remaining)
 
 			# Destroy the projectile after first hit
-			call_deferred("queue_free")
+			NodePool.release(self)
 
 func chain_lightning(from_position: Vector2, chains_remaining: int):
 	if chains_remaining <= 0:
@@ -259,28 +254,8 @@ func chain_lightning(from_position: Vector2, chains_remaining: int):
 			chain_lightning(nearest_enemy.global_position, chains_remaining - 1)
 
 func find_nearest_enemy(from_pos: Vector2, max_range: float) -> Area2D:
-	var enemies = get_tree().get_nodes_in_group("enemies")
-	var nearest_enemy: Area2D = null
-	var nearest_distance = max_range
-
-	for enemy in enemies:
-		if not is_instance_valid(enemy) or enemy in hit_enemies:
-			continue
-
-		# ONLY consider visible enemies for chaining
-		var is_visible = true
-		if enemy.has_method("is_visible_for_damage"):
-			is_visible = enemy.is_visible_for_damage()
-
-		if not is_visible:
-			continue  # Skip offscreen enemies completely
-
-		var distance = from_pos.distance_to(enemy.global_position)
-		if distance < nearest_distance:
-			nearest_enemy = enemy
-			nearest_distance = distance
-
-	return nearest_enemy
+	# ONLY consider visible enemies for chaining
+	return EnemyManager.find_nearest_enemy(from_pos, max_range, can_target)
 
 func create_lightning_arc(start_pos: Vector2, end_pos: Vector2):
 	# Find the game scene to add effects to
@@ -359,5 +334,11 @@ func create_impact_effect(impact_pos: Vector2):
 	# Auto cleanup - use efficient timer
 	get_tree().create_timer(0.3).timeout.connect(flash.queue_free)
 
+func reset_for_pool():
+	# Trail points and particles would otherwise reappear at the old position
+	$FluidTrail.clear_points()
+	$FluidTrail2.clear_points()
+	$EnergyParticles.restart()
+
 func _on_screen_exited():
-	call_deferred("queue_free")
\ No newline at end of file
+	NodePool.release(self)
\ No newline at end of file
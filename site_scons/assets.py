@@ -5,37 +5,93 @@ Asset validation, optimization, and processing pipeline
 """
 
 import os
+import re
 import json
+import gzip
+import struct
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from SCons.Script import *
 
 # Import the environment
 Import('env')
 
+# NumPy is optional: without it the audio bank is skipped and the game synthesizes at runtime
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Read size used when streaming assets through the hash function
+ASSET_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Baked audio bank layout, read by SynthSoundManager.load_audio_bank()
+AUDIO_BANK_MAGIC = b'CSB1'
+AUDIO_BANK_VERSION = 1
+AUDIO_SAMPLE_RATE = 44100
+
+# Noise seeds baked for every sound that uses noise (variants are picked at random on playback)
+AUDIO_BANK_SEEDS = [0, 1, 2, 3]
+
+# Mirrors SynthSoundManager.generate_sound(): name -> (renderer, arguments, uses noise)
+AUDIO_BANK_SOUNDS = {
+    'shoot': ('laser_shot', (0.05, 800, 400), True),
+    'laser': ('laser_shot', (0.1, 400, 200, True), True),
+    'enemy_hit': ('hit_sound', (0.05,), True),
+    'enemy_destroy': ('explosion', (0.3,), True),
+    'player_hit': ('alarm_sound', (0.2,), False),
+    'powerup': ('powerup_sound', (0.2,), False),
+    'bomb': ('big_explosion', (0.5,), True),
+    'wave_start': ('fanfare', (0.5,), False),
+    'menu_navigate': ('menu_navigate_sound', (), False),
+    'menu_hover': ('menu_hover_sound', (), False),
+    'menu_select': ('menu_select_sound', (), False),
+    'menu_back': ('menu_back_sound', (), False),
+    'menu_music': ('menu_music_loop', (), False),
+}
+
+# Sounds baked with a forward loop over the whole clip
+AUDIO_BANK_LOOPED = ['menu_music']
+
+# EnemyTypeData resources compiled into the spawn table read by EnemyManager
+ENEMY_TYPES_DIR = 'resources/enemies'
+ENEMY_TYPE_SCRIPT = 'res://scripts/enemies/EnemyTypeData.gd'
+SPAWN_TABLE_SCRIPT = 'res://scripts/enemies/EnemySpawnTable.gd'
+
+# spawn_weight is turned into integer tickets, as EnemySpawnTable.WEIGHT_SCALE does
+SPAWN_WEIGHT_SCALE = 10
+
+TRES_PROPERTY = re.compile(r'^(\w+) = (.*)$')
+
 def setup_asset_processing(env):
     """Setup asset processing tools and functions"""
 
+    # Add asset-specific builders to environment
+    env['BUILDERS']['ProcessAllAssets'] = Builder(action=Action(process_all_assets_action, None))
+
     # Add asset-specific build functions to environment
     env.AddMethod(validate_all_assets, "ValidateAllAssets")
-    env.AddMethod(process_all_assets, "ProcessAllAssets")
     env.AddMethod(check_asset_integrity, "CheckAssetIntegrity")
+    env.AddMethod(asset_changes, "AssetChanges")
     env.AddMethod(optimize_assets, "OptimizeAssets")
+    env.AddMethod(bake_audio_bank, "BakeAudioBank")
+    env.AddMethod(compile_spawn_table, "CompileSpawnTable")
+    env.AddMethod(load_enemy_spawn_data, "LoadEnemySpawnData")
 
 def validate_all_assets(env):
     """Validate all project assets for integrity and compliance"""
     print("🔍 Validating all project assets...")
 
-    assets_dir = env['ASSETS_DIR']
-    scripts_dir = env['SCRIPTS_DIR']
-    scenes_dir = env['SCENES_DIR']
-
-    validation_results = {
-        'assets': validate_asset_directory(str(assets_dir)),
-        'scripts': validate_scripts_directory(str(scripts_dir)),
-        'scenes': validate_scenes_directory(str(scenes_dir)),
-        'audio': validate_audio_system(env)
-    }
+    validation_results = {}
+    for category, validator in (('assets', validate_asset_directory),
+                                ('scripts', validate_scripts_directory),
+                                ('scenes', validate_scenes_directory),
+                                ('audio', validate_audio_system),
+                                ('enemies', validate_enemy_directory)):
+        with env.TraceSpan(f"assets: {category}", 'validation') as span_args:
+            validation_results[category] = validator(env)
+            span_args['issues'] = len(validation_results[category])
 
     # Print validation summary
     total_issues = sum(len(issues) for issues in validation_results.values())
@@ -52,94 +108,78 @@ def validate_all_assets(env):
                     print(f"    - {issue}")
         return 1
 
-def validate_asset_directory(assets_path):
+def validate_asset_directory(env):
     """Validate assets directory structure and contents"""
     issues = []
 
-    if not os.path.exists(assets_path):
+    asset_files = env.ProjectFiles('assets')
+    if not asset_files:
         issues.append("Assets directory not found")
         return issues
 
     # Check for common asset types and organization
     expected_subdirs = ['textures', 'audio', 'fonts']
     for subdir in expected_subdirs:
-        subdir_path = os.path.join(assets_path, subdir)
-        if not os.path.exists(subdir_path):
+        if not any(path.startswith(f"assets/{subdir}/") for path in asset_files):
             issues.append(f"Expected asset subdirectory not found: {subdir}")
 
     return issues
 
-def validate_scripts_directory(scripts_path):
+def validate_scripts_directory(env):
     """Validate GDScript files for syntax and organization"""
     issues = []
 
-    if not os.path.exists(scripts_path):
+    # Find all GDScript files
+    gdscript_files = env.ProjectFiles('scripts', '.gd')
+    if not gdscript_files:
         issues.append("Scripts directory not found")
         return issues
 
-    # Find all GDScript files
-    gdscript_files = []
-    for root, dirs, files in os.walk(scripts_path):
-        for file in files:
-            if file.endswith('.gd'):
-                gdscript_files.append(os.path.join(root, file))
-
     # Basic GDScript validation
     for script_file in gdscript_files:
-        script_issues = validate_gdscript_file(script_file)
-        issues.extend(script_issues)
+        try:
+            lines = env.ProjectFileLines(script_file)
+        except OSError as e:
+            issues.append(f"Failed to read script {script_file}: {e}")
+            continue
+        issues.extend(validate_gdscript_file(script_file, lines))
 
     return issues
 
-def validate_gdscript_file(script_path):
-    """Validate individual GDScript file"""
+def validate_gdscript_file(script_path, lines):
+    """Validate individual GDScript file from its cached lines"""
     issues = []
 
-    try:
-        with open(script_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Basic syntax checks
-        lines = content.split('\n')
-        for i, line in enumerate(lines):
-            line_num = i + 1
+    # Basic syntax checks
+    for i, line in enumerate(lines):
+        line_num = i + 1
 
-            # Check for common issues
-            if line.strip().startswith('print(') and 'TODO' not in line.upper():
-                # Allow prints with TODO comments during development
-                if not any(keyword in line.upper() for keyword in ['DEBUG', 'TEST', 'TEMP']):
-                    issues.append(f"{script_path}:{line_num} - Consider removing debug print statement")
+        # Check for common issues
+        if line.strip().startswith('print(') and 'TODO' not in line.upper():
+            # Allow prints with TODO comments during development
+            if not any(keyword in line.upper() for keyword in ['DEBUG', 'TEST', 'TEMP']):
+                issues.append(f"{script_path}:{line_num} - Consider removing debug print statement")
 
-            # Check for proper extends declarations
-            if line.strip().startswith('extends') and not line.strip().endswith(('Node', 'Node2D', 'Area2D', 'Control', 'Resource')):
-                # This is just a basic check - could be enhanced
-                pass
-
-    except Exception as e:
-        issues.append(f"Failed to read script {script_path}: {e}")
+        # Check for proper extends declarations
+        if line.strip().startswith('extends') and not line.strip().endswith(('Node', 'Node2D', 'Area2D', 'Control', 'Resource')):
+            # This is just a basic check - could be enhanced
+            pass
 
     return issues
 
-def validate_scenes_directory(scenes_path):
+def validate_scenes_directory(env):
     """Validate scene files and structure"""
     issues = []
 
-    if not os.path.exists(scenes_path):
+    scene_files = env.ProjectFiles('scenes', '.tscn')
+    if not scene_files:
         issues.append("Scenes directory not found")
         return issues
 
-    # Find all scene files
-    scene_files = []
-    for root, dirs, files in os.walk(scenes_path):
-        for file in files:
-            if file.endswith('.tscn'):
-                scene_files.append(os.path.join(root, file))
-
     # Check for essential scenes
     essential_scenes = ['main/Main.tscn', 'main/Game.tscn', 'player/Player.tscn']
     for scene in essential_scenes:
-        scene_path = os.path.join(scenes_path, scene)
-        if not os.path.exists(scene_path):
+        if f"scenes/{scene}" not in scene_files:
             issues.append(f"Essential scene not found: {scene}")
 
     return issues
@@ -149,75 +189,561 @@ def validate_audio_system(env):
     issues = []
 
     # Check for SynthSoundManager autoload
-    sound_manager_path = os.path.join(str(env['SCRIPTS_DIR']), 'autoloads', 'SynthSoundManager.gd')
-    if not os.path.exists(sound_manager_path):
-        issues.append("SynthSoundManager.gd not found - procedural audio system missing")
-    else:
-        # Validate SynthSoundManager content
-        try:
-            with open(sound_manager_path, 'r') as f:
-                content = f.read()
-
-            # Check for essential functions
-            required_functions = ['generate_sound', 'play_sound', 'create_laser_shot', 'create_explosion']
-            for func in required_functions:
-                if f"func {func}" not in content:
-                    issues.append(f"SynthSoundManager missing function: {func}")
-
-        except Exception as e:
+    sound_manager_path = 'scripts/autoloads/SynthSoundManager.gd'
+    try:
+        content = '\n'.join(env.ProjectFileLines(sound_manager_path))
+    except OSError as e:
+        if sound_manager_path in env.ProjectIndex()['files']:
             issues.append(f"Failed to validate SynthSoundManager: {e}")
+        else:
+            issues.append("SynthSoundManager.gd not found - procedural audio system missing")
+        return issues
+
+    # Check for essential functions
+    required_functions = ['generate_sound', 'play_sound', 'create_laser_shot', 'create_explosion']
+    for func in required_functions:
+        if f"func {func}" not in content:
+            issues.append(f"SynthSoundManager missing function: {func}")
 
     return issues
 
-def process_all_assets(env):
-    """Process and optimize all project assets"""
+def validate_enemy_directory(env):
+    """Validate the EnemyTypeData resources that make up the spawn table"""
+    return validate_enemy_types(parse_enemy_types(env))
+
+def process_all_assets_action(target, source, env):
+    """Builder action: write the asset manifest (first target) and any generated assets after it"""
     print("🎨 Processing all project assets...")
 
-    # For now, this is a placeholder for future asset processing
-    # In a full implementation, this would:
+    # In a full implementation, this would also:
     # - Compress textures
-    # - Optimize audio files
     # - Validate scene files
-    # - Generate asset manifests
     # - Create optimized variants
 
-    print("✅ Asset processing completed (placeholder)")
+    project_root = str(env['PROJECT_DIR'].abspath)
+    manifest = {}
+    for node in source:
+        relative_path = os.path.relpath(node.abspath, project_root).replace(os.sep, '/')
+        manifest[relative_path] = {
+            'size': node.get_size(),
+            'checksum': node.get_csig()
+        }
+
+    manifest_path = target[0].abspath
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+
+    try:
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        print(f"✅ Asset processing completed - {len(manifest)} files in manifest")
+    except Exception as e:
+        print(f"❌ Failed to write asset manifest: {e}")
+        return 1
+
+    # Generated project files, keyed by path
+    generators = {
+        env['AUDIO_BANK'].abspath: bake_audio_bank,
+        env['SPAWN_TABLE'].abspath: compile_spawn_table
+    }
+    for node in target[1:]:
+        if generators[node.abspath](env, node.abspath) != 0:
+            return 1
+    return 0
+
+def parse_tres_properties(lines):
+    """Raw `key = value` strings from the [resource] section of a text resource
+
+    Values are kept as Godot text so they can be copied into another resource
+    verbatim; values spanning several lines are joined back together.
+    """
+    properties = {}
+    key = None
+    in_resource = False
+    for line in lines:
+        if line.startswith('['):
+            in_resource = line.strip() == '[resource]'
+            key = None
+            continue
+        if not in_resource:
+            continue
+        match = TRES_PROPERTY.match(line)
+        if match:
+            key = match.group(1)
+            properties[key] = match.group(2)
+        elif key and line.strip():
+            properties[key] += '\n' + line
+    return properties
+
+def parse_enemy_types(env):
+    """EnemyTypeData resources in resources/enemies, keyed by type name (file stem)"""
+    enemy_types = {}
+    for relative_path in env.ProjectFiles(ENEMY_TYPES_DIR, '.tres'):
+        try:
+            lines = env.ProjectFileLines(relative_path)
+        except OSError as e:
+            print(f"⚠️  Failed to read {relative_path}: {e}")
+            continue
+        if not lines or 'script_class="EnemyTypeData"' not in lines[0]:
+            continue
+
+        properties = parse_tres_properties(lines)
+        enemy_types[os.path.splitext(os.path.basename(relative_path))[0]] = {
+            'path': relative_path,
+            'properties': properties,
+            # Defaults match EnemyTypeData.gd for properties left out of the file
+            'spawn_weight': properties.get('spawn_weight', '1.0'),
+            'min_wave': properties.get('min_wave', '1'),
+            'spawns_enemies': properties.get('spawns_enemies', 'false') == 'true',
+            'spawned_enemy_type': properties.get('spawned_enemy_type', '""').strip('"')
+        }
+    return enemy_types
+
+def validate_enemy_types(enemy_types):
+    """Issues that would break spawning; converts spawn_weight/min_wave to numbers in place"""
+    issues = []
+    if not enemy_types:
+        issues.append(f"No EnemyTypeData resources found in {ENEMY_TYPES_DIR}")
+
+    for type_name, enemy_type in sorted(enemy_types.items()):
+        path = enemy_type['path']
+        try:
+            enemy_type['spawn_weight'] = float(enemy_type['spawn_weight'])
+            if int(enemy_type['spawn_weight'] * SPAWN_WEIGHT_SCALE) <= 0:
+                issues.append(f"{path}: spawn_weight {enemy_type['spawn_weight']} gives no spawn tickets "
+                              f"(minimum {1 / SPAWN_WEIGHT_SCALE})")
+        except ValueError:
+            issues.append(f"{path}: spawn_weight is not a number: {enemy_type['spawn_weight']}")
+        try:
+            enemy_type['min_wave'] = int(enemy_type['min_wave'])
+            if enemy_type['min_wave'] < 1:
+                issues.append(f"{path}: min_wave must be at least 1, got {enemy_type['min_wave']}")
+        except ValueError:
+            issues.append(f"{path}: min_wave is not an integer: {enemy_type['min_wave']}")
+
+        spawned = enemy_type['spawned_enemy_type']
+        if enemy_type['spawns_enemies'] and not spawned:
+            issues.append(f"{path}: spawns_enemies is set but spawned_enemy_type is empty")
+        elif spawned and spawned not in enemy_types:
+            issues.append(f"{path}: spawned_enemy_type '{spawned}' is not an enemy type "
+                          f"(known: {', '.join(sorted(enemy_types))})")
+
+    if enemy_types and not any(isinstance(t['min_wave'], int) and t['min_wave'] == 1 for t in enemy_types.values()):
+        issues.append("No enemy type can spawn on wave 1")
+    return issues
+
+def build_spawn_bands(enemy_types):
+    """Per-wave-band cumulative spawn tickets, mirroring EnemySpawnTable.from_enemy_types()
+
+    A band starts at every distinct min_wave and lasts until the next one.
+    Returns [(start_wave, [(type_name, cumulative_tickets), ...]), ...].
+    """
+    bands = []
+    for start_wave in sorted({t['min_wave'] for t in enemy_types.values()}):
+        entries = []
+        total = 0
+        for type_name in sorted(enemy_types):
+            enemy_type = enemy_types[type_name]
+            tickets = int(enemy_type['spawn_weight'] * SPAWN_WEIGHT_SCALE)
+            if enemy_type['min_wave'] <= start_wave and tickets > 0:
+                total += tickets
+                entries.append((type_name, total))
+        bands.append((start_wave, entries))
+    return bands
+
+def load_enemy_spawn_data(env):
+    """(enemy_types, spawn bands, issues) as compiled into the spawn table"""
+    enemy_types = parse_enemy_types(env)
+    issues = validate_enemy_types(enemy_types)
+    return enemy_types, ([] if issues else build_spawn_bands(enemy_types)), issues
+
+def compile_spawn_table(env, table_path):
+    """Validate the enemy types and write them, with their spawn bands, as one EnemySpawnTable resource"""
+    enemy_types, bands, issues = load_enemy_spawn_data(env)
+    if issues:
+        print(f"❌ Enemy type validation failed with {len(issues)} issues:")
+        for issue in issues:
+            print(f"    - {issue}")
+        return 1
+
+    band_offsets = [0]
+    entry_types = []
+    entry_cumulative = []
+    for start_wave, entries in bands:
+        entry_types.extend(type_name for type_name, cumulative in entries)
+        entry_cumulative.extend(cumulative for type_name, cumulative in entries)
+        band_offsets.append(len(entry_types))
+
+    def packed(kind, values):
+        return f"{kind}({', '.join(str(value) for value in values)})"
+
+    lines = [
+        f'[gd_resource type="Resource" script_class="EnemySpawnTable" load_steps={len(enemy_types) + 3} format=3]',
+        '',
+        f'[ext_resource type="Script" path="{SPAWN_TABLE_SCRIPT}" id="1_table"]',
+        f'[ext_resource type="Script" path="{ENEMY_TYPE_SCRIPT}" id="2_type"]',
+        ''
+    ]
+    for type_name in sorted(enemy_types):
+        lines.append(f'[sub_resource type="Resource" id="EnemyTypeData_{type_name}"]')
+        lines.append('script = ExtResource("2_type")')
+        for key, value in enemy_types[type_name]['properties'].items():
+            if key != 'script':
+                lines.append(f"{key} = {value}")
+        lines.append('')
+    lines.append('[resource]')
+    lines.append('script = ExtResource("1_table")')
+    lines.append('enemy_types = {')
+    lines.append(',\n'.join(f'"{type_name}": SubResource("EnemyTypeData_{type_name}")'
+                            for type_name in sorted(enemy_types)))
+    lines.append('}')
+    lines.append(f"band_start_waves = {packed('PackedInt32Array', [start for start, entries in bands])}")
+    lines.append(f"band_offsets = {packed('PackedInt32Array', band_offsets)}")
+    lines.append(f"entry_types = {packed('PackedStringArray', [json.dumps(name) for name in entry_types])}")
+    lines.append(f"entry_cumulative = {packed('PackedInt32Array', entry_cumulative)}")
+
+    try:
+        os.makedirs(os.path.dirname(table_path), exist_ok=True)
+        with open(table_path, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+    except OSError as e:
+        print(f"❌ Failed to write spawn table: {e}")
+        return 1
+
+    print(f"👾 Spawn table compiled - {len(enemy_types)} enemy types in {len(bands)} wave bands")
+    return 0
+
+# NumPy ports of the SynthSoundManager generators. Each keeps the GDScript
+# operation order so the float64 results round to the same 16-bit samples
+# (test/unit/test_audio_bank.gd checks the baked bank against the GDScript).
+
+def synth_noise(seed, channel, indices):
+    """Uniform [0, 1) noise per sample; same hash as SynthSoundManager.noise()"""
+    x = ((indices.astype(np.uint64) << np.uint64(2)) | np.uint64(channel))
+    x = (x + np.uint64((seed & 0x7FFFFFFF) * 0x9E3779B1)) & np.uint64(0xFFFFFFFF)
+    x ^= x >> np.uint64(16)
+    x = (x * np.uint64(0x7FEB352D)) & np.uint64(0xFFFFFFFF)
+    x ^= x >> np.uint64(15)
+    x = (x * np.uint64(0x31848BAB)) & np.uint64(0xFFFFFFFF)
+    x ^= x >> np.uint64(16)
+    return x.astype(np.float64) / 4294967296.0
+
+def synth_timeline(duration):
+    """Sample indices, times and 0..1 progress for a clip of the given duration"""
+    num_samples = int(duration * AUDIO_SAMPLE_RATE)
+    i = np.arange(num_samples)
+    t = i.astype(np.float64) / float(AUDIO_SAMPLE_RATE)
+    progress = i.astype(np.float64) / num_samples
+    return i, t, progress
+
+def synth_lerp(start, end, weight):
+    """Godot's lerp()"""
+    return start + (end - start) * weight
+
+def render_laser_shot(seed, duration, start_freq, end_freq, with_reverb=False):
+    """Port of create_laser_shot()"""
+    i, t, progress = synth_timeline(duration)
+    freq = synth_lerp(float(start_freq), float(end_freq), progress)
+
+    sample = np.sin(2.0 * np.pi * freq * t) * 0.3
+    sample += (np.fmod(freq * t, 1.0) - 0.5) * 0.3
+    sample += np.sign(np.sin(2.0 * np.pi * freq * t)) * 0.2
+    sample += (synth_noise(seed, 0, i) - 0.5) * 0.1 * (1.0 - progress)
+
+    envelope = np.where(progress < 0.01, progress * 100, 1.0 - progress)
+    sample *= envelope
+
+    if with_reverb:
+        tail = np.sin(2.0 * np.pi * freq * 0.5 * t) * 0.1 * (1.0 - progress)
+        sample += np.where(progress > 0.5, tail, 0.0)
+    return sample
+
+def render_hit_sound(seed, duration):
+    """Port of create_hit_sound()"""
+    i, t, progress = synth_timeline(duration)
+    sample = synth_noise(seed, 0, i) - 0.5
+    sample += np.sin(2.0 * np.pi * (200 + progress * 100) * t) * 0.3
+    sample *= np.power(1.0 - progress, 2.0)
+    return sample
+
+def render_explosion(seed, duration):
+    """Port of create_explosion()"""
+    i, t, progress = synth_timeline(duration)
+    noise = synth_noise(seed, 0, i) - 0.5
+    sample = np.where(i == 0, noise, noise * 0.1)
+    sample += np.sin(2.0 * np.pi * (50 - progress * 30) * t) * 0.5
+    sample += np.sin(2.0 * np.pi * (100 - progress * 70) * t) * 0.3
+    crack = (synth_noise(seed, 1, i) - 0.5) * (1.0 - progress * 20)
+    sample += np.where(progress < 0.05, crack, 0.0)
+    sample *= np.power(1.0 - progress, 1.5)
+    return sample
+
+def render_big_explosion(seed, duration):
+    """Port of create_big_explosion()"""
+    i, t, progress = synth_timeline(duration)
+    blast = (synth_noise(seed, 0, i) - 0.5) * (1.0 - progress * 10)
+    sample = np.where(progress < 0.1, blast, 0.0)
+    sample += (synth_noise(seed, 1, i) - 0.5) * 0.3
+    sample += np.sin(2.0 * np.pi * (30 - progress * 20) * t) * 0.6
+    sample += np.sin(2.0 * np.pi * (60 - progress * 40) * t) * 0.4
+    sample += np.sin(2.0 * np.pi * (90 - progress * 60) * t) * 0.3
+    sweep = np.sin(2.0 * np.pi * (150 - progress * 400) * t) * 0.5
+    sample += np.where(progress < 0.3, sweep, 0.0)
+    sample *= np.power(1.0 - progress, 1.2)
+    return sample
+
+def render_alarm_sound(seed, duration):
+    """Port of create_alarm_sound()"""
+    i, t, progress = synth_timeline(duration)
+    freq = np.where(np.fmod(t * 8, 1.0) < 0.5, 800, 600)
+    sample = np.sign(np.sin(2.0 * np.pi * freq * t)) * 0.5
+    sample += np.sign(np.sin(2.0 * np.pi * freq * 2 * t)) * 0.2
+    sample *= np.where(progress > 0.8, 1.0 - (progress - 0.8) * 5, 1.0)
+    return sample
+
+def render_powerup_sound(seed, duration):
+    """Port of create_powerup_sound()"""
+    i, t, progress = synth_timeline(duration)
+    arp_step = (progress * 8).astype(np.int64) % 4
+    freq = 400 * np.power(1.25, arp_step + progress * 4)
+    sample = np.sin(2.0 * np.pi * freq * t) * 0.5
+    sample += np.sin(2.0 * np.pi * freq * 2 * t) * 0.2
+    sample += np.sin(2.0 * np.pi * freq * 3 * t) * 0.1
+    sample *= np.where(progress < 0.05, progress * 20, 1.0 - progress)
+    return sample
+
+def render_fanfare(seed, duration):
+    """Port of create_fanfare()"""
+    i, t, progress = synth_timeline(duration)
+    notes = np.array([261.63, 329.63, 392.00, 523.25])
+    freq = notes[np.minimum((progress * 4).astype(np.int64), len(notes) - 1)]
+    sample = np.sin(2.0 * np.pi * freq * t) * 0.4
+    sample += np.sin(2.0 * np.pi * freq * 2 * t) * 0.2
+    sample += np.sin(2.0 * np.pi * freq * 3 * t) * 0.1
+    sample += np.sin(2.0 * np.pi * freq * 0.5 * t) * 0.1
+    sample += np.sin(2.0 * np.pi * freq * 1.01 * t) * 0.1
+    sample *= np.where(progress < 0.02, progress * 50,
+                       np.where(progress > 0.8, 1.0 - (progress - 0.8) * 5, 1.0))
+    return sample
+
+def render_menu_navigate_sound(seed):
+    """Port of create_menu_navigate_sound()"""
+    i, t, progress = synth_timeline(0.08)
+    freq = synth_lerp(523.25, 659.25, progress)
+    sample = np.sin(2.0 * np.pi * freq * t) * 0.3
+    sample *= np.where(progress < 0.1, progress * 10,
+                       np.where(progress > 0.6, 1.0 - (progress - 0.6) * 2.5, 1.0))
+    return sample
+
+def render_menu_hover_sound(seed):
+    """Port of create_menu_hover_sound()"""
+    i, t, progress = synth_timeline(0.05)
+    sample = np.sin(2.0 * np.pi * 783.99 * t) * 0.15
+    sample *= np.where(progress < 0.05, progress * 20, 1.0 - progress)
+    return sample
+
+def render_menu_select_sound(seed):
+    """Port of create_menu_select_sound()"""
+    i, t, progress = synth_timeline(0.15)
+    chord_progress = progress * 2.0
+    freq = np.where(chord_progress < 1.0, synth_lerp(392.00, 523.25, chord_progress),
+                    synth_lerp(523.25, 659.25, chord_progress - 1.0))
+    sample = np.sin(2.0 * np.pi * freq * t) * 0.4
+    sample += np.sin(2.0 * np.pi * freq * 2 * t) * 0.15
+    sample += np.sin(2.0 * np.pi * freq * 1.5 * t) * 0.1
+    sample *= np.where(progress < 0.02, progress * 50,
+                       np.where(progress > 0.7, 1.0 - (progress - 0.7) * 3.33, 1.0))
+    return sample
+
+def render_menu_back_sound(seed):
+    """Port of create_menu_back_sound()"""
+    i, t, progress = synth_timeline(0.12)
+    freq = synth_lerp(659.25, 523.25, progress)
+    sample = np.sin(2.0 * np.pi * freq * t) * 0.25
+    sample += np.sin(2.0 * np.pi * freq * 0.995 * t) * 0.15
+    sample *= np.where(progress < 0.05, progress * 20, 1.0 - progress)
+    return sample
+
+def render_menu_music_loop(seed):
+    """Port of create_menu_music_loop()"""
+    i, t, progress = synth_timeline(8.0)
+    chord_notes = np.array([
+        [220.00, 261.63, 329.63],
+        [174.61, 220.00, 261.63],
+        [130.81, 164.81, 196.00],
+        [123.47, 155.56, 196.00]
+    ])
+    chord = chord_notes[(progress * 4).astype(np.int64) % 4]
+    chord_progress = np.fmod(progress * 4, 1.0)
+
+    sample = np.zeros(len(t))
+    for note in range(chord.shape[1]):
+        note_freq = chord[:, note]
+        note_sample = np.sin(2.0 * np.pi * note_freq * t) * 0.08
+        note_sample += np.sin(2.0 * np.pi * note_freq * 1.002 * t) * 0.05
+        sample += note_sample
+    sample += np.sin(2.0 * np.pi * chord[:, 0] * 0.5 * t) * 0.04
+
+    chord_envelope = np.where(chord_progress < 0.1, chord_progress * 10,
+                              np.where(chord_progress > 0.9, 1.0 - (chord_progress - 0.9) * 10, 1.0))
+    loop_envelope = np.where(progress < 0.01, progress * 80,
+                             np.where(progress > 0.99, 1.0 - (progress - 0.99) * 80, 0.8))
+    sample *= chord_envelope * loop_envelope
+    return sample
+
+def render_pcm16(samples):
+    """Quantize like the GDScript: int(clamp(sample * 32767, -32768, 32767)), little-endian"""
+    return np.trunc(np.clip(samples * 32767, -32768, 32767)).astype('<i2').tobytes()
+
+def render_audio_bank():
+    """Render every baked sound variant; returns [(name, seed, looped, pcm16 bytes)]"""
+    entries = []
+    for name, (renderer, arguments, uses_noise) in AUDIO_BANK_SOUNDS.items():
+        render = globals()[f"render_{renderer}"]
+        for seed in (AUDIO_BANK_SEEDS if uses_noise else [0]):
+            entries.append((name, seed, name in AUDIO_BANK_LOOPED, render_pcm16(render(seed, *arguments))))
+    return entries
+
+def bake_audio_bank(env, bank_path):
+    """Render the procedural sounds into the bank file SynthSoundManager loads at startup
+
+    Layout (little-endian): magic, version, sample rate, entry count and
+    uncompressed PCM size; one (name, seed, loop, offset, samples) record per
+    entry; then the gzip-compressed 16-bit mono PCM of all entries.
+    """
+    if np is None:
+        print("⚠️  NumPy not installed - skipping the audio bank (pip install numpy); "
+              "sounds will be synthesized at runtime")
+        # A bank left over from older formulas would no longer match the GDScript
+        if os.path.exists(bank_path):
+            os.remove(bank_path)
+        return 0
+
+    with env.TraceSpan('bake audio bank', 'assets') as span_args:
+        entries = render_audio_bank()
+
+        header = bytearray()
+        payload = bytearray()
+        for name, seed, looped, pcm in entries:
+            encoded_name = name.encode('utf-8')
+            header += struct.pack('<B', len(encoded_name)) + encoded_name
+            header += struct.pack('<IBII', seed, int(looped), len(payload) // 2, len(pcm) // 2)
+            payload += pcm
+        compressed = gzip.compress(bytes(payload), compresslevel=9, mtime=0)
+        span_args.update(entries=len(entries), pcm_bytes=len(payload), bank_bytes=len(compressed))
+
+    try:
+        os.makedirs(os.path.dirname(bank_path), exist_ok=True)
+        with open(bank_path, 'wb') as f:
+            f.write(AUDIO_BANK_MAGIC)
+            f.write(struct.pack('<IIII', AUDIO_BANK_VERSION, AUDIO_SAMPLE_RATE, len(entries), len(payload)))
+            f.write(header)
+            f.write(compressed)
+    except OSError as e:
+        print(f"❌ Failed to write audio bank: {e}")
+        return 1
+
+    print(f"🔊 Audio bank baked - {len(AUDIO_BANK_SOUNDS)} sounds in {len(entries)} variants, "
+          f"{len(payload) / 1024:.0f} KB PCM "
+          f"-> {os.path.getsize(bank_path) / 1024:.0f} KB")
     return 0
 
+def hash_asset_file(file_path):
+    """Stream a file through BLAKE2b in fixed-size chunks"""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(ASSET_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_asset_manifest(manifest_path):
+    """Load the previous checksum manifest; entries from older formats are ignored"""
+    try:
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {path: entry for path, entry in manifest.items() if isinstance(entry, dict)}
+
 def check_asset_integrity(env):
-    """Check asset integrity using checksums"""
-    print("🔐 Checking asset integrity...")
+    """Check asset integrity using checksums
 
-    # Generate checksums for critical assets
-    assets_dir = str(env['ASSETS_DIR'])
-    checksums = {}
+    Files whose (size, mtime, inode) match the previous manifest keep their
+    recorded checksum; only new or touched files are hashed, in parallel.
+    The added/removed/modified diff is written next to the manifest and is
+    available to downstream steps through env.AssetChanges().
+    """
+    print("🔐 Checking asset integrity...")
 
-    if os.path.exists(assets_dir):
-        for root, dirs, files in os.walk(assets_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
+    project_path = str(env['PROJECT_DIR'].abspath)
+    checksums_path = os.path.join(str(env['TEMP_DIR']), 'asset_checksums.json')
+    previous = load_asset_manifest(checksums_path)
+
+    with env.TraceSpan('asset integrity', 'validation') as span_args:
+        # Reuse checksums for files whose stat signature is unchanged
+        checksums = {}
+        to_hash = []
+        for asset_path in env.ProjectFiles('assets'):
+            relative_path = os.path.relpath(asset_path, 'assets').replace(os.sep, '/')
+            file_path = os.path.join(project_path, asset_path)
+            try:
+                stat = os.stat(file_path)
+            except OSError as e:
+                print(f"⚠️  Failed to checksum {file_path}: {e}")
+                continue
+            entry = {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'inode': stat.st_ino}
+            cached = previous.get(relative_path)
+            if cached and all(cached.get(key) == value for key, value in entry.items()):
+                checksums[relative_path] = cached
+            else:
+                checksums[relative_path] = entry
+                to_hash.append((relative_path, file_path))
+
+        # Hash new and touched files in parallel; hashlib releases the GIL on large buffers
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as pool:
+            futures = {pool.submit(hash_asset_file, file_path): (relative_path, file_path)
+                       for relative_path, file_path in to_hash}
+            for future, (relative_path, file_path) in futures.items():
                 try:
-                    with open(file_path, 'rb') as f:
-                        content = f.read()
-                        checksum = hashlib.md5(content).hexdigest()
-                        relative_path = os.path.relpath(file_path, assets_dir)
-                        checksums[relative_path] = checksum
+                    checksums[relative_path]['checksum'] = future.result()
                 except Exception as e:
                     print(f"⚠️  Failed to checksum {file_path}: {e}")
+                    del checksums[relative_path]
+        span_args.update(assets=len(checksums), hashed=len(to_hash))
+
+    changes = {
+        'added': sorted(set(checksums) - set(previous)),
+        'removed': sorted(set(previous) - set(checksums)),
+        'modified': sorted(path for path in set(checksums) & set(previous)
+                           if checksums[path]['checksum'] != previous[path].get('checksum'))
+    }
 
-    # Save checksums for future validation
-    checksums_path = os.path.join(str(env['TEMP_DIR']), 'asset_checksums.json')
+    # Save checksums and the change report for future validation
+    changes_path = os.path.join(str(env['TEMP_DIR']), 'asset_changes.json')
     os.makedirs(os.path.dirname(checksums_path), exist_ok=True)
 
     try:
         with open(checksums_path, 'w') as f:
-            json.dump(checksums, f, indent=2)
-        print(f"✅ Asset integrity check completed - {len(checksums)} assets checked")
+            json.dump(checksums, f, indent=2, sort_keys=True)
+        with open(changes_path, 'w') as f:
+            json.dump(changes, f, indent=2)
+        print(f"✅ Asset integrity check completed - {len(checksums)} assets checked "
+              f"({len(to_hash)} hashed, {len(checksums) - len(to_hash)} reused)")
+        print(f"   {len(changes['added'])} added, {len(changes['removed'])} removed, "
+              f"{len(changes['modified'])} modified")
         return 0
     except Exception as e:
         print(f"❌ Failed to save asset checksums: {e}")
         return 1
 
+def asset_changes(env):
+    """Added/removed/modified asset paths from the last integrity check"""
+    changes_path = os.path.join(str(env['TEMP_DIR']), 'asset_changes.json')
+    try:
+        with open(changes_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'added': [], 'removed': [], 'modified': []}
+
 def optimize_assets(env):
     """Optimize assets for production builds"""
     print("⚡ Optimizing assets for production...")
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Bench Module - SCons Build System
+Headless gameplay frame-time benchmarks compared against a stored baseline
+"""
+
+import os
+import json
+import platform
+import statistics
+from SCons.Script import *
+
+# Import the environment
+Import('env')
+
+# SceneTree script that drives the Game scene (test/bench/BenchRunner.gd)
+BENCH_SCRIPT = 'res://test/bench/BenchRunner.gd'
+
+# Scenarios implemented by BenchRunner.gd
+BENCH_SCENARIOS = ['heavy_waves', 'bombs', 'vulcan_max', 'chain_max', 'enemy_queries']
+
+# Deterministic run parameters
+BENCH_SEED = 1337
+BENCH_FPS = 60
+BENCH_FRAMES = 1200
+BENCH_WARMUP = 120
+
+# A percentile regresses when it is this much slower than the baseline...
+REGRESSION_THRESHOLD = 0.15
+# ...and slower by at least this many milliseconds (timer noise floor)
+REGRESSION_MIN_MS = 0.5
+
+# Frame-time metrics and percentiles checked against the baseline
+COMPARED_METRICS = ['process_ms', 'physics_ms']
+COMPARED_PERCENTILES = ['p95', 'p99']
+
+# Per-frame nearest-enemy lookups timed both ways by the enemy_queries scenario (reported only)
+QUERY_METRICS = ['registry_query_ms', 'group_scan_ms']
+
+def setup_bench(env):
+    """Setup benchmark functions"""
+
+    env['BENCH_DIR'] = env['TEMP_DIR'].Dir('bench')
+    env['BENCH_BASELINE'] = env['PROJECT_DIR'].File('test/bench/baseline.json')
+
+    # Add benchmark functions to environment
+    env.AddMethod(run_benchmarks, "RunBenchmarks")
+    env.AddMethod(compare_bench_results, "CompareBenchResults")
+
+def percentile(sorted_samples, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_samples))))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+def summarize_bench_result(result):
+    """Reduce raw per-frame samples to percentiles, node counts and memory"""
+    samples = result['samples']
+    summary = {}
+    for metric in COMPARED_METRICS + [m for m in QUERY_METRICS if m in samples]:
+        values = sorted(samples[metric])
+        summary[metric] = {
+            'mean': round(statistics.fmean(values), 3) if values else 0.0,
+            'p50': round(percentile(values, 50), 3),
+            'p95': round(percentile(values, 95), 3),
+            'p99': round(percentile(values, 99), 3),
+            'max': round(values[-1], 3) if values else 0.0
+        }
+    summary['nodes'] = {
+        'max': max(samples['nodes'], default=0),
+        'final': samples['nodes'][-1] if samples['nodes'] else 0
+    }
+    summary['static_memory_mb'] = {
+        'max': round(max(samples['static_memory_mb'], default=0.0), 1),
+        'final': round(samples['static_memory_mb'][-1], 1) if samples['static_memory_mb'] else 0.0
+    }
+    # SoundManager stream cache and voice pool counters over the measured frames
+    if result.get('audio'):
+        summary['audio'] = result['audio']
+    # EnemyManager registry counters over the measured frames
+    if result.get('registry'):
+        summary['registry'] = result['registry']
+    # NodePool reuse counters and high-water marks over the measured frames
+    if result.get('pools'):
+        summary['pools'] = result['pools']
+    return summary
+
+def compare_bench_results(env, current, baseline, threshold=REGRESSION_THRESHOLD):
+    """Return (scenario, metric, percentile, baseline_ms, current_ms) for each regression
+
+    Both arguments map scenario names to summaries from summarize_bench_result.
+    Scenarios missing from the baseline are skipped.
+    """
+    regressions = []
+    for scenario, summary in current.items():
+        reference = baseline.get(scenario)
+        if not reference:
+            continue
+        for metric in COMPARED_METRICS:
+            for pct in COMPARED_PERCENTILES:
+                before = reference.get(metric, {}).get(pct)
+                after = summary[metric][pct]
+                if before is None:
+                    continue
+                if after > before * (1.0 + threshold) and after - before >= REGRESSION_MIN_MS:
+                    regressions.append((scenario, metric, pct, before, after))
+    return regressions
+
+def run_bench_scenario(env, scenario):
+    """Run one scenario in a headless Godot at a fixed frame rate; returns the parsed result or None"""
+    bench_dir = str(env['BENCH_DIR'].abspath)
+    output_path = os.path.join(bench_dir, f"{scenario}.json")
+    log_path = os.path.join(bench_dir, f"{scenario}.log")
+    os.makedirs(bench_dir, exist_ok=True)
+    if os.path.exists(output_path):
+        os.remove(output_path)
+
+    cmd = [
+        env['GODOT_EXECUTABLE'],
+        '--path', str(env['PROJECT_DIR'].abspath),
+        '--headless',
+        '--fixed-fps', str(BENCH_FPS),
+        '-s', BENCH_SCRIPT,
+        '--',
+        f'--scenario={scenario}',
+        f'--frames={BENCH_FRAMES}',
+        f'--warmup={BENCH_WARMUP}',
+        f'--seed={BENCH_SEED}',
+        f'--output={output_path}'
+    ]
+
+    print(f"⏱️  Benchmarking {scenario}...")
+    result = env.RunGodotProcess(cmd, timeout=600, echo=False, log_path=log_path, span=f"bench {scenario}")
+    if result['returncode'] != 0:
+        print(f"❌ Benchmark {scenario} failed (log: {log_path})")
+        return None
+
+    try:
+        with open(output_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ Benchmark {scenario} produced no results: {e} (log: {log_path})")
+        return None
+
+def run_benchmarks(env, scenarios=None, update_baseline=False, threshold=REGRESSION_THRESHOLD):
+    """Run gameplay benchmarks and fail on p95/p99 frame-time regressions against the baseline"""
+    scenarios = scenarios or BENCH_SCENARIOS
+    unknown = [s for s in scenarios if s not in BENCH_SCENARIOS]
+    if unknown:
+        print(f"❌ Unknown benchmark scenarios: {', '.join(unknown)} (available: {', '.join(BENCH_SCENARIOS)})")
+        return 1
+
+    if env.GodotImportAssets() != 0:
+        print("❌ Cannot benchmark: asset import failed")
+        return 1
+
+    summaries = {}
+    for scenario in scenarios:
+        result = run_bench_scenario(env, scenario)
+        if result is None:
+            return 1
+        summaries[scenario] = summarize_bench_result(result)
+
+    summary_path = os.path.join(str(env['BENCH_DIR'].abspath), 'summary.json')
+    with open(summary_path, 'w') as f:
+        json.dump(summaries, f, indent=2)
+
+    baseline_path = str(env['BENCH_BASELINE'].abspath)
+    try:
+        with open(baseline_path, 'r') as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        baseline = {}
+    reference = baseline.get('scenarios', {})
+
+    print("\n📊 Benchmark Results (ms per frame):")
+    print("=" * 80)
+    print(f"  {'Scenario':<14} {'Metric':<11} {'p50':>7} {'p95':>7} {'p99':>7} {'base p95':>9} {'base p99':>9}")
+    for scenario, summary in summaries.items():
+        for metric in COMPARED_METRICS:
+            stats = summary[metric]
+            base = reference.get(scenario, {}).get(metric, {})
+            base_p95 = f"{base['p95']:.2f}" if 'p95' in base else '-'
+            base_p99 = f"{base['p99']:.2f}" if 'p99' in base else '-'
+            print(f"  {scenario:<14} {metric:<11} {stats['p50']:>7.2f} {stats['p95']:>7.2f} "
+                  f"{stats['p99']:>7.2f} {base_p95:>9} {base_p99:>9}")
+        print(f"  {'':<14} nodes max {summary['nodes']['max']}, "
+              f"static memory max {summary['static_memory_mb']['max']:.1f} MB")
+        if 'audio' in summary:
+            audio = summary['audio']
+            print(f"  {'':<14} audio: {audio.get('plays', 0)} plays, {audio.get('hit_rate', 0.0):.0%} stream hits, "
+                  f"{audio.get('evictions', 0)} evictions, peak {audio.get('peak_voices', 0)} voices, "
+                  f"{audio.get('voice_steals', 0)} steals")
+        if all(metric in summary for metric in QUERY_METRICS):
+            registry_p95 = summary['registry_query_ms']['p95']
+            scan_p95 = summary['group_scan_ms']['p95']
+            speedup = f"{scan_p95 / registry_p95:.1f}x" if registry_p95 > 0 else '-'
+            print(f"  {'':<14} nearest-enemy queries p95: registry {registry_p95:.3f} ms, "
+                  f"group scan {scan_p95:.3f} ms ({speedup})")
+        if 'registry' in summary:
+            registry = summary['registry']
+            queries = registry.get('queries', 0)
+            per_query = registry.get('candidates', 0) / queries if queries else 0.0
+            print(f"  {'':<14} registry: peak {registry.get('peak', 0)} enemies, {queries} queries, "
+                  f"{per_query:.1f} candidates/query, {registry.get('rebuilds', 0)} grid rebuilds")
+        for pool_key, pool in sorted(summary.get('pools', {}).items()):
+            print(f"  {'':<14} pool {pool_key}: {pool.get('reuse_rate', 0.0):.0%} reused, "
+                  f"high water {pool.get('high_water', 0)}, {pool.get('created', 0)} created, "
+                  f"{pool.get('discarded', 0)} discarded")
+    print("=" * 80)
+    print(f"📊 Summary: {summary_path}")
+
+    if update_baseline:
+        baseline = {
+            'meta': {
+                'godot_version': env.get('GODOT_VERSION', ''),
+                'machine': f"{platform.system()} {platform.machine()}",
+                'seed': BENCH_SEED,
+                'frames': BENCH_FRAMES,
+                'fps': BENCH_FPS
+            },
+            'scenarios': {**reference, **summaries}
+        }
+        os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+        with open(baseline_path, 'w') as f:
+            json.dump(baseline, f, indent=2)
+            f.write('\n')
+        print(f"✅ Baseline updated: {baseline_path}")
+        return 0
+
+    if not reference:
+        print("⚠️  No baseline yet - record one with: scons bench update_baseline=1")
+        return 0
+
+    meta = baseline.get('meta', {})
+    if meta.get('godot_version') and meta['godot_version'] != env.get('GODOT_VERSION', ''):
+        print(f"⚠️  Baseline was recorded with Godot {meta['godot_version']}")
+
+    regressions = compare_bench_results(env, summaries, reference, threshold)
+    if regressions:
+        print(f"❌ {len(regressions)} frame-time regressions beyond {threshold:.0%}:")
+        for scenario, metric, pct, before, after in regressions:
+            print(f"   {scenario} {metric} {pct}: {before:.2f}ms -> {after:.2f}ms (+{(after / before - 1) if before else 0:.0%})")
+        return 1
+
+    print(f"✅ No p95/p99 regressions beyond {threshold:.0%}")
+    return 0
+
+# Initialize benchmarks
+setup_bench(env)
+
+print("✅ Bench module loaded")
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Build Cache Module - SCons Build System
+Content-addressed artifact cache for Godot imports and exports (local directory or HTTP)
+"""
+
+import os
+import io
+import re
+import hashlib
+import tarfile
+import threading
+import urllib.error
+import urllib.request
+from SCons.Script import *
+
+# Import the environment
+Import('env')
+
+# Network timeout for the HTTP backend (seconds)
+HTTP_TIMEOUT = 60
+
+# Cache keys are hex digests prefixed with the artifact kind
+CACHE_KEY = re.compile(r'^[a-z]+-[0-9a-f]{40,64}$')
+
+def setup_build_cache(env):
+    """Setup build cache functions
+
+    The cache is opt-in: `cache=<directory>` or `cache=http://host:port` on the
+    command line, or the CONTINUUM_BUILD_CACHE environment variable.
+    """
+    env['BUILD_CACHE'] = ARGUMENTS.get('cache', os.environ.get('CONTINUUM_BUILD_CACHE', ''))
+
+    # Add build cache functions to environment
+    env.AddMethod(build_cache_key, "BuildCacheKey")
+    env.AddMethod(build_cache_restore, "BuildCacheRestore")
+    env.AddMethod(build_cache_save, "BuildCacheSave")
+
+def build_cache_key(env, kind, *parts):
+    """Derive a cache key from an artifact kind and its input identity"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode('utf-8'))
+        digest.update(b'\0')
+    return f"{kind}-{digest.hexdigest()}"
+
+def is_http_cache(location):
+    """True when the cache location is an HTTP(S) URL"""
+    return location.startswith(('http://', 'https://'))
+
+def fetch_blob(location, key):
+    """Return the archive bytes stored under `key`, or None on a miss"""
+    if is_http_cache(location):
+        try:
+            with urllib.request.urlopen(f"{location.rstrip('/')}/{key}.tar.gz", timeout=HTTP_TIMEOUT) as response:
+                return response.read()
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+
+    blob_path = os.path.join(location, key.split('-', 1)[1][:2], f"{key}.tar.gz")
+    try:
+        with open(blob_path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def store_blob(location, key, data):
+    """Upload or write an archive under `key`"""
+    if is_http_cache(location):
+        request = urllib.request.Request(f"{location.rstrip('/')}/{key}.tar.gz", data=data, method='PUT',
+                                         headers={'Content-Type': 'application/gzip'})
+        with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT):
+            return
+
+    blob_dir = os.path.join(location, key.split('-', 1)[1][:2])
+    os.makedirs(blob_dir, exist_ok=True)
+    temp_path = os.path.join(blob_dir, f".{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, os.path.join(blob_dir, f"{key}.tar.gz"))
+
+def build_cache_restore(env, key, dest_dir):
+    """Extract the cached artifact for `key` into dest_dir; returns True on a hit"""
+    location = env['BUILD_CACHE']
+    if not location:
+        return False
+
+    try:
+        data = fetch_blob(location, key)
+    except Exception as e:
+        print(f"⚠️  Build cache unavailable ({e}), continuing without it")
+        return False
+
+    if data is None:
+        print(f"🗃️  Build cache miss: {key[:20]}…")
+        return False
+
+    dest_root = os.path.realpath(dest_dir)
+    with tarfile.open(fileobj=io.BytesIO(data), mode='r:gz') as archive:
+        members = archive.getmembers()
+        for member in members:
+            target = os.path.realpath(os.path.join(dest_root, member.name))
+            if not target.startswith(dest_root + os.sep) or not (member.isfile() or member.isdir()):
+                print(f"⚠️  Ignoring corrupt build cache entry {key}")
+                return False
+        archive.extractall(dest_root, members=members)
+
+    print(f"🗃️  Build cache hit: {key[:20]}… ({len(data) / 1024:.0f} KiB)")
+    return True
+
+def build_cache_save(env, key, root_dir, relative_paths):
+    """Archive files (or whole directories) below root_dir and store them under `key`"""
+    location = env['BUILD_CACHE']
+    if not location or not CACHE_KEY.match(key):
+        return False
+
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w:gz') as archive:
+        for relative_path in sorted(relative_paths):
+            full_path = os.path.join(root_dir, relative_path)
+            if os.path.exists(full_path):
+                archive.add(full_path, arcname=relative_path)
+
+    try:
+        store_blob(location, key, buffer.getvalue())
+    except Exception as e:
+        print(f"⚠️  Could not upload to build cache ({e})")
+        return False
+
+    print(f"🗃️  Stored in build cache: {key[:20]}… ({buffer.tell() / 1024:.0f} KiB)")
+    return True
+
+# Initialize build cache
+setup_build_cache(env)
+
+print("✅ Build cache module loaded")
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Build Trace Module - SCons Build System
+Chrome trace-event spans for build steps when profiling=1 is given
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+from contextlib import contextmanager
+from SCons.Script import *
+
+# Import the environment
+Import('env')
+
+# Rows shown in the terminal summary
+SUMMARY_TOP = 10
+
+# Completed spans of this run and the open spans of each thread
+_spans = []
+_spans_lock = threading.Lock()
+_open_spans = threading.local()
+
+def setup_build_trace(env):
+    """Setup build trace functions
+
+    Tracing is always available as a no-op; profiling=1 turns recording on and
+    writes the trace when SCons exits.
+    """
+    env['BUILD_TRACE'] = env['TEMP_DIR'].File('build_trace.json')
+
+    # Add build trace functions to environment
+    env.AddMethod(trace_span, "TraceSpan")
+    env.AddMethod(add_trace_span, "AddTraceSpan")
+    env.AddMethod(rusage_summary, "RusageSummary")
+
+    if env['PROFILING']:
+        for name, category, start, end, args in env.get('STARTUP_SPANS', []):
+            add_trace_span(env, name, category, start, end, args)
+        atexit.register(write_build_trace, env)
+
+def rusage_summary(env, rusage):
+    """Child CPU time and peak RSS from a resource.struct_rusage (ru_maxrss is KiB on Linux, bytes on macOS)"""
+    rss_divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return {
+        'cpu_user_s': round(rusage.ru_utime, 3),
+        'cpu_system_s': round(rusage.ru_stime, 3),
+        'peak_rss_mb': round(rusage.ru_maxrss / rss_divisor, 1)
+    }
+
+def add_trace_span(env, name, category, start, end, args=None):
+    """Record a finished span; start and end are time.perf_counter() values"""
+    if not env['PROFILING']:
+        return
+    with _spans_lock:
+        _spans.append({
+            'name': name,
+            'cat': category,
+            'start': start,
+            'end': end,
+            'tid': threading.get_ident(),
+            'thread': threading.current_thread().name,
+            'args': dict(args or {})
+        })
+
+@contextmanager
+def trace_span(env, name, category='build', **args):
+    """Time the enclosed block as a span; yields its args dict for extra details
+
+    Child-process usage recorded on a span (cpu_user_s, cpu_system_s,
+    peak_rss_mb) is rolled up into the enclosing span on the same thread, so
+    an export or validation span reports the cost of the Godot runs inside it.
+    """
+    if not env['PROFILING']:
+        yield args
+        return
+
+    stack = getattr(_open_spans, 'stack', None)
+    if stack is None:
+        stack = _open_spans.stack = []
+    stack.append(args)
+    start = time.perf_counter()
+    try:
+        yield args
+    finally:
+        end = time.perf_counter()
+        stack.pop()
+        if stack:
+            parent = stack[-1]
+            for key in ('cpu_user_s', 'cpu_system_s'):
+                if key in args:
+                    parent[key] = round(parent.get(key, 0.0) + args[key], 3)
+            if 'peak_rss_mb' in args:
+                parent['peak_rss_mb'] = max(parent.get('peak_rss_mb', 0.0), args['peak_rss_mb'])
+        add_trace_span(env, name, category, start, end, args)
+
+def write_build_trace(env):
+    """Write the Chrome trace (chrome://tracing, Perfetto) and print the top costs"""
+    with _spans_lock:
+        spans = sorted(_spans, key=lambda span: span['start'])
+    if not spans:
+        return
+
+    origin = spans[0]['start']
+    pid = os.getpid()
+    thread_ids = {}
+    events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': 'scons'}}]
+    for span in spans:
+        if span['tid'] not in thread_ids:
+            thread_ids[span['tid']] = len(thread_ids)
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': thread_ids[span['tid']],
+                           'args': {'name': span['thread']}})
+        events.append({
+            'name': span['name'],
+            'cat': span['cat'],
+            'ph': 'X',
+            'ts': round((span['start'] - origin) * 1e6),
+            'dur': round((span['end'] - span['start']) * 1e6),
+            'pid': pid,
+            'tid': thread_ids[span['tid']],
+            'args': span['args']
+        })
+
+    trace_path = str(env['BUILD_TRACE'].abspath)
+    os.makedirs(os.path.dirname(trace_path), exist_ok=True)
+    with open(trace_path, 'w') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+    print(f"\n⏱️  Top build costs ({len(spans)} spans, trace: {trace_path}):")
+    print("=" * 80)
+    print(f"  {'Span':<36} {'Category':<12} {'Wall':>8} {'Child CPU':>10} {'Peak RSS':>10}")
+    for span in sorted(spans, key=lambda s: s['end'] - s['start'], reverse=True)[:SUMMARY_TOP]:
+        args = span['args']
+        cpu = args.get('cpu_user_s', 0.0) + args.get('cpu_system_s', 0.0)
+        rss = f"{args['peak_rss_mb']:.0f} MB" if 'peak_rss_mb' in args else '-'
+        print(f"  {span['name'][:36]:<36} {span['cat']:<12} {span['end'] - span['start']:>7.2f}s "
+              f"{(f'{cpu:.2f}s' if cpu else '-'):>10} {rss:>10}")
+    print("=" * 80)
+    print("   Open the trace in chrome://tracing or https://ui.perfetto.dev")
+
+# Initialize build trace
+setup_build_trace(env)
+
+print("✅ Build trace module loaded")
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+GDScript Hot Path - SCons Build System
+Lint rules for work done on frame callbacks and signal handlers
+
+Kept as a plain module so lint.py's pool workers can import it. Each script
+is summarized on its own (functions, the calls between them, calls into
+autoloads and class_name scripts, and every costly construct with its loop
+depth), which the lint cache keeps with the file's diagnostics. The check
+then walks the call graph of the whole project from the roots: frame
+callbacks (_process, _physics_process, ...) and signal handlers (anything
+passed to connect(), plus the editor-connected _on_* convention). Costly
+constructs in reached functions are reported with a cost weighted by path
+kind and loop nesting; lint.py sums those into per-file hot-path scores.
+A call marked `# lint-ignore: hot-path` (say, a generator behind a cache
+lookup) is not followed, so nothing it reaches is charged to the path.
+"""
+
+import gdscript_lint
+from gdscript_lint import IDENT, NODE_PATH, OPERATOR, STRING, code_tokens
+
+# Callbacks the engine runs every frame, and the ones it runs per input event
+FRAME_CALLBACKS = {'_process', '_physics_process', '_draw', '_integrate_forces'}
+EVENT_CALLBACKS = {'_input', '_unhandled_input', '_unhandled_key_input', '_gui_input'}
+SIGNAL_HANDLER_PREFIX = '_on_'
+
+# Only game code roots hot paths; test and bench callbacks may call into it freely
+ROOT_DIRS = ('scripts/',)
+
+# Path kinds: frame paths run every frame, so their findings weigh more
+FRAME_PATH = 'frame'
+SIGNAL_PATH = 'signal'
+PATH_WEIGHTS = {FRAME_PATH: 3, SIGNAL_PATH: 1}
+
+# Each enclosing loop multiplies a finding's cost, up to MAX_LOOP_DEPTH loops
+LOOP_WEIGHT = 4
+MAX_LOOP_DEPTH = 2
+
+# Tree queries walk the scene tree or a group on every call
+TREE_QUERIES = {
+    'get_nodes_in_group', 'get_first_node_in_group', 'find_child', 'find_children', 'find_parent',
+    'get_node', 'get_node_or_null', 'has_node', 'get_children', 'get_tree_string'
+}
+
+# Calls that build strings (print() formats and writes to stdout)
+STRING_CALLS = {'str', 'print', 'prints', 'printt', 'print_debug', 'print_rich', 'push_warning', 'format'}
+
+# Suppression id on a call line that keeps the walk out of the callee
+UNFOLLOWED_CALL = 'hot-path'
+
+# Calls that construct nodes or resources
+CONSTRUCTION_CALLS = {'new', 'instantiate', 'duplicate'}
+
+# Base cost of one finding on a signal path, outside loops
+RULE_COSTS = {
+    'hot-tree-query': 4,
+    'hot-load': 8,
+    'hot-construction': 4,
+    'hot-string-format': 2,
+    'hot-container-literal': 1,
+    'hot-loop': 1
+}
+
+# Tokens after which '[' or '{' opens a literal rather than indexing
+LITERAL_OPENERS = {'(', '[', '{', ',', '=', ':', ':=', '+=', '-=', 'return', 'in', 'and', 'or', 'not',
+                   '==', '!=', '+', '-', '*', '/', '<', '>', '<=', '>='}
+
+def is_call(code, index):
+    return index + 1 < len(code) and code[index + 1].value == '('
+
+def is_method_call(code, index):
+    return index > 0 and code[index - 1].value == '.' and is_call(code, index)
+
+def line_findings(code, loops):
+    """[rule id, line, column, description, loop depth] for the costly constructs of one logical line"""
+    findings = []
+    for index, token in enumerate(code):
+        previous = code[index - 1] if index else None
+        if token.kind == IDENT and token.value in TREE_QUERIES and is_call(code, index):
+            findings.append(['hot-tree-query', token.line, token.col, f"{token.value}()", loops])
+        elif token.kind == NODE_PATH:
+            findings.append(['hot-tree-query', token.line, token.col, f"{token.value} node lookup", loops])
+        elif token.kind == IDENT and token.value == 'load' and is_call(code, index) and \
+                (previous is None or previous.value != '.' or code[index - 2].value == 'ResourceLoader'):
+            findings.append(['hot-load', token.line, token.col, "load()", loops])
+        elif token.kind == IDENT and token.value in CONSTRUCTION_CALLS and is_method_call(code, index):
+            receiver = code[index - 2].value if code[index - 2].kind == IDENT else ''
+            findings.append(['hot-construction', token.line, token.col, f"{receiver}.{token.value}()", loops])
+        elif token.kind == IDENT and token.value in STRING_CALLS and is_call(code, index):
+            findings.append(['hot-string-format', token.line, token.col, f"{token.value}()", loops])
+        elif token.kind == OPERATOR and token.value == '%' and previous is not None and previous.kind == STRING:
+            findings.append(['hot-string-format', token.line, token.col, "'%' string formatting", loops])
+        elif token.kind == OPERATOR and token.value == '+' and previous is not None and index + 1 < len(code) and \
+                STRING in (previous.kind, code[index + 1].kind):
+            findings.append(['hot-string-format', token.line, token.col, "string concatenation", loops])
+        elif token.kind == OPERATOR and token.value in ('[', '{') and \
+                (previous is None or previous.value in LITERAL_OPENERS):
+            kind = 'Array' if token.value == '[' else 'Dictionary'
+            findings.append(['hot-container-literal', token.line, token.col, f"{kind} literal", loops])
+    return findings
+
+def summarize_function(function, names, suppressed):
+    """Calls and findings of one function; loop depth comes from enclosing for/while lines"""
+    calls = set()
+    external = set()
+    findings = []
+    loop_indents = []
+    for logical_line in function.body:
+        code = code_tokens(logical_line)
+        while loop_indents and len(logical_line.indent) <= loop_indents[-1]:
+            loop_indents.pop()
+        findings.extend(line_findings(code, len(loop_indents)))
+        if code[0].value in ('for', 'while'):
+            findings.append(['hot-loop', code[0].line, code[0].col, f"{code[0].value} loop", len(loop_indents)])
+            loop_indents.append(len(logical_line.indent))
+
+        for index, token in enumerate(code):
+            if token.kind != IDENT or not is_call(code, index) or \
+                    UNFOLLOWED_CALL in suppressed.get(token.line, ()):
+                continue
+            previous = code[index - 1].value if index else ''
+            receiver = code[index - 2] if previous == '.' and index >= 2 else None
+            if token.value in names and (previous != '.' or (receiver and receiver.value == 'self')):
+                calls.add(token.value)
+            elif receiver and receiver.kind == IDENT and receiver.value[:1].isupper():
+                external.add((receiver.value, token.value))  # Autoload or class_name receiver
+    return calls, external, findings
+
+def connected_handlers(script, names):
+    """Functions passed to connect() anywhere in the script, as callables or by name"""
+    handlers = set()
+    for logical_line in script.logical_lines:
+        code = code_tokens(logical_line)
+        for index, token in enumerate(code):
+            if token.value != 'connect' or not is_call(code, index):
+                continue
+            depth = 0
+            for argument in code[index + 1:]:
+                depth += argument.value in ('(', '[', '{')
+                depth -= argument.value in (')', ']', '}')
+                if depth == 0:
+                    break
+                value = argument.value.strip('"\'') if argument.kind == STRING else argument.value
+                if argument.kind in (IDENT, STRING) and value in names:
+                    handlers.add(value)
+    return handlers
+
+def summarize(script):
+    """Per-file summary for the project-wide check (JSON-serializable, cached with the file)"""
+    names = {function.name for function in script.functions}
+    handlers = connected_handlers(script, names)
+    suppressed = gdscript_lint.suppressed_rules(script)
+    class_name = None
+    for logical_line in script.logical_lines:
+        code = code_tokens(logical_line)
+        if len(code) >= 2 and code[0].value == 'class_name':
+            class_name = code[1].value
+            break
+
+    functions = {}
+    for function in script.functions:
+        if function.indent:
+            continue  # Inner classes are not modelled
+        calls, external, findings = summarize_function(function, names, suppressed)
+        if function.name in FRAME_CALLBACKS:
+            root = FRAME_PATH
+        elif function.name in EVENT_CALLBACKS or function.name in handlers or \
+                function.name.startswith(SIGNAL_HANDLER_PREFIX):
+            root = SIGNAL_PATH
+        else:
+            root = None
+        functions[function.name] = {
+            'root': root,
+            'calls': sorted(calls),
+            'external': sorted([receiver, method] for receiver, method in external),
+            'findings': findings
+        }
+    return {'class_name': class_name, 'functions': functions}
+
+def reachable_functions(summaries, context):
+    """(path, function) -> (path kind, call chain) for every function reached from a root
+
+    Frame paths are walked first, so a function reached from both keeps the
+    frame path. External calls resolve through autoload names and class_name.
+    """
+    receivers = dict(context.get('autoloads', {}))
+    for path, summary in summaries.items():
+        if summary.get('class_name'):
+            receivers.setdefault(summary['class_name'], path)
+
+    reached = {}
+    for kind in (FRAME_PATH, SIGNAL_PATH):
+        queue = [(path, name, [name]) for path, summary in sorted(summaries.items())
+                 for name, function in sorted(summary['functions'].items())
+                 if function['root'] == kind and path.startswith(ROOT_DIRS)]
+        while queue:
+            path, name, chain = queue.pop(0)
+            if (path, name) in reached:
+                continue
+            reached[(path, name)] = (kind, chain)
+            function = summaries[path]['functions'][name]
+            for callee in function['calls']:
+                queue.append((path, callee, chain + [callee]))
+            for receiver, method in function['external']:
+                target = receivers.get(receiver)
+                if target in summaries and method in summaries[target]['functions']:
+                    queue.append((target, method, chain + [f"{receiver}.{method}"]))
+    return reached
+
+def check(summaries, context):
+    """Hot-path findings of every reached function as (path, rule id, line, column, message, cost)"""
+    for (path, name), (kind, chain) in sorted(reachable_functions(summaries, context).items()):
+        via = ' -> '.join(chain)
+        for rule_id, line, col, description, loops in summaries[path]['functions'][name]['findings']:
+            if rule_id == 'hot-loop' and kind != FRAME_PATH:
+                continue  # Loops only matter when they run every frame
+            loops = min(loops, MAX_LOOP_DEPTH)
+            cost = RULE_COSTS[rule_id] * PATH_WEIGHTS[kind] * LOOP_WEIGHT ** loops
+            in_loop = f" inside {loops} loop{'s' if loops > 1 else ''}" if loops else ''
+            yield path, rule_id, line, col, f"{description}{in_loop} on a {kind} path ({via})", cost
+
+gdscript_lint.project_analysis('hot-path', {
+    'hot-tree-query': ('warning', "Scene tree or group query on a frame or signal path"),
+    'hot-load': ('warning', "load() on a frame or signal path"),
+    'hot-construction': ('warning', "Node or resource construction on a frame or signal path"),
+    'hot-string-format': ('warning', "String formatting or printing on a frame or signal path"),
+    'hot-container-literal': ('note', "Array or Dictionary literal allocated on a frame or signal path"),
+    'hot-loop': ('note', "Loop that runs every frame")
+}, summarize, check)
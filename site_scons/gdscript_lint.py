@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+GDScript Lint - SCons Build System
+Tokenizer, script model and pluggable rules behind `scons lint`
+
+Kept as a plain module (not loaded with SConscript) so that lint.py can run
+lint_source() in process pool workers. Rules register themselves with the
+@rule decorator and receive a Script: its tokens, logical lines (one per
+statement, continuation lines folded in) and functions. A rule yields
+(line, column, message) tuples, optionally with a cost that lint.py sums per
+file; `# lint-ignore: <rule-id>` at the end of a line silences that rule
+there (a bare `# lint-ignore` silences every rule). Rules that need the whole
+project register a project analysis instead: a per-file summary computed
+(and cached) next to the diagnostics, checked once over every file.
+"""
+
+import re
+import importlib
+from collections import namedtuple
+
+Token = namedtuple('Token', 'kind value line col')
+LogicalLine = namedtuple('LogicalLine', 'indent line tokens')
+Function = namedtuple('Function', 'name line end_line indent header body')
+Diagnostic = namedtuple('Diagnostic', 'rule severity line col message cost', defaults=(0,))
+
+# Token kinds
+IDENT = 'ident'
+KEYWORD = 'keyword'
+NUMBER = 'number'
+STRING = 'string'
+NODE_PATH = 'node_path'
+ANNOTATION = 'annotation'
+OPERATOR = 'operator'
+COMMENT = 'comment'
+
+KEYWORDS = {
+    'if', 'elif', 'else', 'for', 'while', 'match', 'when', 'break', 'continue', 'pass', 'return',
+    'class', 'class_name', 'extends', 'is', 'in', 'as', 'self', 'signal', 'func', 'static',
+    'const', 'enum', 'var', 'breakpoint', 'preload', 'await', 'yield', 'assert', 'void',
+    'and', 'or', 'not', 'true', 'false', 'null', 'super', 'PI', 'TAU', 'INF', 'NAN'
+}
+
+# Longest first, so '**=' wins over '**' and '*'
+OPERATORS = sorted([
+    '**=', '<<=', '>>=', '->', '==', '!=', '<=', '>=', '&&', '||', '+=', '-=', '*=', '/=', '%=',
+    '&=', '|=', '^=', '**', '<<', '>>', ':=', '+', '-', '*', '/', '%', '<', '>', '=', '!', '&',
+    '|', '^', '~', '.', ',', ':', ';', '(', ')', '[', ']', '{', '}'
+], key=len, reverse=True)
+
+BRACKETS = {'(': ')', '[': ']', '{': '}'}
+
+NUMBER_PATTERN = re.compile(r'0[xX][0-9a-fA-F_]+|0[bB][01_]+|(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?')
+IDENT_PATTERN = re.compile(r'[^\W\d]\w*')
+NODE_PATH_PATTERN = re.compile(r'\$(?:"[^"\n]*"|\'[^\'\n]*\'|[A-Za-z_][\w/]*)')
+SUPPRESSION_PATTERN = re.compile(r'#\s*lint-ignore\b(?::\s*([\w\-, ]+))?')
+
+SEVERITIES = ('error', 'warning', 'note')
+
+class LintSyntaxError(ValueError):
+    """Raised by the tokenizer for source it cannot split into tokens"""
+
+    def __init__(self, message, line, col):
+        super().__init__(message)
+        self.line = line
+        self.col = col
+
+def tokenize(text):
+    """Tokens and logical lines of a GDScript source
+
+    Newlines inside brackets and after a trailing backslash continue the
+    statement, as in Godot's own tokenizer. Raises LintSyntaxError for
+    unterminated strings and unbalanced brackets.
+    """
+    tokens = []
+    logical_lines = []
+    current = []
+    brackets = []
+    indent = None
+    line_start = 0
+    line = 1
+    position = 0
+    length = len(text)
+
+    def finish_line():
+        nonlocal current, indent
+        code = [token for token in current if token.kind != COMMENT]
+        if code:
+            logical_lines.append(LogicalLine(indent, code[0].line, current))
+        current = []
+        indent = None
+
+    while position < length:
+        char = text[position]
+        col = position - line_start + 1
+
+        if char == '\n':
+            if not brackets:
+                finish_line()
+            position += 1
+            line += 1
+            line_start = position
+            continue
+        if char in ' \t\r':
+            position += 1
+            continue
+        if char == '\\' and text.startswith('\n', position + 1):
+            position += 2
+            line += 1
+            line_start = position
+            continue
+
+        if indent is None and not brackets:
+            indent = text[line_start:position]
+
+        if char == '#':
+            end = text.find('\n', position)
+            end = length if end == -1 else end
+            current.append(Token(COMMENT, text[position:end], line, col))
+            tokens.append(current[-1])
+            position = end
+            continue
+
+        prefix = ''
+        if char in 'r&^' and position + 1 < length and text[position + 1] in '"\'':
+            prefix = char
+        quote_start = position + len(prefix)
+        if quote_start < length and text[quote_start] in '"\'':
+            quote = text[quote_start] * 3 if text.startswith(text[quote_start] * 3, quote_start) else text[quote_start]
+            scan = quote_start + len(quote)
+            while True:
+                if scan >= length or (len(quote) == 1 and text[scan] == '\n'):
+                    raise LintSyntaxError("unterminated string", line, col)
+                if text[scan] == '\\' and prefix != 'r':
+                    scan += 2
+                    continue
+                if text.startswith(quote, scan):
+                    scan += len(quote)
+                    break
+                scan += 1
+            value = text[position:scan]
+            current.append(Token(STRING, value, line, col))
+            tokens.append(current[-1])
+            newlines = value.count('\n')
+            if newlines:
+                line += newlines
+                line_start = position + value.rfind('\n') + 1
+            position = scan
+            continue
+
+        if char == '$':
+            match = NODE_PATH_PATTERN.match(text, position)
+            if match:
+                current.append(Token(NODE_PATH, match.group(), line, col))
+                tokens.append(current[-1])
+                position = match.end()
+                continue
+        if char == '@':
+            match = IDENT_PATTERN.match(text, position + 1)
+            if match:
+                current.append(Token(ANNOTATION, '@' + match.group(), line, col))
+                tokens.append(current[-1])
+                position = match.end()
+                continue
+        if char.isdigit() or (char == '.' and position + 1 < length and text[position + 1].isdigit()):
+            match = NUMBER_PATTERN.match(text, position)
+            current.append(Token(NUMBER, match.group(), line, col))
+            tokens.append(current[-1])
+            position = match.end()
+            continue
+        match = IDENT_PATTERN.match(text, position)
+        if match:
+            word = match.group()
+            current.append(Token(KEYWORD if word in KEYWORDS else IDENT, word, line, col))
+            tokens.append(current[-1])
+            position = match.end()
+            continue
+
+        operator = next((op for op in OPERATORS if text.startswith(op, position)), None)
+        if operator is None:
+            raise LintSyntaxError(f"unexpected character {char!r}", line, col)
+        if operator in BRACKETS:
+            brackets.append((operator, line, col))
+        elif operator in BRACKETS.values():
+            if not brackets or BRACKETS[brackets[-1][0]] != operator:
+                raise LintSyntaxError(f"unmatched '{operator}'", line, col)
+            brackets.pop()
+        current.append(Token(OPERATOR, operator, line, col))
+        tokens.append(current[-1])
+        position += len(operator)
+
+    if brackets:
+        opener, opened_line, opened_col = brackets[-1]
+        raise LintSyntaxError(f"'{opener}' is never closed", opened_line, opened_col)
+    finish_line()
+    return tokens, logical_lines
+
+def code_tokens(logical_line):
+    return [token for token in logical_line.tokens if token.kind != COMMENT]
+
+def find_functions(logical_lines):
+    """Functions of a script (including inner classes' methods), each with its body's logical lines"""
+    functions = []
+    for index, logical_line in enumerate(logical_lines):
+        code = code_tokens(logical_line)
+        if code and code[0].value == 'static':
+            code = code[1:]
+        if len(code) < 2 or code[0].value != 'func' or code[1].kind != IDENT:
+            continue
+        body = []
+        for following in logical_lines[index + 1:]:
+            if len(following.indent) <= len(logical_line.indent):
+                break
+            body.append(following)
+        end_line = body[-1].tokens[-1].line if body else logical_line.line
+        functions.append(Function(code[1].value, logical_line.line, end_line, logical_line.indent,
+                                  logical_line, body))
+    return functions
+
+class Script:
+    """One GDScript source, tokenized once and shared by every rule"""
+
+    def __init__(self, path, text):
+        self.path = path
+        self.text = text
+        self.lines = text.split('\n')
+        self.tokens, self.logical_lines = tokenize(text)
+        self.functions = find_functions(self.logical_lines)
+
+# Rule id -> (severity, description, check function or None for project rules)
+RULES = {}
+
+# Analysis name -> (rule ids, summarize(script), check(summaries, context))
+PROJECT_ANALYSES = {}
+
+def rule(rule_id, severity, description):
+    """Register a check(script) generator yielding (line, column, message)"""
+    assert severity in SEVERITIES, severity
+
+    def register(check):
+        RULES[rule_id] = (severity, description, check)
+        return check
+    return register
+
+def project_analysis(name, rules, summarize, check):
+    """Register a cross-file analysis
+
+    `rules` maps rule ids to (severity, description). summarize(script) runs
+    per file in the workers and returns JSON-serializable data; check(summaries,
+    context) gets {path: summary} for every linted file and yields (path, rule
+    id, line, column, message, cost).
+    """
+    for rule_id, (severity, description) in rules.items():
+        assert severity in SEVERITIES, severity
+        RULES[rule_id] = (severity, description, None)
+    PROJECT_ANALYSES[name] = (sorted(rules), summarize, check)
+
+def load_rule_packs(module_names):
+    """Import rule modules so they register (pool initializer for spawned workers)"""
+    for module_name in module_names:
+        importlib.import_module(module_name)
+
+# Longest line accepted (was the soft limit of validate_code_quality)
+MAX_LINE_LENGTH = 120
+
+@rule('line-too-long', 'error', f"Line longer than {MAX_LINE_LENGTH} characters")
+def check_line_length(script):
+    for number, text in enumerate(script.lines, 1):
+        if len(text) > MAX_LINE_LENGTH:
+            yield number, MAX_LINE_LENGTH + 1, f"line too long ({len(text)} > {MAX_LINE_LENGTH} characters)"
+
+@rule('trailing-whitespace', 'warning', "Whitespace at the end of a line")
+def check_trailing_whitespace(script):
+    for number, text in enumerate(script.lines, 1):
+        stripped = text.rstrip(' \t\r')
+        if stripped != text.rstrip('\r'):
+            yield number, len(stripped) + 1, "trailing whitespace"
+
+@rule('mixed-indentation', 'error', "Indentation mixing tabs and spaces")
+def check_mixed_indentation(script):
+    style = None  # Set by the first indented line, as Godot does
+    for logical_line in script.logical_lines:
+        indent = logical_line.indent
+        if ' ' in indent and '\t' in indent:
+            yield logical_line.line, 1, "indentation mixes tabs and spaces"
+        elif indent:
+            style = style or indent[0]
+            if indent[0] != style:
+                yield logical_line.line, 1, "indented with spaces in a file indented with tabs" if style == '\t' \
+                    else "indented with tabs in a file indented with spaces"
+
+@rule('fixme', 'warning', "FIXME comment left in the code")
+def check_fixme(script):
+    for token in script.tokens:
+        if token.kind == COMMENT and 'FIXME' in token.value:
+            yield token.line, token.col, "FIXME comment"
+
+@rule('unused-local', 'warning', "Local variable that is never read")
+def check_unused_locals(script):
+    for function in script.functions:
+        declared = {}
+        uses = {}
+        for logical_line in function.body:
+            code = code_tokens(logical_line)
+            for index, token in enumerate(code):
+                if token.kind != IDENT:
+                    continue
+                if index > 0 and code[index - 1].value == 'var':
+                    declared.setdefault(token.value, token)
+                elif index == 0 or code[index - 1].value != '.':
+                    uses[token.value] = uses.get(token.value, 0) + 1
+        for name, token in declared.items():
+            if not name.startswith('_') and not uses.get(name):
+                yield token.line, token.col, f"'{name}' is assigned but never used in {function.name}()"
+
+def suppressed_rules(script):
+    """Line -> set of silenced rule ids (an empty set silences every rule)"""
+    suppressed = {}
+    for token in script.tokens:
+        if token.kind == COMMENT:
+            match = SUPPRESSION_PATTERN.search(token.value)
+            if match:
+                ids = match.group(1)
+                suppressed[token.line] = {part.strip() for part in ids.split(',') if part.strip()} if ids else set()
+    return suppressed
+
+def lint_source(task):
+    """Lint one script: task is (relative path, text, rule ids)
+
+    Returns {'diagnostics': [plain tuples], 'summaries': {analysis: summary},
+    'suppressed': {line: [rule ids]}}; the suppressions are kept so project
+    analyses can honour them too.
+    """
+    path, text, rule_ids = task
+    try:
+        script = Script(path, text)
+    except LintSyntaxError as e:
+        return {'diagnostics': [tuple(Diagnostic('syntax', 'error', e.line, e.col, str(e)))],
+                'summaries': {}, 'suppressed': {}}
+
+    suppressed = suppressed_rules(script)
+    diagnostics = []
+    for rule_id in rule_ids:
+        severity, _, check = RULES[rule_id]
+        if check is None:
+            continue
+        for finding in check(script):
+            line, col, message = finding[:3]
+            if is_suppressed(suppressed, line, rule_id):
+                continue
+            diagnostics.append(tuple(Diagnostic(rule_id, severity, line, col, message, *finding[3:])))
+
+    summaries = {name: summarize(script) for name, (analysis_rules, summarize, _) in PROJECT_ANALYSES.items()
+                 if set(analysis_rules) & set(rule_ids)}
+    return {
+        'diagnostics': sorted(diagnostics, key=lambda diagnostic: (diagnostic[2], diagnostic[3], diagnostic[0])),
+        'summaries': summaries,
+        'suppressed': {line: sorted(ids) for line, ids in suppressed.items()}
+    }
+
+def is_suppressed(suppressed, line, rule_id):
+    silenced = suppressed.get(line)
+    return silenced is not None and (not silenced or rule_id in silenced)
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Godot Daemon Module - SCons Build System
+Opt-in persistent headless Godot process that serves validation and test requests
+"""
+
+import os
+import re
+import json
+import time
+import signal
+import socket
+import secrets
+import hashlib
+import subprocess
+from SCons.Script import *
+
+# Import the environment
+Import('env')
+
+# SceneTree script run by the daemon process
+DAEMON_SCRIPT = 'res://test/tools/BuildDaemon.gd'
+
+# Seconds to wait for a freshly started daemon to answer a ping
+DAEMON_START_TIMEOUT = 60
+
+# Files whose change requires a fresh engine (project settings, plugins, class registry, imports)
+DAEMON_RESTART_FILES = ['project.godot', os.path.join('.godot', 'global_script_class_cache.cfg'),
+                        os.path.join('.godot', 'continuum_import_fingerprint.json')]
+
+AUTOLOAD = re.compile(r'^(\w+)="\*?res://([^"]+)"', re.MULTILINE)
+
+def setup_godot_daemon(env):
+    """Setup Godot daemon functions
+
+    The daemon is opt-in: `daemon=1` on the command line or CONTINUUM_GODOT_DAEMON=1.
+    """
+    env['GODOT_DAEMON'] = ARGUMENTS.get('daemon', os.environ.get('CONTINUUM_GODOT_DAEMON', '0')) == '1'
+    env['GODOT_DAEMON_STATE'] = env['TEMP_DIR'].File('godot_daemon.json')
+    env['GODOT_DAEMON_LOG'] = env['TEMP_DIR'].File('godot_daemon.log')
+
+    # Add Godot daemon functions to environment
+    env.AddMethod(godot_daemon_request, "GodotDaemonRequest")
+    env.AddMethod(godot_daemon_status, "GodotDaemonStatus")
+    env.AddMethod(stop_godot_daemon, "StopGodotDaemon")
+
+def daemon_restart_key(env):
+    """Hash of everything that requires restarting the daemon when it changes
+
+    Covers the Godot executable, project.godot, autoload scripts, the addons
+    tree and the import fingerprint. Ordinary scripts and scenes are reloaded
+    in place by the daemon instead.
+    """
+    project_path = str(env['PROJECT_DIR'].abspath)
+    digest = hashlib.sha1(f"{env['GODOT_EXECUTABLE']}\n{env.get('GODOT_VERSION', '')}\n".encode('utf-8'))
+
+    # Autoloads are instantiated once at startup, so their scripts need a restart too
+    restart_files = list(DAEMON_RESTART_FILES)
+    try:
+        with open(os.path.join(project_path, 'project.godot'), 'r', encoding='utf-8') as f:
+            restart_files.extend(path for name, path in AUTOLOAD.findall(f.read()))
+    except OSError:
+        pass
+
+    for relative_path in restart_files:
+        try:
+            with open(os.path.join(project_path, relative_path), 'rb') as f:
+                digest.update(hashlib.sha1(f.read()).digest())
+        except OSError:
+            digest.update(b'missing')
+
+    addons_dir = os.path.join(project_path, 'addons')
+    for root, dirs, files in os.walk(addons_dir):
+        dirs.sort()
+        for file in sorted(files):
+            stat = os.stat(os.path.join(root, file))
+            relative_path = os.path.relpath(os.path.join(root, file), addons_dir)
+            digest.update(f"{relative_path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode('utf-8'))
+
+    return digest.hexdigest()
+
+def read_daemon_state(env):
+    """The recorded daemon pid, port, token and restart key, if any"""
+    try:
+        with open(str(env['GODOT_DAEMON_STATE'].abspath), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def send_daemon_command(state, command, args=None, timeout=30, echo_prefix="   "):
+    """Send one request to the daemon, echoing streamed output; returns the result dict"""
+    with socket.create_connection(('127.0.0.1', state['port']), timeout=timeout) as connection:
+        request = {'token': state['token'], 'command': command, 'args': args or {}}
+        connection.sendall((json.dumps(request) + '\n').encode('utf-8'))
+        with connection.makefile('r', encoding='utf-8') as stream:
+            for line in stream:
+                message = json.loads(line)
+                if 'output' in message:
+                    print(f"{echo_prefix}{message['output']}", flush=True)
+                elif 'result' in message:
+                    return message['result']
+    raise ConnectionError("daemon closed the connection without a result")
+
+def free_local_port():
+    """Ask the OS for an unused localhost port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+def terminate_daemon(state):
+    """Ask a daemon to shut down, killing it if it does not answer"""
+    try:
+        send_daemon_command(state, 'shutdown', timeout=5)
+        return
+    except (OSError, ValueError):
+        pass
+    try:
+        os.kill(state['pid'], signal.SIGTERM)
+    except (OSError, KeyError):
+        pass
+
+def start_daemon(env, restart_key):
+    """Launch a detached headless Godot running the daemon script and wait until it answers"""
+    state_path = str(env['GODOT_DAEMON_STATE'].abspath)
+    log_path = str(env['GODOT_DAEMON_LOG'].abspath)
+    os.makedirs(os.path.dirname(state_path), exist_ok=True)
+
+    port = free_local_port()
+    token = secrets.token_hex(16)
+    cmd = [
+        env['GODOT_EXECUTABLE'],
+        '--path', str(env['PROJECT_DIR'].abspath),
+        '--headless',
+        '-s', DAEMON_SCRIPT,
+        '--', f'--port={port}', f'--token={token}'
+    ]
+
+    print(f"👾 Starting Godot daemon on port {port}...")
+    detach = {'start_new_session': True} if os.name == 'posix' else \
+             {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+    with open(log_path, 'a') as log_file:
+        process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=log_file,
+                                   stderr=subprocess.STDOUT, **detach)
+
+    state = {'pid': process.pid, 'port': port, 'token': token, 'restart_key': restart_key,
+             'started_at': time.time()}
+    deadline = time.monotonic() + DAEMON_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            print(f"❌ Godot daemon exited during startup (see {log_path})")
+            return None
+        try:
+            result = send_daemon_command(state, 'ping', timeout=2)
+        except (OSError, ValueError):
+            time.sleep(0.2)
+            continue
+        state['version'] = result.get('version', '')
+        with open(state_path, 'w') as f:
+            json.dump(state, f, indent=2)
+        print(f"✅ Godot daemon ready (pid {process.pid})")
+        return state
+
+    print(f"❌ Godot daemon did not start within {DAEMON_START_TIMEOUT}s (see {log_path})")
+    terminate_daemon(state)
+    return None
+
+def ensure_daemon(env):
+    """Return the state of a live, up-to-date daemon, (re)starting it when needed"""
+    restart_key = daemon_restart_key(env)
+    state = read_daemon_state(env)
+
+    if state:
+        if state.get('restart_key') == restart_key:
+            try:
+                send_daemon_command(state, 'ping', timeout=2)
+                return state
+            except (OSError, ValueError):
+                print("⚠️  Godot daemon not responding, restarting it")
+        else:
+            print("🔄 Project settings, addons or imports changed, restarting Godot daemon")
+        terminate_daemon(state)
+        os.remove(str(env['GODOT_DAEMON_STATE'].abspath))
+
+    return start_daemon(env, restart_key)
+
+def godot_daemon_request(env, command, args=None, timeout=600):
+    """Run a command in the daemon; returns its result, or None to fall back to a fresh Godot
+
+    Returns None when the daemon is disabled, cannot be started, fails
+    mid-request or does not support the command.
+    """
+    if not env['GODOT_DAEMON']:
+        return None
+
+    state = ensure_daemon(env)
+    if state is None:
+        print("⚠️  Falling back to a separate Godot process")
+        return None
+
+    inactivity_timeout = env.get('GODOT_INACTIVITY_TIMEOUT', 0) or timeout
+    try:
+        result = send_daemon_command(state, command, args, timeout=min(timeout, inactivity_timeout))
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Godot daemon request '{command}' failed ({e}), stopping daemon and falling back")
+        terminate_daemon(state)
+        return None
+
+    if result.get('unsupported'):
+        print(f"⚠️  Godot daemon cannot run '{command}' ({result.get('error', '')}), falling back")
+        return None
+    return result
+
+def godot_daemon_status(env):
+    """Print whether a daemon is running and whether it is current"""
+    state = read_daemon_state(env)
+    if not state:
+        print("💤 No Godot daemon running")
+        return 0
+
+    try:
+        result = send_daemon_command(state, 'ping', timeout=2)
+    except (OSError, ValueError):
+        print(f"💀 Godot daemon (pid {state['pid']}) is not responding")
+        return 1
+
+    current = state.get('restart_key') == daemon_restart_key(env)
+    uptime = time.time() - state.get('started_at', time.time())
+    print(f"👾 Godot daemon pid {result.get('pid', state['pid'])} on port {state['port']}, "
+          f"{result.get('version', '')}, up {uptime:.0f}s")
+    print("   up to date" if current else "   stale - restarts on next request")
+    return 0
+
+def stop_godot_daemon(env):
+    """Shut down the daemon if one is running"""
+    state = read_daemon_state(env)
+    if not state:
+        print("💤 No Godot daemon running")
+        return 0
+
+    terminate_daemon(state)
+    os.remove(str(env['GODOT_DAEMON_STATE'].abspath))
+    print(f"✅ Stopped Godot daemon (pid {state['pid']})")
+    return 0
+
+# Initialize Godot daemon
+setup_godot_daemon(env)
+
+print("✅ Godot daemon module loaded")
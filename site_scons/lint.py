@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Lint Module - SCons Build System
+Parallel, content-hash cached GDScript linting with text, JSON and SARIF output
+"""
+
+import os
+import json
+import time
+import hashlib
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from SCons.Script import *
+
+# Plain modules next to this one, importable by pool workers
+import gdscript_lint
+import gdscript_hotpath
+
+# Import the environment
+Import('env')
+
+# Directories whose scripts are linted (addons are third-party)
+LINT_DIRS = ['scripts', 'test']
+
+# Rule modules whose source is part of the cache key, so editing a rule relints everything
+LINT_RULE_MODULES = [gdscript_lint, gdscript_hotpath]
+
+# Fewer uncached files than this are linted inline; a process pool costs more than it saves
+LINT_POOL_MIN_FILES = 16
+
+# lint_format= -> default output file under reports/
+LINT_OUTPUTS = {'json': 'lint.json', 'sarif': 'lint.sarif'}
+
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+SARIF_LEVELS = {'error': 'error', 'warning': 'warning', 'note': 'note'}
+
+# Diagnostics printed per run before the rest are summarized
+MAX_PRINTED_DIAGNOSTICS = 50
+
+# Files listed in the hot-path cost table
+TOP_COST_FILES = 10
+
+def setup_lint(env):
+    """Setup GDScript lint functions
+
+    `lint_format=json|sarif` also writes a machine-readable report (to
+    reports/lint.json or reports/lint.sarif, or `lint_output=<path>`), and
+    `lint_rules=<id,...>` / `lint_disable=<id,...>` choose the rules.
+    """
+    env['LINT_CACHE'] = env['TEMP_DIR'].File('lint_cache.json')
+    env['LINT_FORMAT'] = ARGUMENTS.get('lint_format', '')
+    env['LINT_OUTPUT'] = ARGUMENTS.get('lint_output', '')
+    env['LINT_RULES'] = [r for r in ARGUMENTS.get('lint_rules', '').split(',') if r]
+    env['LINT_DISABLE'] = [r for r in ARGUMENTS.get('lint_disable', '').split(',') if r]
+
+    # Add lint functions to environment
+    env.AddMethod(lint_scripts, "LintScripts")
+    env.AddMethod(print_hot_path_costs, "PrintHotPathCosts")
+    env.AddMethod(run_lint, "RunLint")
+
+def selected_rules(env):
+    """Sorted rule ids to run; unknown ids are reported and skipped"""
+    requested = env['LINT_RULES'] or sorted(gdscript_lint.RULES)
+    for rule_id in requested + env['LINT_DISABLE']:
+        if rule_id not in gdscript_lint.RULES:
+            print(f"⚠️  Unknown lint rule: {rule_id}")
+    return sorted(r for r in requested if r in gdscript_lint.RULES and r not in env['LINT_DISABLE'])
+
+def engine_signature(rule_ids):
+    """Cache key for everything but the file content: the rule sources and the selected rules"""
+    digest = hashlib.sha256()
+    for module in LINT_RULE_MODULES:
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    digest.update(','.join(rule_ids).encode('utf-8'))
+    return digest.hexdigest()
+
+def load_lint_cache(cache_path, signature):
+    try:
+        with open(cache_path, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache.get('files', {}) if cache.get('engine') == signature else {}
+
+def project_context(env):
+    """Project facts the project analyses resolve against: autoload name -> script path"""
+    autoloads = {}
+    try:
+        lines = env.ProjectFileLines('project.godot')
+    except OSError:
+        return {'autoloads': autoloads}
+    section = None
+    for line in lines:
+        line = line.strip()
+        if line.startswith('['):
+            section = line
+        elif section == '[autoload]' and '=' in line:
+            name, _, value = line.partition('=')
+            autoloads[name.strip()] = value.strip().strip('"').lstrip('*').replace('res://', '', 1)
+    return {'autoloads': autoloads}
+
+def run_project_analyses(env, entries, rule_ids):
+    """Diagnostics of the cross-file analyses over every linted file's cached summary"""
+    context = project_context(env)
+    diagnostics = {}
+    for name, (analysis_rules, _, check) in gdscript_lint.PROJECT_ANALYSES.items():
+        if not set(analysis_rules) & set(rule_ids):
+            continue
+        summaries = {path: entry['summaries'][name] for path, entry in entries.items()
+                     if name in entry.get('summaries', {})}
+        with env.TraceSpan(f"lint analysis {name}", 'validation', files=len(summaries)):
+            for path, rule_id, line, col, message, cost in check(summaries, context):
+                suppressed = {int(number): set(ids) for number, ids in entries[path]['suppressed'].items()}
+                if rule_id in rule_ids and not gdscript_lint.is_suppressed(suppressed, line, rule_id):
+                    severity = gdscript_lint.RULES[rule_id][0]
+                    diagnostics.setdefault(path, []).append(
+                        tuple(gdscript_lint.Diagnostic(rule_id, severity, line, col, message, cost)))
+    return diagnostics
+
+def lint_scripts(env, relative_paths, workers=None):
+    """Lint scripts, reusing cached results for unchanged content
+
+    Returns {'files': {path: [diagnostic tuples]}, 'costs': {path: hot-path
+    cost}, 'cached': n, 'linted': n, 'workers': n, 'rules': [ids]}. Per-file
+    results and analysis summaries are cached by the SHA-256 of each file, so
+    only edited files are tokenized again; project analyses then rerun over
+    the summaries, which is cheap.
+    """
+    project_path = str(env['PROJECT_DIR'].abspath)
+    cache_path = str(env['LINT_CACHE'].abspath)
+    rule_ids = selected_rules(env)
+    signature = engine_signature(rule_ids)
+    cache = load_lint_cache(cache_path, signature)
+
+    entries = {}
+    hashes = {}
+    tasks = []
+    for relative_path in relative_paths:
+        try:
+            with open(os.path.join(project_path, relative_path), 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            entries[relative_path] = {'diagnostics': [('io', 'error', 1, 1, str(e), 0)], 'suppressed': {}}
+            continue
+        hashes[relative_path] = hashlib.sha256(data).hexdigest()
+        cached = cache.get(relative_path)
+        if cached and cached['sha256'] == hashes[relative_path]:
+            entries[relative_path] = cached
+        else:
+            tasks.append((relative_path, data.decode('utf-8', 'replace'), rule_ids))
+
+    workers = workers or env['JOBS'] or os.cpu_count() or 1
+    if len(tasks) < LINT_POOL_MIN_FILES:
+        workers = 1
+    with env.TraceSpan('lint scripts', 'validation', files=len(tasks), workers=workers):
+        if workers > 1:
+            rule_modules = [module.__name__ for module in LINT_RULE_MODULES]
+            with ProcessPoolExecutor(max_workers=workers, initializer=gdscript_lint.load_rule_packs,
+                                     initargs=(rule_modules,)) as pool:
+                linted = list(pool.map(gdscript_lint.lint_source, tasks, chunksize=4))
+        else:
+            linted = [gdscript_lint.lint_source(task) for task in tasks]
+    for (relative_path, _, _), result in zip(tasks, linted):
+        entries[relative_path] = {'sha256': hashes[relative_path], **result}
+
+    if tasks:
+        for relative_path, entry in entries.items():
+            if relative_path in hashes:
+                cache[relative_path] = entry
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w') as f:
+            json.dump({'engine': signature, 'files': cache}, f)
+
+    results = {path: [tuple(diagnostic) for diagnostic in entry['diagnostics']] for path, entry in entries.items()}
+    for path, diagnostics in run_project_analyses(env, entries, rule_ids).items():
+        results[path] = sorted(results[path] + diagnostics, key=lambda diagnostic: (diagnostic[2], diagnostic[3]))
+
+    return {
+        'files': dict(sorted(results.items())),
+        'costs': {path: sum(diagnostic[5] for diagnostic in diagnostics)
+                  for path, diagnostics in results.items() if any(diagnostic[5] for diagnostic in diagnostics)},
+        'cached': len(relative_paths) - len(tasks),
+        'linted': len(tasks),
+        'workers': workers,
+        'rules': rule_ids
+    }
+
+def changed_scripts(env, ref):
+    """Linted scripts changed since `ref`, including staged, unstaged and untracked files"""
+    changed = set()
+    for cmd in (['git', 'diff', '--name-only', ref],
+                ['git', 'ls-files', '--others', '--exclude-standard']):
+        result = subprocess.run(cmd, cwd=str(env['PROJECT_DIR'].abspath), capture_output=True, text=True, timeout=30)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"{' '.join(cmd)} failed")
+        changed.update(line.strip() for line in result.stdout.splitlines() if line.strip())
+    return changed
+
+def sarif_report(lint):
+    rules = [{
+        'id': rule_id,
+        'shortDescription': {'text': gdscript_lint.RULES[rule_id][1]},
+        'defaultConfiguration': {'level': SARIF_LEVELS[gdscript_lint.RULES[rule_id][0]]}
+    } for rule_id in lint['rules']]
+    results = []
+    for path, diagnostics in lint['files'].items():
+        for rule_id, severity, line, col, message, cost in diagnostics:
+            result = {
+                'ruleId': rule_id,
+                'level': SARIF_LEVELS[severity],
+                'message': {'text': message},
+                'locations': [{
+                    'physicalLocation': {
+                        'artifactLocation': {'uri': path, 'uriBaseId': '%SRCROOT%'},
+                        'region': {'startLine': line, 'startColumn': col}
+                    }
+                }]
+            }
+            if cost:
+                result['properties'] = {'cost': cost}
+            results.append(result)
+    return {
+        '$schema': SARIF_SCHEMA,
+        'version': '2.1.0',
+        'runs': [{'tool': {'driver': {'name': 'continuum-gdlint', 'rules': rules}}, 'results': results}]
+    }
+
+def json_report(lint, counts):
+    return {
+        'rules': {rule_id: {'severity': gdscript_lint.RULES[rule_id][0],
+                            'description': gdscript_lint.RULES[rule_id][1]} for rule_id in lint['rules']},
+        'counts': counts,
+        'costs': lint['costs'],
+        'files': {path: [dict(zip(gdscript_lint.Diagnostic._fields, diagnostic)) for diagnostic in diagnostics]
+                  for path, diagnostics in lint['files'].items()}
+    }
+
+def print_hot_path_costs(lint, limit=TOP_COST_FILES, indent='  '):
+    """Per-file hot-path cost scores, highest first"""
+    if not lint['costs']:
+        return
+    print(f"{indent}🔥 Hot-path cost by file:")
+    for path, cost in sorted(lint['costs'].items(), key=lambda item: (-item[1], item[0]))[:limit]:
+        findings = sum(1 for diagnostic in lint['files'][path] if diagnostic[5])
+        print(f"{indent}  {path:<56} {cost:>7} ({findings} findings)")
+
+def run_lint(env, changed_only=False, ref='HEAD'):
+    """Lint the project's GDScript files; fails when any error-severity diagnostic is found
+
+    With changed_only, only scripts changed since `ref` (plus untracked ones)
+    are reported, which is what the pre-commit hook runs. Unchanged scripts
+    still come from the cache, because project analyses follow calls across
+    files.
+    """
+    scripts = [path for directory in LINT_DIRS for path in env.ProjectFiles(directory, '.gd')]
+    reported = scripts
+    if changed_only:
+        try:
+            changed = changed_scripts(env, ref)
+        except (OSError, RuntimeError, subprocess.TimeoutExpired) as e:
+            print(f"⚠️  Cannot list changed files ({e}); linting every script")
+        else:
+            reported = [path for path in scripts if path in changed]
+    print(f"🔍 Linting {len(reported)} GDScript files{' changed since ' + ref if changed_only else ''}...")
+
+    wall_start = time.perf_counter()
+    lint = lint_scripts(env, scripts)
+    wall_seconds = time.perf_counter() - wall_start
+    if reported is not scripts:
+        lint['files'] = {path: lint['files'][path] for path in reported}
+        lint['costs'] = {path: cost for path, cost in lint['costs'].items() if path in lint['files']}
+
+    counts = {severity: 0 for severity in gdscript_lint.SEVERITIES}
+    printed = 0
+    for path, diagnostics in lint['files'].items():
+        for rule_id, severity, line, col, message, _ in diagnostics:
+            counts[severity] += 1
+            if printed < MAX_PRINTED_DIAGNOSTICS:
+                print(f"  {path}:{line}:{col}: {severity} [{rule_id}] {message}")
+                printed += 1
+    total = sum(counts.values())
+    if total > printed:
+        print(f"  ... and {total - printed} more")
+    print_hot_path_costs(lint)
+
+    if env['LINT_FORMAT']:
+        if env['LINT_FORMAT'] not in LINT_OUTPUTS:
+            print(f"❌ Unknown lint_format: {env['LINT_FORMAT']} (expected {', '.join(LINT_OUTPUTS)})")
+            return 1
+        output_path = env['LINT_OUTPUT'] or os.path.join(str(env['PROJECT_DIR'].abspath), 'reports',
+                                                         LINT_OUTPUTS[env['LINT_FORMAT']])
+        report = sarif_report(lint) if env['LINT_FORMAT'] == 'sarif' else json_report(lint, counts)
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        with open(output_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"📄 Lint report: {output_path}")
+
+    print(f"📊 {counts['error']} errors, {counts['warning']} warnings, {counts['note']} notes in "
+          f"{len(lint['files'])} files ({lint['cached']} cached, {lint['linted']} linted on "
+          f"{lint['workers']} workers, {wall_seconds:.2f}s)")
+    if counts['error']:
+        print("❌ Lint failed")
+        return 1
+    print("✅ Lint passed")
+    return 0
+
+# Initialize lint
+setup_lint(env)
+
+print("✅ Lint module loaded")
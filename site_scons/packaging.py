@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Packaging Module - SCons Build System
+Reproducible release archives and .pck delta patches against the previous release
+"""
+
+import os
+import json
+import time
+import zipfile
+import hashlib
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from SCons.Script import *
+
+# Plain modules next to this one, used from worker threads
+import pck_delta
+import release_archive
+
+# Import the environment
+Import('env')
+
+# Releases are kept side by side so the next one can diff against them
+RELEASES_DIR = 'releases'
+RELEASE_MANIFEST = 'release.json'
+
+# Archive and patch names; archive members live under continuum-<slug>/ in every release
+ARCHIVE_NAME = 'continuum-{slug}-{version}.zip'
+ARCHIVE_ROOT = 'continuum-{slug}/'
+DELTA_NAME = 'continuum-{slug}-{previous}-to-{version}{suffix}.pckdelta'
+
+# Single-preset release builds (platform != all) export the Desktop preset
+DEFAULT_PRESET = 'Desktop'
+
+def setup_packaging(env):
+    """Setup release packaging functions
+
+    `version=<name>` names the release (default: git describe), `previous=<name|dir>`
+    picks the release to diff against (default: the last one packaged), and
+    SOURCE_DATE_EPOCH overrides the archive timestamp (default: HEAD's commit time).
+    """
+    env['RELEASES_DIR'] = env['DIST_DIR'].Dir(RELEASES_DIR)
+    env['RELEASE_VERSION'] = ARGUMENTS.get('version', '')
+    env['RELEASE_PREVIOUS'] = ARGUMENTS.get('previous', '')
+
+    # Add packaging functions to environment
+    env.AddMethod(package_release, "PackageRelease")
+
+def git_output(env, *args):
+    """Stripped stdout of a git command in the project, or '' when git is unavailable"""
+    try:
+        result = subprocess.run(['git', *args], cwd=str(env['PROJECT_DIR'].abspath),
+                                capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return ''
+    return result.stdout.strip() if result.returncode == 0 else ''
+
+def release_version(env):
+    return env['RELEASE_VERSION'] or git_output(env, 'describe', '--tags', '--always', '--dirty') or 'dev'
+
+def release_timestamp(env):
+    """Archive timestamp: SOURCE_DATE_EPOCH, else HEAD's commit time, else the zip epoch"""
+    value = os.environ.get('SOURCE_DATE_EPOCH') or git_output(env, 'log', '-1', '--format=%ct')
+    try:
+        return int(value)
+    except ValueError:
+        return release_archive.ZIP_EPOCH
+
+def release_inputs(env, export_target):
+    """Exported files of each preset: [{'preset', 'slug', 'entries': [(archive name, path)]}]"""
+    if os.path.basename(export_target) == 'export_summary.json':
+        with open(export_target, 'r') as f:
+            summary = json.load(f)
+        inputs = []
+        for result in summary:
+            slug = os.path.basename(os.path.dirname(result['output']))
+            inputs.append({
+                'preset': result['preset'],
+                'slug': slug,
+                'entries': release_archive.collect_entries(os.path.dirname(result['output']),
+                                                           ARCHIVE_ROOT.format(slug=slug))
+            })
+        return inputs
+
+    output_dir = os.path.dirname(export_target)
+    slug = DEFAULT_PRESET.lower()
+    prefix = ARCHIVE_ROOT.format(slug=slug)
+    entries = sorted((prefix + name, os.path.join(output_dir, name))
+                     for name in env.GodotExportOutputs(export_target))
+    return [{'preset': DEFAULT_PRESET, 'slug': slug, 'entries': entries}]
+
+def load_release_manifest(release_dir):
+    try:
+        with open(os.path.join(release_dir, RELEASE_MANIFEST), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def find_previous_release(env, version):
+    """(directory, manifest) of the release to diff against, or (None, None)"""
+    releases_dir = str(env['RELEASES_DIR'].abspath)
+    previous = env['RELEASE_PREVIOUS']
+    if previous:
+        release_dir = previous if os.path.isdir(previous) else os.path.join(releases_dir, previous)
+        manifest = load_release_manifest(release_dir)
+        if manifest is None:
+            print(f"  ⚠️  No {RELEASE_MANIFEST} in {release_dir}; skipping delta patches")
+            return None, None
+        return release_dir, manifest
+
+    candidates = []
+    if os.path.isdir(releases_dir):
+        for name in os.listdir(releases_dir):
+            release_dir = os.path.join(releases_dir, name)
+            manifest = load_release_manifest(release_dir)
+            if manifest and manifest.get('version') != version:
+                candidates.append((manifest.get('packaged_at', 0), release_dir, manifest))
+    if not candidates:
+        return None, None
+    _, release_dir, manifest = max(candidates, key=lambda candidate: candidate[0])
+    return release_dir, manifest
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def compress_archives(env, inputs, out_dir, version, timestamp, workers):
+    """Deflate every chunk of every preset in one pool, then write and verify the archives"""
+    tasks = []
+    for preset in inputs:
+        for _, path in preset['entries']:
+            tasks.extend(release_archive.chunk_tasks(path))
+
+    wall_start = time.perf_counter()
+    with env.TraceSpan('compress archives', 'package', chunks=len(tasks), workers=workers):
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            chunk_results = {}
+            for task, result in zip(tasks, pool.map(release_archive.deflate_chunk, tasks)):
+                chunk_results.setdefault(task[0], []).append(result)
+
+            def write_preset(preset):
+                archive_path = os.path.join(out_dir, ARCHIVE_NAME.format(slug=preset['slug'], version=version))
+                totals = release_archive.write_archive(archive_path, preset['entries'], chunk_results, timestamp)
+                totals['archive'] = archive_path
+                totals['sha256'] = sha256_file(archive_path)
+                with zipfile.ZipFile(archive_path) as archive:
+                    totals['verified'] = (archive.testzip() is None and
+                                          len(archive.namelist()) == len(preset['entries']))
+                return totals
+
+            archives = list(pool.map(write_preset, inputs))
+    return archives, time.perf_counter() - wall_start
+
+def make_preset_deltas(preset, new_archive, previous_dir, previous_manifest, out_dir, version):
+    """Patch each .pck of a preset against the same member of the previous release's archive"""
+    previous_entry = previous_manifest.get('archives', {}).get(preset['slug'])
+    if not previous_entry:
+        return []
+    previous_archive = os.path.join(previous_dir, previous_entry['archive'])
+    if not os.path.exists(previous_archive):
+        return [{'preset': preset['preset'], 'status': 'missing', 'error': f"{previous_archive} not found"}]
+
+    results = []
+    with zipfile.ZipFile(previous_archive) as old_zip, zipfile.ZipFile(new_archive) as new_zip:
+        old_members = set(old_zip.namelist())
+        packs = sorted(name for name in new_zip.namelist() if name.endswith('.pck'))
+        for member in packs:
+            if member not in old_members:
+                continue
+            start = time.perf_counter()
+            old = old_zip.read(member)
+            new = new_zip.read(member)
+            patch, stats = pck_delta.make_delta(old, new)
+            try:
+                verified = pck_delta.apply_delta(old, patch) == new
+            except pck_delta.DeltaError as e:
+                verified = False
+                stats['error'] = str(e)
+
+            suffix = '' if len(packs) == 1 else '-' + os.path.splitext(os.path.basename(member))[0]
+            patch_path = os.path.join(out_dir, DELTA_NAME.format(slug=preset['slug'], version=version,
+                                                                 previous=previous_manifest['version'],
+                                                                 suffix=suffix))
+            with open(patch_path, 'wb') as f:
+                f.write(patch)
+            stats.update({
+                'preset': preset['preset'],
+                'member': member,
+                'patch': os.path.basename(patch_path),
+                'pck_bytes': len(new),
+                'patch_bytes': len(patch),
+                'old_sha256': hashlib.sha256(old).hexdigest(),
+                'new_sha256': hashlib.sha256(new).hexdigest(),
+                'seconds': round(time.perf_counter() - start, 2),
+                'status': 'ok' if verified else 'failed'
+            })
+            results.append(stats)
+    return results
+
+def print_release_report(manifest):
+    print("\n📊 Release Packages:")
+    print("=" * 80)
+    print(f"  {'Preset':<20} {'Files':>6} {'Raw MB':>9} {'Zip MB':>9} {'Ratio':>6} {'CPU s':>7}  Verified")
+    for slug, archive in manifest['archives'].items():
+        ratio = archive['archive_bytes'] / archive['raw_bytes'] if archive['raw_bytes'] else 1.0
+        print(f"  {archive['preset']:<20} {archive['files']:>6} {archive['raw_bytes'] / 1048576:>9.2f} "
+              f"{archive['archive_bytes'] / 1048576:>9.2f} {ratio:>6.1%} {archive['compress_seconds']:>7.2f}  "
+              f"{'✅' if archive['verified'] else '❌'}")
+    print(f"  Compression wall-clock: {manifest['compress_wall_seconds']:.2f}s on {manifest['workers']} workers")
+
+    if manifest['deltas']:
+        print(f"\n  Delta patches from {manifest['previous']}:")
+        print(f"  {'Pack':<44} {'Pck MB':>8} {'Patch MB':>9} {'Size':>6} {'Seconds':>8}  Verified")
+        for delta in manifest['deltas']:
+            if 'member' not in delta:
+                print(f"  {delta['preset']:<44} ❌ {delta['error']}")
+                continue
+            size = delta['patch_bytes'] / delta['pck_bytes'] if delta['pck_bytes'] else 0.0
+            print(f"  {delta['member']:<44} {delta['pck_bytes'] / 1048576:>8.2f} {delta['patch_bytes'] / 1048576:>9.2f} "
+                  f"{size:>6.1%} {delta['seconds']:>8.2f}  {'✅' if delta['status'] == 'ok' else '❌'} ({delta['method']})")
+    elif manifest['previous']:
+        print(f"\n  No .pck files shared with {manifest['previous']}")
+    else:
+        print("\n  No previous release to diff against (previous=<version|dir>)")
+    print("=" * 80)
+
+def package_release(env, export_target, workers=None):
+    """Package each exported preset as a reproducible zip and patch its .pck files
+
+    export_target is the release export: build-release's file, or the
+    export_summary.json of `platform=all`. Archives, patches and release.json
+    (sizes, timings, hashes) go to dist/releases/<version>/.
+    """
+    inputs = release_inputs(env, export_target)
+    missing = [preset['preset'] for preset in inputs if not preset['entries']]
+    if not inputs or missing:
+        print(f"❌ Nothing exported to package for: {', '.join(missing) or DEFAULT_PRESET}")
+        return 1
+
+    version = release_version(env)
+    timestamp = release_timestamp(env)
+    workers = workers or env['JOBS'] or os.cpu_count() or 1
+    out_dir = os.path.join(str(env['RELEASES_DIR'].abspath), version)
+    os.makedirs(out_dir, exist_ok=True)
+    print(f"📦 Packaging {len(inputs)} presets as {version} on {workers} workers...")
+
+    archives, compress_wall = compress_archives(env, inputs, out_dir, version, timestamp, workers)
+
+    previous_dir, previous_manifest = find_previous_release(env, version)
+    deltas = []
+    if previous_manifest:
+        with env.TraceSpan('pck deltas', 'package', previous=previous_manifest['version']):
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(make_preset_deltas, preset, archive['archive'], previous_dir,
+                                       previous_manifest, out_dir, version)
+                           for preset, archive in zip(inputs, archives)]
+                for future in futures:
+                    deltas.extend(future.result())
+
+    manifest = {
+        'version': version,
+        'previous': previous_manifest['version'] if previous_manifest else None,
+        'timestamp': timestamp,
+        'packaged_at': time.time(),
+        'workers': workers,
+        'compress_wall_seconds': round(compress_wall, 2),
+        'archives': {},
+        'deltas': deltas
+    }
+    for preset, archive in zip(inputs, archives):
+        archive['compress_seconds'] = round(archive['compress_seconds'], 2)
+        manifest['archives'][preset['slug']] = dict(archive, preset=preset['preset'],
+                                                    archive=os.path.basename(archive['archive']))
+    with open(os.path.join(out_dir, RELEASE_MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    print_release_report(manifest)
+    print(f"📁 Release: {out_dir}")
+
+    failed_archives = [slug for slug, archive in manifest['archives'].items() if not archive['verified']]
+    failed_deltas = [delta for delta in deltas if delta['status'] != 'ok']
+    if failed_archives or failed_deltas:
+        print(f"❌ Verification failed: {len(failed_archives)} archives, {len(failed_deltas)} delta patches")
+        return 1
+    print(f"✅ Packaged {len(archives)} archives and {len(deltas)} verified delta patches")
+    return 0
+
+# Initialize packaging
+setup_packaging(env)
+
+print("✅ Packaging module loaded")
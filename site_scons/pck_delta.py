@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+PCK Delta - SCons Build System
+Binary patches that rebuild a release's .pck from the previous release's
+
+Kept as a plain module so packaging.py can build patches in worker threads.
+A patch is a list of COPY (range of the old file) and INSERT (literal bytes)
+operations, xz-compressed, framed by the SHA-256 of the old and new files.
+Godot packs store each resource contiguously with its MD5 in the directory,
+so unchanged resources are found by MD5 even when they moved; files that are
+not readable packs fall back to matching aligned blocks.
+"""
+
+import io
+import lzma
+import struct
+import hashlib
+
+import pck_format
+
+DELTA_MAGIC = b'CPDL'
+DELTA_VERSION = 1
+
+# magic, version, SHA-256 of the old and new file, new size, operation count
+DELTA_HEADER = struct.Struct('<4sB32s32sQI')
+OP_COPY = b'C'
+OP_INSERT = b'I'
+COPY_OP = struct.Struct('<QQ')
+INSERT_OP = struct.Struct('<Q')
+
+# Block size for files that are not packs
+FALLBACK_BLOCK_SIZE = 64 * 1024
+
+XZ_PRESET = 6
+
+class DeltaError(ValueError):
+    """Raised when a patch is corrupt or does not match the file it is applied to"""
+
+def pack_copies(old, new):
+    """COPY candidates (new_offset, old_offset, length) for resources whose bytes did not change"""
+    old_pack = pck_format.read_pck(old)
+    new_pack = pck_format.read_pck(new)
+    by_md5 = {}
+    by_path = {}
+    for entry in old_pack['files']:
+        by_md5.setdefault((entry['md5'], entry['size']), entry['offset'])
+        by_path[(entry['path'], entry['size'])] = entry['offset']
+
+    copies = []
+    for entry in new_pack['files']:
+        if entry['size'] == 0:
+            continue
+        old_offset = by_md5.get((entry['md5'], entry['size']))
+        if old_offset is None:
+            old_offset = by_path.get((entry['path'], entry['size']))
+        if old_offset is not None:
+            copies.append((entry['offset'], old_offset, entry['size']))
+    return copies
+
+def block_copies(old, new, block_size=FALLBACK_BLOCK_SIZE):
+    """COPY candidates for aligned blocks of new that occur aligned in old"""
+    blocks = {}
+    for offset in range(0, len(old) - block_size + 1, block_size):
+        blocks.setdefault(hashlib.blake2b(old[offset:offset + block_size], digest_size=16).digest(), offset)
+
+    copies = []
+    for offset in range(0, len(new) - block_size + 1, block_size):
+        old_offset = blocks.get(hashlib.blake2b(new[offset:offset + block_size], digest_size=16).digest())
+        if old_offset is not None:
+            copies.append((offset, old_offset, block_size))
+    return copies
+
+def plan_operations(old, new):
+    """Ordered (op, a, b) list covering new: (COPY, old_offset, length) or (INSERT, new_offset, length)
+
+    Candidates are byte-compared before use, so a misread directory can only
+    make the patch larger, never wrong.
+    """
+    try:
+        copies = pack_copies(old, new)
+        method = 'pck'
+    except pck_format.PckError:
+        copies = block_copies(old, new)
+        method = 'blocks'
+
+    operations = []
+    position = 0
+    for new_offset, old_offset, length in sorted(copies):
+        if new_offset < position:
+            continue
+        if old[old_offset:old_offset + length] != new[new_offset:new_offset + length]:
+            continue
+        previous = operations[-1] if operations else None
+        if new_offset > position:
+            gap = new_offset - position
+            if previous and previous[0] == OP_COPY and \
+                    old[previous[1] + previous[2]:previous[1] + previous[2] + gap] == new[position:new_offset]:
+                previous[2] += gap  # Alignment padding that matches too
+            else:
+                operations.append([OP_INSERT, position, gap])
+        previous = operations[-1] if operations else None
+        if previous and previous[0] == OP_COPY and previous[1] + previous[2] == old_offset:
+            previous[2] += length  # Contiguous in both files
+        else:
+            operations.append([OP_COPY, old_offset, length])
+        position = new_offset + length
+    if position < len(new):
+        operations.append([OP_INSERT, position, len(new) - position])
+    return operations, method
+
+def make_delta(old, new):
+    """Patch bytes turning old into new, plus statistics about it"""
+    old = memoryview(old)
+    new = memoryview(new)
+    operations, method = plan_operations(old, new)
+
+    body = io.BytesIO()
+    copied = 0
+    inserted = 0
+    for op, a, length in operations:
+        body.write(op)
+        if op == OP_COPY:
+            body.write(COPY_OP.pack(a, length))
+            copied += length
+        else:
+            body.write(INSERT_OP.pack(length))
+            body.write(new[a:a + length])
+            inserted += length
+
+    header = DELTA_HEADER.pack(DELTA_MAGIC, DELTA_VERSION, hashlib.sha256(old).digest(),
+                               hashlib.sha256(new).digest(), len(new), len(operations))
+    patch = header + lzma.compress(body.getvalue(), preset=XZ_PRESET)
+    return patch, {
+        'method': method,
+        'operations': len(operations),
+        'copied_bytes': copied,
+        'inserted_bytes': inserted
+    }
+
+def apply_delta(old, patch):
+    """Rebuild the new file from old and a patch, checking both hashes"""
+    if len(patch) < DELTA_HEADER.size:
+        raise DeltaError("truncated patch header")
+    magic, version, old_hash, new_hash, new_size, count = DELTA_HEADER.unpack_from(patch, 0)
+    if magic != DELTA_MAGIC or version != DELTA_VERSION:
+        raise DeltaError("not a pck delta")
+    if hashlib.sha256(old).digest() != old_hash:
+        raise DeltaError("patch was made against a different old file")
+
+    try:
+        body = lzma.decompress(patch[DELTA_HEADER.size:])
+    except lzma.LZMAError as e:
+        raise DeltaError(f"corrupt patch body: {e}")
+
+    output = bytearray()
+    position = 0
+    try:
+        for _ in range(count):
+            op = body[position:position + 1]
+            position += 1
+            if op == OP_COPY:
+                old_offset, length = COPY_OP.unpack_from(body, position)
+                position += COPY_OP.size
+                if old_offset + length > len(old):
+                    raise DeltaError("copy past the end of the old file")
+                output += old[old_offset:old_offset + length]
+            elif op == OP_INSERT:
+                length = INSERT_OP.unpack_from(body, position)[0]
+                position += INSERT_OP.size
+                output += body[position:position + length]
+                position += length
+            else:
+                raise DeltaError(f"unknown operation {op!r}")
+    except struct.error:
+        raise DeltaError("truncated patch body")
+
+    if len(output) != new_size or hashlib.sha256(output).digest() != new_hash:
+        raise DeltaError("patched file does not match the new file's hash")
+    return bytes(output)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+PCK Format - SCons Build System
+Reader for the directory of Godot 4 .pck files (standalone or embedded in an executable)
+
+Kept as a plain module so release packaging and its worker threads can share
+it. Only the header and file directory are parsed; file contents are located
+by absolute offset and left to the caller.
+"""
+
+import struct
+
+PCK_MAGIC = 0x43504447  # "GDPC"
+
+# Pack format 2 (Godot 4.0-4.3) keeps the directory after the header; 3 (4.4+) stores its offset
+PCK_FORMAT_VERSIONS = (2, 3)
+
+# Pack flags
+PACK_DIR_ENCRYPTED = 1 << 0
+PACK_REL_FILEBASE = 1 << 1
+
+# Per-file flags
+PACK_FILE_ENCRYPTED = 1 << 0
+PACK_FILE_REMOVAL = 1 << 1
+
+# Reserved 32-bit words after the header fields
+PCK_RESERVED_WORDS = 16
+
+class PckError(ValueError):
+    """Raised for data that is not a readable Godot 4 pack"""
+
+def find_pck_start(data):
+    """Offset of the pack inside data: 0 for a .pck, or the embedded pack of an executable"""
+    if len(data) >= 4 and struct.unpack_from('<I', data, 0)[0] == PCK_MAGIC:
+        return 0
+    # Embedded packs end with their size and a trailing magic
+    if len(data) >= 12 and struct.unpack_from('<I', data, len(data) - 4)[0] == PCK_MAGIC:
+        pck_size = struct.unpack_from('<Q', data, len(data) - 12)[0]
+        start = len(data) - 12 - pck_size
+        if start >= 0 and struct.unpack_from('<I', data, start)[0] == PCK_MAGIC:
+            return start
+    raise PckError("no GDPC header")
+
+def read_pck(data):
+    """Header and file directory of a pack
+
+    Returns {'format', 'godot_version', 'flags', 'pck_start', 'file_base',
+    'directory': (start, end), 'files': [{path, offset, size, md5, flags}]}
+    with absolute offsets into data, sorted by offset.
+    """
+    pck_start = find_pck_start(data)
+    try:
+        magic, version, major, minor, patch, flags = struct.unpack_from('<6I', data, pck_start)
+        file_base = struct.unpack_from('<Q', data, pck_start + 24)[0]
+    except struct.error:
+        raise PckError("truncated header")
+    if version not in PCK_FORMAT_VERSIONS:
+        raise PckError(f"unsupported pack format {version}")
+    if flags & PACK_DIR_ENCRYPTED:
+        raise PckError("encrypted directory")
+
+    position = pck_start + 32
+    if version >= 3:
+        directory_offset = struct.unpack_from('<Q', data, position)[0]
+        position = pck_start + directory_offset
+    else:
+        position += PCK_RESERVED_WORDS * 4
+    if flags & PACK_REL_FILEBASE:
+        file_base += pck_start
+
+    directory_start = position
+    files = []
+    try:
+        count = struct.unpack_from('<I', data, position)[0]
+        position += 4
+        for _ in range(count):
+            path_length = struct.unpack_from('<I', data, position)[0]
+            position += 4
+            path = bytes(data[position:position + path_length]).rstrip(b'\0').decode('utf-8')
+            position += path_length
+            offset, size = struct.unpack_from('<QQ', data, position)
+            position += 16
+            md5 = bytes(data[position:position + 16])
+            position += 16
+            file_flags = struct.unpack_from('<I', data, position)[0]
+            position += 4
+            files.append({
+                'path': path,
+                'offset': file_base + offset,
+                'size': size,
+                'md5': md5.hex(),
+                'flags': file_flags
+            })
+    except (struct.error, UnicodeDecodeError):
+        raise PckError("truncated or corrupt file directory")
+
+    for entry in files:
+        if entry['offset'] + entry['size'] > len(data):
+            raise PckError(f"{entry['path']} extends past the end of the pack")
+
+    return {
+        'format': version,
+        'godot_version': f"{major}.{minor}.{patch}",
+        'flags': flags,
+        'pck_start': pck_start,
+        'file_base': file_base,
+        'directory': (directory_start, position),
+        'files': sorted(files, key=lambda entry: entry['offset'])
+    }
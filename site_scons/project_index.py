@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Project Index Module - SCons Build System
+Single-pass, persisted index of project files shared by all validators
+"""
+
+import os
+import json
+from SCons.Script import *
+
+# Import the environment
+Import('env')
+
+# Directories never indexed (build output, caches and third-party addons)
+INDEX_IGNORED_DIRS = {'.godot', '.git', '.temp', 'addons', 'build', 'dist', 'reports', '__pycache__'}
+
+# File types whose contents are read into the index
+TEXT_EXTENSIONS = ('.gd', '.tscn', '.tres', '.cfg', '.godot')
+
+# The index built during this SCons run, shared by every validator
+_project_index = None
+
+def setup_project_index(env):
+    """Setup project index functions"""
+
+    env['PROJECT_INDEX_CACHE'] = env['TEMP_DIR'].File('project_index.json')
+
+    # Add project index functions to environment
+    env.AddMethod(get_project_index, "ProjectIndex")
+    env.AddMethod(project_files, "ProjectFiles")
+    env.AddMethod(project_file_lines, "ProjectFileLines")
+
+def scan_tree(root_path, relative_dir=''):
+    """Yield (relative path, stat result) for every indexed file using os.scandir"""
+    with os.scandir(os.path.join(root_path, relative_dir)) as entries:
+        for entry in entries:
+            relative_path = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in INDEX_IGNORED_DIRS and not entry.name.startswith('.'):
+                    yield from scan_tree(root_path, relative_path)
+            elif entry.is_file():
+                yield relative_path, entry.stat()
+
+def build_project_index(env):
+    """Walk the project once, reusing cached contents for files whose mtime and size match"""
+    project_path = str(env['PROJECT_DIR'].abspath)
+    cache_path = str(env['PROJECT_INDEX_CACHE'].abspath)
+
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        cached = {}
+
+    files = {}
+    read_count = 0
+    for relative_path, stat in scan_tree(project_path):
+        entry = {'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+        previous = cached.get(relative_path)
+        if previous and previous['size'] == entry['size'] and previous['mtime'] == entry['mtime']:
+            files[relative_path] = previous
+            continue
+
+        if relative_path.endswith(TEXT_EXTENSIONS):
+            try:
+                with open(os.path.join(project_path, relative_path), 'r', encoding='utf-8') as f:
+                    entry['content'] = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                entry['error'] = str(e)
+            read_count += 1
+        files[relative_path] = entry
+
+    if read_count or len(files) != len(cached):
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(files, f)
+
+    return {'root': project_path, 'files': files, 'read_count': read_count}
+
+def get_project_index(env, refresh=False):
+    """Return the project index for this run, building it on first use"""
+    global _project_index
+    if _project_index is None or refresh:
+        _project_index = build_project_index(env)
+    return _project_index
+
+def project_files(env, directory='', extension=''):
+    """Sorted relative paths of indexed files below `directory` ending in `extension`"""
+    prefix = directory.rstrip('/') + '/' if directory else ''
+    return sorted(path for path in get_project_index(env)['files']
+                  if path.startswith(prefix) and path.endswith(extension))
+
+def project_file_lines(env, relative_path):
+    """Cached lines of an indexed text file; raises OSError if it could not be read"""
+    entry = get_project_index(env)['files'].get(relative_path)
+    if entry is None:
+        raise OSError(f"{relative_path} is not in the project index")
+    if 'error' in entry:
+        raise OSError(entry['error'])
+    if 'lines' not in entry:
+        entry['lines'] = entry.get('content', '').split('\n')
+    return entry['lines']
+
+# Initialize project index
+setup_project_index(env)
+
+print("✅ Project index module loaded")
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Release Archive - SCons Build System
+Reproducible zip archives whose entries are deflated in parallel chunks
+
+Kept as a plain module so packaging.py can hand its functions to a thread
+pool (zlib releases the GIL while compressing). Entries are sorted, carry a
+fixed timestamp and normalized permissions, and large files are split into
+chunks that are deflated independently (each primed with the tail of the
+previous chunk, like pigz) and concatenated into one deflate stream, so the
+archive bytes depend only on the input files.
+"""
+
+import os
+import time
+import zlib
+import struct
+
+# Files larger than this are deflated as several chunks
+CHUNK_SIZE = 4 * 1024 * 1024
+
+# Window primed from the previous chunk (the deflate maximum)
+DICTIONARY_SIZE = 32 * 1024
+
+COMPRESSION_LEVEL = 9
+
+# Zip timestamps cannot predate 1980
+ZIP_EPOCH = 315532800
+
+# Zip record layouts
+LOCAL_HEADER = struct.Struct('<IHHHHHIIIHH')
+CENTRAL_HEADER = struct.Struct('<IHHHHHHIIIHHHHHII')
+END_OF_CENTRAL_DIRECTORY = struct.Struct('<IHHHHIIH')
+LOCAL_HEADER_SIGNATURE = 0x04034b50
+CENTRAL_HEADER_SIGNATURE = 0x02014b50
+END_SIGNATURE = 0x06054b50
+
+ZIP_VERSION = 20  # 2.0: deflate
+ZIP_MADE_BY_UNIX = 3 << 8
+ZIP_UTF8_NAMES = 1 << 11
+ZIP_STORED = 0
+ZIP_DEFLATED = 8
+ZIP_MAX_SIZE = 0xFFFFFFFF  # Zip64 is not written
+
+def dos_timestamp(epoch):
+    """(time, date) fields of a zip entry for a UTC epoch"""
+    t = time.gmtime(max(epoch, ZIP_EPOCH))
+    return ((t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2),
+            ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday)
+
+def collect_entries(root, prefix=''):
+    """(archive name, path) of every file under root, sorted by archive name"""
+    entries = []
+    for directory, dirs, files in os.walk(root):
+        for file_name in files:
+            path = os.path.join(directory, file_name)
+            relative = os.path.relpath(path, root).replace(os.sep, '/')
+            entries.append((prefix + relative, path))
+    return sorted(entries)
+
+def chunk_tasks(path, chunk_size=CHUNK_SIZE):
+    """(path, offset, length, is_last) for each chunk of a file; empty files have one empty chunk"""
+    size = os.path.getsize(path)
+    if size == 0:
+        return [(path, 0, 0, True)]
+    return [(path, offset, min(chunk_size, size - offset), offset + chunk_size >= size)
+            for offset in range(0, size, chunk_size)]
+
+def deflate_chunk(task, level=COMPRESSION_LEVEL):
+    """Raw deflate of one chunk; returns (data, input length, seconds)
+
+    Every chunk but the last ends with a sync flush, which byte-aligns it so
+    the chunks of a file concatenate into a single valid stream.
+    """
+    path, offset, length, is_last = task
+    start = time.perf_counter()
+    with open(path, 'rb') as f:
+        dictionary = b''
+        if offset > 0:
+            f.seek(max(0, offset - DICTIONARY_SIZE))
+            dictionary = f.read(min(offset, DICTIONARY_SIZE))
+        data = f.read(length)
+
+    if dictionary:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15, 9, zlib.Z_DEFAULT_STRATEGY, dictionary)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15, 9)
+    compressed = compressor.compress(data) + compressor.flush(zlib.Z_FINISH if is_last else zlib.Z_SYNC_FLUSH)
+    return compressed, length, time.perf_counter() - start
+
+def file_mode(path):
+    """Normalized unix permissions: 0755 for executables, 0644 otherwise"""
+    return 0o100755 if os.stat(path).st_mode & 0o111 else 0o100644
+
+def write_archive(archive_path, entries, chunk_results, timestamp):
+    """Write a zip of entries from their deflated chunks
+
+    chunk_results maps each path to its deflate_chunk() results in order.
+    Entries that do not shrink are stored instead. Returns per-archive totals.
+    """
+    dos_time, dos_date = dos_timestamp(timestamp)
+    central = []
+    totals = {'files': 0, 'raw_bytes': 0, 'stored': 0, 'compress_seconds': 0.0}
+
+    with open(archive_path, 'wb') as f:
+        for name, path in entries:
+            chunks = chunk_results[path]
+            size = sum(length for _, length, _ in chunks)
+            compressed_size = sum(len(data) for data, _, _ in chunks)
+            if size > ZIP_MAX_SIZE or compressed_size > ZIP_MAX_SIZE:
+                raise ValueError(f"{name} is too large for a zip without Zip64")
+
+            # CRCs of separate chunks cannot be combined with the zlib module, so hash the file once more
+            crc = 0
+            with open(path, 'rb') as source:
+                while True:
+                    block = source.read(CHUNK_SIZE)
+                    if not block:
+                        break
+                    crc = zlib.crc32(block, crc)
+
+            method = ZIP_DEFLATED if compressed_size < size else ZIP_STORED
+            encoded_name = name.encode('utf-8')
+            flags = ZIP_UTF8_NAMES if not name.isascii() else 0
+            offset = f.tell()
+            stored_size = compressed_size if method == ZIP_DEFLATED else size
+            f.write(LOCAL_HEADER.pack(LOCAL_HEADER_SIGNATURE, ZIP_VERSION, flags, method, dos_time, dos_date,
+                                      crc, stored_size, size, len(encoded_name), 0))
+            f.write(encoded_name)
+            if method == ZIP_DEFLATED:
+                for data, _, _ in chunks:
+                    f.write(data)
+            else:
+                totals['stored'] += 1
+                with open(path, 'rb') as source:
+                    while True:
+                        block = source.read(CHUNK_SIZE)
+                        if not block:
+                            break
+                        f.write(block)
+            if offset > ZIP_MAX_SIZE:
+                raise ValueError(f"{archive_path} is too large for a zip without Zip64")
+
+            central.append(CENTRAL_HEADER.pack(CENTRAL_HEADER_SIGNATURE, ZIP_MADE_BY_UNIX | ZIP_VERSION,
+                                               ZIP_VERSION, flags, method, dos_time, dos_date, crc,
+                                               stored_size, size, len(encoded_name), 0, 0, 0, 0,
+                                               file_mode(path) << 16, offset) + encoded_name)
+            totals['files'] += 1
+            totals['raw_bytes'] += size
+            totals['compress_seconds'] += sum(seconds for _, _, seconds in chunks)
+
+        central_offset = f.tell()
+        for record in central:
+            f.write(record)
+        central_size = f.tell() - central_offset
+        f.write(END_OF_CENTRAL_DIRECTORY.pack(END_SIGNATURE, 0, 0, len(central), len(central),
+                                              central_size, central_offset, 0))
+
+    totals['archive_bytes'] = os.path.getsize(archive_path)
+    return totals
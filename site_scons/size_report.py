@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Size Report Module - SCons Build System
+Per-resource breakdown of exported packs, leak checks, diffs and size budgets
+"""
+
+import os
+import json
+import struct
+import fnmatch
+import zipfile
+from SCons.Script import *
+
+# Plain module next to this one, shared with release packaging
+import pck_format
+
+# Import the environment
+Import('env')
+
+MB = 1024 * 1024
+KB = 1024
+
+# Byte budgets per preset slug ('default' covers the rest): 'pack' is the packed
+# resources, 'download' everything the export writes (engine binaries included),
+# 'dirs' the packed size per top-level source directory. Web and Android are
+# downloaded on every install, so they get the tight ones.
+SIZE_BUDGETS = {
+    'default': {'pack': 64 * MB, 'dirs': {'addons': 512 * KB}},
+    'web': {'pack': 16 * MB, 'download': 64 * MB, 'dirs': {'addons': 512 * KB}},
+    'android': {'pack': 24 * MB, 'download': 96 * MB, 'dirs': {'addons': 512 * KB}},
+    'android-debug': {'pack': 24 * MB, 'dirs': {'addons': 512 * KB}}
+}
+
+# Development-only files that must never ship (mirrors the Android presets' exclude_filter)
+LEAK_PATTERNS = ['test/*', 'addons/gdUnit4/*', 'site_scons/*', 'SConstruct', '*.md', '.git*']
+
+# Packed file extension -> reported type
+FILE_TYPES = {
+    '.ctex': 'texture', '.ctexarray': 'texture', '.ccube': 'texture', '.png': 'texture',
+    '.svg': 'texture', '.webp': 'texture', '.jpg': 'texture',
+    '.sample': 'audio', '.oggvorbisstr': 'audio', '.mp3str': 'audio', '.wav': 'audio', '.ogg': 'audio',
+    '.scn': 'scene', '.tscn': 'scene',
+    '.gd': 'script', '.gdc': 'script',
+    '.res': 'resource', '.tres': 'resource', '.bin': 'resource',
+    '.fontdata': 'font', '.ttf': 'font', '.otf': 'font',
+    '.gdshader': 'shader', '.gdshaderinc': 'shader',
+    '.import': 'import metadata', '.remap': 'import metadata', '.cfg': 'import metadata'
+}
+
+# Packs inside an Android package live under these prefixes
+ANDROID_ASSET_PREFIXES = ('assets/', 'base/assets/')
+
+# Rows shown per section of the report
+TOP_FILES = 10
+
+def setup_size_report(env):
+    """Setup export size report functions
+
+    `size_budget_mb=<N>` overrides the pack budget of every preset, and
+    `size_baseline=<dir>` diffs against reports saved elsewhere instead of the
+    previous run's (kept in .temp/size_report/).
+    """
+    env['SIZE_REPORT_DIR'] = env['TEMP_DIR'].Dir('size_report')
+    env['SIZE_BUDGET_MB'] = ARGUMENTS.get('size_budget_mb', '')
+    env['SIZE_BASELINE'] = ARGUMENTS.get('size_baseline', '')
+
+    # Add size report functions to environment
+    env.AddMethod(analyze_export_size, "AnalyzeExportSize")
+    env.AddMethod(size_report, "SizeReport")
+
+def file_type(path):
+    return FILE_TYPES.get(os.path.splitext(path)[1].lower(), 'other')
+
+def strip_res(path):
+    return path[len('res://'):] if path.startswith('res://') else path
+
+def remap_targets(text):
+    """Packed paths a .import/.remap file points at (path=, path.s3tc=, ...)"""
+    targets = []
+    for line in text.splitlines():
+        key, _, value = line.partition('=')
+        if key.strip().startswith('path') and value.strip().startswith('"'):
+            targets.append(strip_res(value.strip().strip('"')))
+    return targets
+
+def pack_entries(data, origin):
+    """Files of one pack: [{'path', 'bytes'}] plus {packed path: source path} from its remaps"""
+    pack = pck_format.read_pck(data)
+    entries = []
+    sources = {}
+    for entry in pack['files']:
+        path = strip_res(entry['path'])
+        entries.append({'path': path, 'bytes': entry['size'], 'origin': origin})
+        if path.endswith(('.import', '.remap')) and entry['size'] < 64 * KB:
+            text = bytes(data[entry['offset']:entry['offset'] + entry['size']]).decode('utf-8', 'replace')
+            for target in remap_targets(text):
+                sources[target] = path[:-len('.import')] if path.endswith('.import') else path[:-len('.remap')]
+    return entries, sources
+
+def has_embedded_pack(path):
+    """True when the file ends with an embedded pack's trailer"""
+    if os.path.getsize(path) < 12:
+        return False
+    with open(path, 'rb') as f:
+        f.seek(-4, os.SEEK_END)
+        return struct.unpack('<I', f.read(4))[0] == pck_format.PCK_MAGIC
+
+def read_export_file(path):
+    """Packed entries and remaps of one exported file (.pck, .apk/.aab, .zip, executable)
+
+    Android packages hold the project as plain zip members under assets/; their
+    compressed size is what the user downloads, so that is what is counted.
+    """
+    name = os.path.basename(path)
+    if path.endswith('.pck'):
+        with open(path, 'rb') as f:
+            return pack_entries(f.read(), name)
+    if zipfile.is_zipfile(path):
+        entries = []
+        sources = {}
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                if info.filename.endswith('.pck'):
+                    packed, remaps = pack_entries(archive.read(info), f"{name}:{info.filename}")
+                    entries.extend(packed)
+                    sources.update(remaps)
+                    continue
+                prefix = next((p for p in ANDROID_ASSET_PREFIXES if info.filename.startswith(p)), None)
+                if prefix is None:
+                    continue
+                packed_path = info.filename[len(prefix):]
+                entries.append({'path': packed_path, 'bytes': info.compress_size, 'origin': name})
+                if packed_path.endswith(('.import', '.remap')):
+                    text = archive.read(info).decode('utf-8', 'replace')
+                    for target in remap_targets(text):
+                        sources[target] = os.path.splitext(packed_path)[0]
+        return entries, sources
+    if has_embedded_pack(path):
+        with open(path, 'rb') as f:
+            return pack_entries(f.read(), name)
+    return [], {}
+
+def top_directory(source):
+    if '/' not in source:
+        return '(root)'
+    return source.split('/', 1)[0]
+
+def analyze_export_size(env, preset, slug, paths):
+    """Size breakdown of one preset's exported files
+
+    Imported and exported copies under .godot/ are attributed back to the
+    source file whose .import/.remap points at them, so directory totals
+    reflect the project tree rather than Godot's cache layout.
+    """
+    files = []
+    sources = {}
+    download = 0
+    for path in sorted(paths):
+        download += os.path.getsize(path)
+        try:
+            entries, remaps = read_export_file(path)
+        except (pck_format.PckError, zipfile.BadZipFile) as e:
+            print(f"  ⚠️  Cannot read {os.path.basename(path)}: {e}")
+            continue
+        files.extend(entries)
+        sources.update(remaps)
+
+    by_dir = {}
+    by_type = {}
+    leaks = []
+    for entry in files:
+        source = sources.get(entry['path'], entry['path'])
+        if source.endswith(('.import', '.remap')):
+            source = os.path.splitext(source)[0]
+        entry['source'] = source
+        entry['type'] = file_type(entry['path'])
+        entry['dir'] = top_directory(source)
+        for totals, key in ((by_dir, entry['dir']), (by_type, entry['type'])):
+            bucket = totals.setdefault(key, {'bytes': 0, 'files': 0})
+            bucket['bytes'] += entry['bytes']
+            bucket['files'] += 1
+        if any(fnmatch.fnmatch(source, pattern) for pattern in LEAK_PATTERNS):
+            leaks.append(entry['path'])
+
+    return {
+        'preset': preset,
+        'slug': slug,
+        'download_bytes': download,
+        'pack_bytes': sum(entry['bytes'] for entry in files),
+        'by_dir': dict(sorted(by_dir.items())),
+        'by_type': dict(sorted(by_type.items())),
+        'leaks': sorted(leaks),
+        'files': sorted(files, key=lambda entry: (-entry['bytes'], entry['path']))
+    }
+
+def export_presets(env, export_target):
+    """[(preset, slug, exported paths)] for a release export target"""
+    if os.path.basename(export_target) == 'export_summary.json':
+        with open(export_target, 'r') as f:
+            summary = json.load(f)
+        presets = []
+        for result in summary:
+            output_dir = os.path.dirname(result['output'])
+            paths = [os.path.join(output_dir, name) for name in sorted(os.listdir(output_dir))
+                     if os.path.isfile(os.path.join(output_dir, name))]
+            presets.append((result['preset'], os.path.basename(output_dir), paths))
+        return presets
+
+    output_dir = os.path.dirname(export_target)
+    paths = [os.path.join(output_dir, name) for name in env.GodotExportOutputs(export_target)]
+    return [('Desktop', 'desktop', paths)]
+
+def budget_for(env, slug):
+    budget = dict(SIZE_BUDGETS.get(slug, SIZE_BUDGETS['default']))
+    if env['SIZE_BUDGET_MB']:
+        budget['pack'] = int(float(env['SIZE_BUDGET_MB']) * MB)
+    return budget
+
+def check_budget(report, budget):
+    """Messages for every budget the report exceeds"""
+    failures = []
+    for key, label in (('pack', 'packed resources'), ('download', 'download size')):
+        actual = report[f"{key}_bytes"]
+        if key in budget and actual > budget[key]:
+            failures.append(f"{label} {format_size(actual)} > budget {format_size(budget[key])}")
+    for directory, limit in budget.get('dirs', {}).items():
+        actual = report['by_dir'].get(directory, {}).get('bytes', 0)
+        if actual > limit:
+            failures.append(f"{directory}/ {format_size(actual)} > budget {format_size(limit)}")
+    return failures
+
+def diff_reports(current, previous):
+    """Total, per-directory and per-file changes against the previous report"""
+    old_files = {entry['path']: entry['bytes'] for entry in previous.get('files', [])}
+    new_files = {entry['path']: entry['bytes'] for entry in current['files']}
+    changes = []
+    for path in set(old_files) | set(new_files):
+        delta = new_files.get(path, 0) - old_files.get(path, 0)
+        if delta:
+            status = 'added' if path not in old_files else 'removed' if path not in new_files else 'changed'
+            changes.append((status, path, delta))
+
+    directories = {}
+    for directory in set(current['by_dir']) | set(previous.get('by_dir', {})):
+        delta = current['by_dir'].get(directory, {}).get('bytes', 0) - \
+                previous.get('by_dir', {}).get(directory, {}).get('bytes', 0)
+        if delta:
+            directories[directory] = delta
+
+    return {
+        'pack_delta': current['pack_bytes'] - previous.get('pack_bytes', 0),
+        'download_delta': current['download_bytes'] - previous.get('download_bytes', 0),
+        'dirs': dict(sorted(directories.items(), key=lambda item: -abs(item[1]))),
+        'files': sorted(changes, key=lambda change: (-abs(change[2]), change[1]))
+    }
+
+def format_size(size):
+    if abs(size) >= MB:
+        return f"{size / MB:.2f} MB"
+    return f"{size / KB:.1f} KB"
+
+def format_delta(delta):
+    return ('+' if delta >= 0 else '-') + format_size(abs(delta))
+
+def print_size_report(report, diff, failures):
+    print(f"\n📦 {report['preset']}: {format_size(report['pack_bytes'])} packed in "
+          f"{len(report['files'])} files, {format_size(report['download_bytes'])} download")
+    print("=" * 80)
+    print(f"  {'Directory':<44} {'Files':>7} {'Size':>12} {'Share':>7} {'Change':>12}")
+    for directory, totals in sorted(report['by_dir'].items(), key=lambda item: -item[1]['bytes']):
+        share = totals['bytes'] / report['pack_bytes'] if report['pack_bytes'] else 0.0
+        change = format_delta(diff['dirs'][directory]) if diff and directory in diff['dirs'] else ''
+        print(f"  {directory + '/':<44} {totals['files']:>7} {format_size(totals['bytes']):>12} "
+              f"{share:>7.1%} {change:>12}")
+    print("-" * 80)
+    print("  " + ", ".join(f"{kind} {format_size(totals['bytes'])}"
+                           for kind, totals in sorted(report['by_type'].items(), key=lambda item: -item[1]['bytes'])))
+    print("  Largest files:")
+    for entry in report['files'][:TOP_FILES]:
+        print(f"    {entry['path']:<60} {format_size(entry['bytes']):>12}")
+    if diff:
+        print(f"  Since the previous build: packed {format_delta(diff['pack_delta'])}, "
+              f"download {format_delta(diff['download_delta'])}")
+        for status, path, delta in diff['files'][:TOP_FILES]:
+            print(f"    {status:<8} {path:<51} {format_delta(delta):>12}")
+    for path in report['leaks']:
+        print(f"  ❌ Development file in release: {path}")
+    for failure in failures:
+        print(f"  ❌ Over budget: {failure}")
+    print("=" * 80)
+
+def size_report(env, export_target):
+    """Analyze every preset of a release export, diff against the previous build and enforce budgets
+
+    Fails when development files (tests, gdUnit4, build scripts) were packed or
+    any budget in SIZE_BUDGETS is exceeded. Each preset's report is saved as
+    the baseline for the next run.
+    """
+    report_dir = str(env['SIZE_REPORT_DIR'].abspath)
+    baseline_dir = env['SIZE_BASELINE'] or report_dir
+    os.makedirs(report_dir, exist_ok=True)
+    print("📏 Analyzing export sizes...")
+
+    failed = []
+    for preset, slug, paths in export_presets(env, export_target):
+        with env.TraceSpan(f"size report {slug}", 'package', files=len(paths)):
+            report = analyze_export_size(env, preset, slug, paths)
+
+        report_path = os.path.join(report_dir, f"{slug}.json")
+        baseline_path = os.path.join(baseline_dir, f"{slug}.json")
+        diff = None
+        if os.path.exists(baseline_path):
+            try:
+                with open(baseline_path, 'r') as f:
+                    diff = diff_reports(report, json.load(f))
+            except (OSError, ValueError) as e:
+                print(f"  ⚠️  Cannot read {baseline_path}: {e}")
+
+        failures = check_budget(report, budget_for(env, slug))
+        print_size_report(report, diff, failures)
+        if report['leaks'] or failures:
+            failed.append(preset)
+
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if failed:
+        print(f"❌ Size report failed for: {', '.join(failed)}")
+        return 1
+    print(f"✅ Export sizes within budget (reports in {report_dir})")
+    return 0
+
+# Initialize size report
+setup_size_report(env)
+
+print("✅ Size report module loaded")
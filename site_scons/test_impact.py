@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Test Impact Module - SCons Build System
+Dependency graph of scripts, scenes and resources used to select affected test suites
+"""
+
+import os
+import re
+import json
+import subprocess
+from collections import deque
+from SCons.Script import *
+
+# Import the environment
+Import('env')
+
+# Directories scanned for the dependency graph
+GRAPH_DIRS = ['scripts', 'scenes', 'resources', 'test']
+
+# File types that can reference other project files
+GRAPH_EXTENSIONS = ('.gd', '.tscn', '.tres')
+
+# Changes to these files can affect every suite, so they select the full suite
+GLOBAL_INPUTS = ('project.godot',)
+
+RES_PATH = re.compile(r'res://([^"\'\s)]+)')
+CLASS_NAME = re.compile(r'^class_name\s+(\w+)', re.MULTILINE)
+EXTENDS_CLASS = re.compile(r'^\s*(?:class\s+\w+\s+)?extends\s+(\w+)', re.MULTILINE)
+IDENTIFIER = re.compile(r'\b([A-Z]\w*)\b')
+AUTOLOAD = re.compile(r'^(\w+)="\*?res://([^"]+)"', re.MULTILINE)
+
+def setup_test_impact(env):
+    """Setup test impact analysis functions"""
+
+    env['TEST_GRAPH_CACHE'] = env['TEMP_DIR'].File('test_graph.json')
+
+    # Add test impact functions to environment
+    env.AddMethod(affected_test_suites, "AffectedTestSuites")
+    env.AddMethod(run_affected_tests, "GodotRunAffectedTests")
+
+def scan_file(file_path):
+    """Extract res:// references, referenced identifiers and the declared class_name"""
+    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        content = f.read()
+
+    declared = CLASS_NAME.search(content)
+    symbols = set()
+    if file_path.endswith('.gd'):
+        # Strip comments and strings before looking for class references
+        code = re.sub(r'#.*', '', content)
+        code = re.sub(r'"[^"\n]*"|\'[^\'\n]*\'', '""', code)
+        symbols.update(EXTENDS_CLASS.findall(code))
+        symbols.update(IDENTIFIER.findall(code))
+    else:
+        symbols.update(re.findall(r'script_class="(\w+)"', content))
+
+    return {
+        'paths': sorted(set(RES_PATH.findall(content))),
+        'symbols': sorted(symbols),
+        'class_name': declared.group(1) if declared else None
+    }
+
+def load_dependency_graph(env):
+    """Scan project files into a dependency graph, reusing cached entries by mtime and size"""
+    project_path = str(env['PROJECT_DIR'].abspath)
+    cache_path = str(env['TEST_GRAPH_CACHE'].abspath)
+
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        cached = {}
+
+    graph = {}
+    rescanned = 0
+    for graph_dir in GRAPH_DIRS:
+        for root, dirs, files in os.walk(os.path.join(project_path, graph_dir)):
+            for file in files:
+                if not file.endswith(GRAPH_EXTENSIONS):
+                    continue
+                file_path = os.path.join(root, file)
+                relative_path = os.path.relpath(file_path, project_path).replace(os.sep, '/')
+                stat = os.stat(file_path)
+                entry = cached.get(relative_path)
+                if entry and entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                    graph[relative_path] = entry
+                    continue
+                entry = scan_file(file_path)
+                entry['mtime'] = stat.st_mtime_ns
+                entry['size'] = stat.st_size
+                graph[relative_path] = entry
+                rescanned += 1
+
+    if rescanned or len(graph) != len(cached):
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w') as f:
+            json.dump(graph, f)
+
+    return graph
+
+def resolve_edges(env, graph):
+    """Turn each file's raw references into edges to other project files"""
+    project_path = str(env['PROJECT_DIR'].abspath)
+
+    symbol_files = {entry['class_name']: path for path, entry in graph.items() if entry['class_name']}
+    try:
+        with open(os.path.join(project_path, 'project.godot'), 'r', encoding='utf-8') as f:
+            for name, path in AUTOLOAD.findall(f.read()):
+                symbol_files[name] = path
+    except OSError:
+        pass
+
+    edges = {}
+    for path, entry in graph.items():
+        targets = set(entry['paths'])
+        targets.update(symbol_files[s] for s in entry['symbols'] if s in symbol_files)
+        targets.discard(path)
+        edges[path] = targets
+
+    return edges
+
+def changed_files_since(project_path, ref):
+    """Files changed since `ref`, including uncommitted and untracked files"""
+    changed = set()
+    for cmd in (['git', 'diff', '--name-only', ref],
+                ['git', 'ls-files', '--others', '--exclude-standard']):
+        result = subprocess.run(cmd, cwd=project_path, capture_output=True, text=True, timeout=30)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"{' '.join(cmd)} failed")
+        changed.update(line.strip() for line in result.stdout.splitlines() if line.strip())
+    return changed
+
+def affected_test_suites(env, ref='HEAD', test_filter=""):
+    """Return (suites, changed files) for the test suites that reach a changed file"""
+    project_path = str(env['PROJECT_DIR'].abspath)
+    changed = changed_files_since(project_path, ref)
+
+    graph = load_dependency_graph(env)
+    prefix = (test_filter or 'test').rstrip('/') + '/'
+    suites = sorted(path for path in graph
+                    if path.startswith(prefix) and os.path.basename(path).startswith('test_'))
+
+    if any(path in changed for path in GLOBAL_INPUTS):
+        return suites, changed
+
+    edges = resolve_edges(env, graph)
+    affected = []
+    for suite in suites:
+        seen = {suite}
+        pending = deque([suite])
+        while pending:
+            path = pending.popleft()
+            if path in changed:
+                affected.append(suite)
+                break
+            for target in edges.get(path, ()):
+                if target not in seen:
+                    seen.add(target)
+                    pending.append(target)
+
+    return affected, changed
+
+def run_affected_tests(env, ref='HEAD', jobs=0):
+    """Run only the test suites affected by files changed since `ref`"""
+    print(f"🎯 Selecting test suites affected by changes since {ref}...")
+
+    try:
+        suites, changed = affected_test_suites(env, ref)
+    except (RuntimeError, OSError, subprocess.TimeoutExpired) as e:
+        print(f"❌ Could not determine changed files: {e}")
+        return 1
+
+    print(f"   {len(changed)} changed files, {len(suites)} affected suites")
+    for suite in suites:
+        print(f"   - {suite}")
+
+    if not suites:
+        print("✅ No test suites affected by the changes")
+        return 0
+
+    if jobs > 1:
+        return env.GodotRunTestsSharded(jobs=jobs, suites=suites)
+    return env.GodotRunTests(suites=suites)
+
+# Initialize test impact analysis
+setup_test_impact(env)
+
+print("✅ Test impact module loaded")
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Test Results Module - SCons Build System
+Persistent per-suite and per-test results parsed from gdUnit4 JUnit reports
+"""
+
+import os
+import sqlite3
+import statistics
+import subprocess
+import time
+import xml.etree.ElementTree as ET
+from SCons.Script import *
+
+# Import the environment
+Import('env')
+
+# Number of previous runs used for regression and flakiness checks
+HISTORY_RUNS = 10
+
+# A test counts as regressed when it is this much slower than its history median
+REGRESSION_RATIO = 1.5
+REGRESSION_MIN_SECONDS = 0.1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    test_filter TEXT NOT NULL,
+    git_revision TEXT,
+    passed INTEGER NOT NULL,
+    crashed INTEGER NOT NULL,
+    seconds REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS suites (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    suite TEXT NOT NULL,
+    tests INTEGER NOT NULL,
+    failures INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    skipped INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    crashed INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    suite TEXT NOT NULL,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    message TEXT
+);
+CREATE INDEX IF NOT EXISTS tests_by_name ON tests(suite, name);
+CREATE INDEX IF NOT EXISTS suites_by_name ON suites(suite);
+"""
+
+def setup_test_results(env):
+    """Setup test results database functions"""
+
+    env['TEST_RESULTS_DB'] = env['TEMP_DIR'].File('test_results.sqlite')
+
+    # Add test results functions to environment
+    env.AddMethod(record_test_run, "RecordTestRun")
+    env.AddMethod(latest_suite_durations, "TestSuiteDurations")
+    env.AddMethod(show_test_stats, "ShowTestStats")
+
+def open_results_db(env):
+    """Open (and create if needed) the local SQLite results store"""
+    db_path = str(env['TEST_RESULTS_DB'].abspath)
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    connection = sqlite3.connect(db_path)
+    connection.executescript(SCHEMA)
+    return connection
+
+def current_git_revision(project_path):
+    """Best-effort git revision of the working tree"""
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=project_path,
+                                capture_output=True, text=True, timeout=5)
+        return result.stdout.strip() or None
+    except Exception:
+        return None
+
+def suite_paths_by_name(project_path):
+    """Map gdUnit4 suite names (file stems) to their res-relative paths"""
+    paths = {}
+    for root, dirs, files in os.walk(os.path.join(project_path, 'test')):
+        for file in files:
+            if file.startswith('test_') and file.endswith('.gd'):
+                relative_path = os.path.relpath(os.path.join(root, file), project_path)
+                paths[os.path.splitext(file)[0]] = relative_path.replace(os.sep, '/')
+    return paths
+
+def parse_report_testcases(report_paths):
+    """Parse JUnit XML files into (suites, tests) row dictionaries"""
+    suites = []
+    tests = []
+
+    for report_path in report_paths:
+        try:
+            root = ET.parse(report_path).getroot()
+        except (OSError, ET.ParseError):
+            continue
+
+        for testsuite in root.iter('testsuite'):
+            suite_name = testsuite.get('name', '')
+            suites.append({
+                'suite': suite_name,
+                'tests': int(testsuite.get('tests', 0)),
+                'failures': int(testsuite.get('failures', 0)),
+                'errors': int(testsuite.get('errors', 0)),
+                'skipped': int(testsuite.get('skipped', 0)),
+                'seconds': float(testsuite.get('time', 0.0))
+            })
+            for testcase in testsuite.iter('testcase'):
+                status = 'passed'
+                message = None
+                for outcome in ('failure', 'error', 'skipped'):
+                    element = testcase.find(outcome)
+                    if element is not None:
+                        status = 'failed' if outcome == 'failure' else outcome
+                        message = element.get('message') or (element.text or '').strip()[:500]
+                        break
+                tests.append({
+                    'suite': suite_name,
+                    'name': testcase.get('name', ''),
+                    'status': status,
+                    'seconds': float(testcase.get('time', 0.0)),
+                    'message': message
+                })
+
+    return suites, tests
+
+def record_test_run(env, report_paths, mode, test_filter="", passed=False, seconds=0.0,
+                    crashed_suites=()):
+    """Store one test run, its suites and its test cases in the results database
+
+    `crashed_suites` lists suite paths that were scheduled but never reported back
+    (for example because their Godot process died); they are recorded as crashed.
+    """
+    project_path = str(env['PROJECT_DIR'].abspath)
+    paths = suite_paths_by_name(project_path)
+    suites, tests = parse_report_testcases(report_paths)
+
+    connection = open_results_db(env)
+    try:
+        with connection:
+            cursor = connection.execute(
+                "INSERT INTO runs (started_at, mode, test_filter, git_revision, passed, crashed, seconds) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(time.time() - seconds)),
+                 mode, test_filter, current_git_revision(project_path),
+                 int(passed), int(bool(crashed_suites)), seconds)
+            )
+            run_id = cursor.lastrowid
+
+            for suite in suites:
+                connection.execute(
+                    "INSERT INTO suites VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+                    (run_id, paths.get(suite['suite'], suite['suite']), suite['tests'],
+                     suite['failures'], suite['errors'], suite['skipped'], suite['seconds'])
+                )
+            for suite_path in crashed_suites:
+                connection.execute(
+                    "INSERT INTO suites VALUES (?, ?, 0, 0, 1, 0, 0.0, 1)", (run_id, suite_path)
+                )
+            for test in tests:
+                connection.execute(
+                    "INSERT INTO tests VALUES (?, ?, ?, ?, ?, ?)",
+                    (run_id, paths.get(test['suite'], test['suite']), test['name'],
+                     test['status'], test['seconds'], test['message'])
+                )
+    finally:
+        connection.close()
+
+    print(f"🗄️  Recorded {len(suites)} suites / {len(tests)} tests in {env['TEST_RESULTS_DB']}")
+    return run_id
+
+def latest_suite_durations(env):
+    """Most recent recorded duration of every suite that completed (path -> seconds)"""
+    if not os.path.exists(str(env['TEST_RESULTS_DB'].abspath)):
+        return {}
+
+    connection = open_results_db(env)
+    try:
+        rows = connection.execute(
+            "SELECT suite, seconds FROM suites WHERE crashed = 0 ORDER BY run_id"
+        ).fetchall()
+    finally:
+        connection.close()
+
+    return {suite: seconds for suite, seconds in rows}
+
+def show_test_stats(env, history_runs=HISTORY_RUNS):
+    """Print slowest tests, duration regressions and flaky tests from recorded runs"""
+    if not os.path.exists(str(env['TEST_RESULTS_DB'].abspath)):
+        print("❌ No recorded test runs yet - run 'scons test' first")
+        return 1
+
+    connection = open_results_db(env)
+    try:
+        run_ids = [row[0] for row in connection.execute(
+            "SELECT id FROM runs ORDER BY id DESC LIMIT ?", (history_runs + 1,)
+        )]
+        if not run_ids:
+            print("❌ No recorded test runs yet - run 'scons test' first")
+            return 1
+
+        latest_run, previous_runs = run_ids[0], run_ids[1:]
+        latest = connection.execute(
+            "SELECT suite, name, status, seconds FROM tests WHERE run_id = ?", (latest_run,)
+        ).fetchall()
+
+        history = {}
+        statuses = {}
+        placeholders = ','.join('?' * len(run_ids))
+        for suite, name, status, seconds, run_id in connection.execute(
+            f"SELECT suite, name, status, seconds, run_id FROM tests WHERE run_id IN ({placeholders})",
+            run_ids
+        ):
+            statuses.setdefault((suite, name), set()).add(status)
+            if run_id != latest_run and status == 'passed':
+                history.setdefault((suite, name), []).append(seconds)
+
+        crashed_suites = connection.execute(
+            f"SELECT suite, COUNT(*) FROM suites WHERE crashed = 1 AND run_id IN ({placeholders}) "
+            "GROUP BY suite ORDER BY COUNT(*) DESC", run_ids
+        ).fetchall()
+    finally:
+        connection.close()
+
+    print(f"📊 Test statistics (latest run #{latest_run}, {len(previous_runs)} previous runs)")
+
+    print("\n🐢 Slowest tests:")
+    for suite, name, status, seconds in sorted(latest, key=lambda row: row[3], reverse=True)[:10]:
+        print(f"  {seconds:>8.2f}s  {suite}::{name}")
+
+    print("\n📈 Duration regressions:")
+    regressions = []
+    for suite, name, status, seconds in latest:
+        previous = history.get((suite, name))
+        if not previous:
+            continue
+        baseline = statistics.median(previous)
+        if seconds > baseline * REGRESSION_RATIO and seconds - baseline > REGRESSION_MIN_SECONDS:
+            regressions.append((seconds - baseline, suite, name, baseline, seconds))
+    for delta, suite, name, baseline, seconds in sorted(regressions, reverse=True):
+        print(f"  +{delta:>7.2f}s  {suite}::{name} ({baseline:.2f}s -> {seconds:.2f}s)")
+    if not regressions:
+        print("  none")
+
+    print("\n🎲 Flaky tests (passed and failed within the window):")
+    flaky = sorted(key for key, seen in statuses.items()
+                   if 'passed' in seen and ({'failed', 'error'} & seen))
+    for suite, name in flaky:
+        print(f"  {suite}::{name}")
+    if not flaky:
+        print("  none")
+
+    if crashed_suites:
+        print("\n💥 Crashed suites:")
+        for suite, count in crashed_suites:
+            print(f"  {count:>3}x  {suite}")
+
+    return 0
+
+# Initialize test results database
+setup_test_results(env)
+
+print("✅ Test results module loaded")
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Test Runner Module - SCons Build System
+Sharded, parallel gdUnit4 execution balanced by recorded suite durations
+"""
+
+import os
+import heapq
+import shutil
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from SCons.Script import *
+
+# Import the environment
+Import('env')
+
+# Suite duration assumed for suites that have never been timed
+DEFAULT_SUITE_SECONDS = 5.0
+
+def setup_test_runner(env):
+    """Setup sharded test runner functions"""
+
+    env['TEST_SHARDS_DIR'] = env['TEMP_DIR'].Dir('test_shards')
+
+    # Add test runner functions to environment
+    env.AddMethod(run_sharded_tests, "GodotRunTestsSharded")
+
+def discover_test_suites(project_path, test_filter=""):
+    """Find all enabled gdUnit4 suites (test_*.gd) under the filter directory"""
+    search_root = os.path.join(project_path, test_filter if test_filter else 'test')
+    suites = []
+
+    for root, dirs, files in os.walk(search_root):
+        dirs.sort()
+        for file in sorted(files):
+            if file.startswith('test_') and file.endswith('.gd'):
+                suite_path = os.path.join(root, file)
+                suites.append(os.path.relpath(suite_path, project_path).replace(os.sep, '/'))
+
+    return suites
+
+def balance_suites(suites, timings, shard_count):
+    """Split suites into shards using longest-processing-time-first scheduling"""
+    known = [timings[s] for s in suites if s in timings]
+    fallback = sorted(known)[len(known) // 2] if known else DEFAULT_SUITE_SECONDS
+
+    shards = [[] for _ in range(shard_count)]
+    loads = [(0.0, index) for index in range(shard_count)]
+    heapq.heapify(loads)
+
+    for suite in sorted(suites, key=lambda s: timings.get(s, fallback), reverse=True):
+        load, index = heapq.heappop(loads)
+        shards[index].append(suite)
+        heapq.heappush(loads, (load + timings.get(suite, fallback), index))
+
+    return [shard for shard in shards if shard]
+
+def parse_junit_report(report_dir):
+    """Return (suite results, testsuite elements, report files) from gdUnit4 JUnit XML reports"""
+    suites = {}
+    elements = []
+    report_files = []
+
+    for root, dirs, files in os.walk(report_dir):
+        for file in files:
+            if file != 'results.xml':
+                continue
+            try:
+                tree = ET.parse(os.path.join(root, file))
+            except ET.ParseError:
+                continue
+            report_files.append(os.path.join(root, file))
+            for testsuite in tree.getroot().iter('testsuite'):
+                elements.append(testsuite)
+                suites[testsuite.get('name', '')] = {
+                    'tests': int(testsuite.get('tests', 0)),
+                    'failures': int(testsuite.get('failures', 0)),
+                    'errors': int(testsuite.get('errors', 0)),
+                    'seconds': float(testsuite.get('time', 0.0))
+                }
+
+    return suites, elements, report_files
+
+def run_shard(env, index, suites):
+    """Run one shard of suites in its own headless Godot process"""
+    project_path = str(env['PROJECT_DIR'])
+    shard_dir = os.path.join(str(env['TEST_SHARDS_DIR'].abspath), f"shard_{index}")
+    report_dir = os.path.join(shard_dir, 'reports')
+    log_path = os.path.join(shard_dir, 'output.log')
+    os.makedirs(shard_dir, exist_ok=True)
+
+    cmd = [
+        env['GODOT_EXECUTABLE'],
+        '--path', project_path,
+        '--headless',
+        '-s', 'addons/gdUnit4/bin/GdUnitCmdTool.gd'
+    ]
+    for suite in suites:
+        cmd.extend(['--add', suite])
+    cmd.extend(['--continue', '--ignoreHeadlessMode', '-rd', report_dir])
+
+    # Clear reports left by a previous run so only this shard's results are merged
+    if os.path.isdir(report_dir):
+        shutil.rmtree(report_dir)
+
+    result = env.RunGodotProcess(cmd, timeout=600, echo_prefix=f"   [shard {index}] ",
+                                 log_path=log_path, markers={'crashed': env['GODOT_CRASH_MARKER']},
+                                 span=f"test shard {index}")
+    returncode = result['returncode']
+
+    suite_results, elements, report_files = parse_junit_report(report_dir)
+    failures = sum(r['failures'] + r['errors'] for r in suite_results.values())
+    crashed = returncode != 0 and (returncode is None or bool(result['markers']['crashed']))
+
+    # Every scheduled suite must report back, even on a clean exit; given that,
+    # a crash on shutdown is tolerated
+    missing = [s for s in suites if os.path.splitext(os.path.basename(s))[0] not in suite_results]
+    passed = failures == 0 and not missing
+
+    return {
+        'shard': index,
+        'suites': suites,
+        'suite_results': suite_results,
+        'elements': elements,
+        'report_files': report_files,
+        'missing': missing,
+        'passed': passed,
+        'crashed': crashed,
+        'returncode': returncode,
+        'seconds': round(result['seconds'], 2),
+        'log': log_path
+    }
+
+def write_merged_report(env, shard_results):
+    """Merge every shard's JUnit testsuites into a single results.xml"""
+    reports_dir = os.path.join(str(env['PROJECT_DIR'].abspath), 'reports', 'sharded')
+    os.makedirs(reports_dir, exist_ok=True)
+
+    merged = ET.Element('testsuites', name='continuum')
+    totals = {'tests': 0, 'failures': 0, 'errors': 0}
+    for shard in shard_results:
+        for element in shard['elements']:
+            merged.append(element)
+            for key in totals:
+                totals[key] += int(element.get(key, 0))
+    for key, value in totals.items():
+        merged.set(key, str(value))
+
+    report_path = os.path.join(reports_dir, 'results.xml')
+    ET.ElementTree(merged).write(report_path, encoding='utf-8', xml_declaration=True)
+    return report_path
+
+def run_sharded_tests(env, test_filter="", jobs=2, suites=None):
+    """Run test suites across `jobs` concurrent Godot processes and merge the results
+
+    `suites` optionally replaces suite discovery with an explicit list of suite paths.
+    """
+    project_path = str(env['PROJECT_DIR'].abspath)
+
+    print(f"🧪 Running Godot test suite in {jobs} shards...")
+
+    if env.EnsureTestDependencies() != 0:
+        print("❌ Cannot run tests: missing dependencies")
+        return 1
+
+    if env.GodotImportAssets() != 0:
+        print("⚠️ Asset import failed, running tests anyway")
+
+    if suites is None:
+        suites = discover_test_suites(project_path, test_filter)
+    if not suites:
+        print("❌ No test suites found")
+        return 1
+
+    timings = env.TestSuiteDurations()
+    shards = balance_suites(suites, timings, jobs)
+    for index, shard in enumerate(shards):
+        estimate = sum(timings.get(s, DEFAULT_SUITE_SECONDS) for s in shard)
+        print(f"   Shard {index}: {len(shard)} suites (~{estimate:.1f}s)")
+
+    with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+        shard_results = list(pool.map(lambda args: run_shard(env, *args), enumerate(shards)))
+
+    passed = all(shard['passed'] for shard in shard_results)
+
+    # Record per-suite and per-test results; durations feed the next balancing pass
+    env.RecordTestRun(
+        [path for shard in shard_results for path in shard['report_files']],
+        mode=f"sharded-{jobs}", test_filter=test_filter, passed=passed,
+        seconds=max(shard['seconds'] for shard in shard_results),
+        crashed_suites=[s for shard in shard_results if not shard['passed'] for s in shard['missing']]
+    )
+
+    report_path = write_merged_report(env, shard_results)
+
+    print("\n📊 Shard Summary:")
+    print("=" * 60)
+    for shard in shard_results:
+        status = "✅ PASS" if shard['passed'] else ("💥 CRASH" if shard['crashed'] else "❌ FAIL")
+        print(f"  Shard {shard['shard']:<3} {len(shard['suites']):>3} suites  {status:<9} {shard['seconds']:>8.2f}s")
+        if not shard['passed']:
+            for suite in shard['suites']:
+                print(f"      - {suite}{'  (not reported)' if suite in shard['missing'] else ''}")
+            print(f"      log: {shard['log']}")
+    print("=" * 60)
+    print(f"📊 Merged report: {report_path}")
+
+    if passed:
+        print("✅ All tests passed")
+        return 0
+
+    print("❌ Some tests failed")
+    return 1
+
+# Initialize test runner
+setup_test_runner(env)
+
+print("✅ Test runner module loaded")
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Wave Model - SCons Build System
+Seeded model of EnemyManager wave progression, run by wave_sim.py
+
+Kept as a plain module (not loaded with SConscript) so that process pool
+workers can import it. Each run replays the Game scene's WaveTimer and
+EnemySpawnTimer, the formations, enemy movement, firing and drone spawning,
+and counts live enemies, enemy bullets and nodes in fixed time bins. The
+player never destroys anything, so the counts are an upper bound.
+"""
+
+import math
+import random
+
+# project.godot viewport and Game.gd player spawn point (the model player never moves)
+VIEWPORT_WIDTH = 720.0
+VIEWPORT_HEIGHT = 1280.0
+PLAYER_POSITION = (360.0, 1100.0)
+
+# EnemyManager.spawn_enemy() spawn line and x range
+SPAWN_Y = -50.0
+SPAWN_X_MIN = 50.0
+SPAWN_X_MAX = 750.0
+
+# Enemy.check_off_screen_cleanup(): margin, grace period and distance limit
+CLEANUP_MARGIN = 50.0
+CLEANUP_SECONDS = 3.0
+CLEANUP_DISTANCE = 500.0
+
+# Enemy timers: ShootTimer starts at its scene wait_time, then Enemy._ready() picks a random
+# interval that replaces the fire_rate one set by setup_from_type_data()
+SHOOT_FIRST_SECONDS = 2.0
+SHOOT_INTERVAL_RANGE = (1.8, 2.5)
+STOP_AND_SHOOT_PHASE = 2.0
+DRONE_INTERVAL = 2.0
+
+# EnemyBullet speed and VisibleOnScreenNotifier2D half extent
+BULLET_SPEED = 400.0
+BULLET_NOTIFIER_EXTENT = 10.0
+
+# Resolution of the live-count timeline
+BIN_SECONDS = 0.1
+
+_config = None
+
+def init_worker(config):
+    """Process pool initializer: keep the shared run configuration in the worker"""
+    global _config
+    _config = config
+
+def wave_timeouts(waves):
+    """WaveTimer timeouts that start waves 2..waves+1
+
+    A Timer re-arms with its current wait_time before emitting timeout, so the
+    wait_time set by advance_wave() only applies from the cycle after next.
+    """
+    timeouts = []
+    next_time = wait = 10.0
+    for wave in range(2, waves + 2):
+        timeouts.append(next_time)
+        next_time += wait
+        wait = max(3.0, 10.0 - wave * 0.2)
+    return timeouts
+
+def formation_spawns(rng, wave, enemies_per_wave=4):
+    """(delay, x_offset, forced type) spawns of one EnemyManager.spawn_wave() call"""
+    formation = rng.randrange(3)
+    spawns = []
+    if formation == 0:
+        count = min(enemies_per_wave + min(int(math.log(wave + 1) * 3), 10), 20)
+        for i in range(count):
+            spawns.append((max(0.1, i * 0.15), 400 - 200 + i * 40, ''))
+    elif formation == 1:
+        count = min(enemies_per_wave + min(int(math.log(wave + 1) * 3), 10), 20)
+        for i in range(count):
+            spawns.append((max(0.05, i * 0.08), (i - count // 2) * 60, ''))
+    else:
+        count = min(enemies_per_wave + min(int(math.log(wave + 1) * 4), 15), 25)
+        spawns.extend((0.0, 0, '') for _ in range(count))
+        if wave >= 15 and rng.random() < min(0.3 + (wave - 15) * 0.02, 0.8):
+            spawns.append((0.0, 0, 'fortress_ship'))
+        if wave >= 12 and rng.random() < min(0.2 + (wave - 12) * 0.02, 0.6):
+            spawns.append((0.0, 0, 'support_carrier'))
+    return spawns
+
+def pick_type(rng, bands, wave):
+    """Weighted type for a wave, like EnemySpawnTable.pick_type()"""
+    entries = bands[0][1]
+    for start_wave, band_entries in bands:
+        if start_wave > wave:
+            break
+        entries = band_entries
+    if not entries:
+        return 'scout_fighter'
+    roll = rng.randrange(entries[-1][1])
+    for type_name, cumulative in entries:
+        if roll < cumulative:
+            return type_name
+    return entries[-1][0]
+
+def schedule_spawns(rng, config):
+    """Every (time, x, type, wave) spawned by the timers, in time order"""
+    waves = config['waves']
+    timeouts = wave_timeouts(waves)
+    end_time = timeouts[-1]
+
+    spawns = []
+    wave = 1
+    next_spawn, spawn_wait = 1.3, 1.3
+    for wave_time in timeouts + [float('inf')]:
+        # EnemySpawnTimer timeouts before the next wave: spawn_random_enemies()
+        while next_spawn < min(wave_time, end_time):
+            now = next_spawn
+            next_spawn += spawn_wait
+            count = 1
+            if rng.random() < 0.5:
+                count = rng.randint(2, min(5, 2 + wave // 2))
+            for i in range(count):
+                spawns.append((now, i * 60, '', wave))
+        if wave_time >= end_time:
+            break
+
+        # advance_wave(): next wave, a formation, then a shorter spawn interval
+        wave += 1
+        for delay, x_offset, forced_type in formation_spawns(rng, wave):
+            spawns.append((wave_time + delay, x_offset, forced_type, wave))
+        spawn_wait = max(0.5, 2.0 * (1.0 - min(wave * 0.01, 0.5)))
+
+    resolved = []
+    for spawn_time, x_offset, forced_type, spawn_wave in sorted(spawns, key=lambda spawn: spawn[0]):
+        x = min(max(rng.uniform(SPAWN_X_MIN, SPAWN_X_MAX) + x_offset, SPAWN_X_MIN), SPAWN_X_MAX)
+        type_name = forced_type or pick_type(rng, config['bands'], spawn_wave)
+        resolved.append((spawn_time, x, type_name, spawn_wave))
+    return timeouts, resolved
+
+def ray_box_exit(x, y, dx, dy, left, top, right, bottom):
+    """(enter, exit) distances of a ray through a box, or None when the ray misses it"""
+    enter, leave = -math.inf, math.inf
+    for origin, direction, low, high in ((x, dx, left, right), (y, dy, top, bottom)):
+        if abs(direction) < 1e-9:
+            if origin < low or origin > high:
+                return None
+            continue
+        near, far = (low - origin) / direction, (high - origin) / direction
+        if near > far:
+            near, far = far, near
+        enter, leave = max(enter, near), min(leave, far)
+    if leave < max(enter, 0.0):
+        return None
+    return enter, leave
+
+def bullet_lifetime(x, y, dx, dy):
+    """Seconds until an enemy bullet leaves the screen, or None if it never appears on it
+
+    EnemyBullet frees itself on screen_exited, which only fires after the
+    notifier has been on screen; bullets that never enter it are never freed.
+    """
+    extent = BULLET_NOTIFIER_EXTENT
+    span = ray_box_exit(x, y, dx, dy, -extent, -extent, VIEWPORT_WIDTH + extent, VIEWPORT_HEIGHT + extent)
+    if span is None:
+        return None
+    return span[1] / BULLET_SPEED
+
+def rotated(dx, dy, degrees):
+    """Vector2.rotated() in degrees"""
+    angle = math.radians(degrees)
+    cos, sin = math.cos(angle), math.sin(angle)
+    return dx * cos - dy * sin, dx * sin + dy * cos
+
+def toward_player(x, y):
+    """Unit vector from a position to the player"""
+    dx, dy = PLAYER_POSITION[0] - x, PLAYER_POSITION[1] - y
+    length = math.hypot(dx, dy) or 1.0
+    return dx / length, dy / length
+
+def shot_directions(rng, enemy_type, x, y):
+    """(x, y, dx, dy) of the bullets one Enemy.shoot() call fires; tracking bullets count as aimed"""
+    weapon = enemy_type['weapon_type']
+    if weapon in ('single_shot', 'rapid_fire'):
+        return [single_shot(rng, enemy_type, x, y)]
+    if weapon == 'spread_shot':
+        count = 5 if enemy_type['name'].startswith('Elite') else 3
+        bullets = []
+        for i in range(count):
+            if count == 5 and i == count // 2 and rng.random() < 0.7:
+                bullets.append((x, y + 20, *toward_player(x, y + 20)))
+            elif rng.random() < 0.5:
+                bullets.append((x, y + 20, *rotated(*toward_player(x, y), -20 + i * (40.0 / count))))
+            else:
+                bullets.append((x, y + 20, *rotated(0.0, 1.0, -30 + i * (60.0 / count))))
+        return bullets
+    if weapon == 'multi_directional':
+        bullets = []
+        for i in range(8):
+            if i % 2 == 0:
+                bullets.append((x, y, *rotated(*toward_player(x, y), (i // 2 - 2) * 15)))
+            else:
+                bullets.append((x, y, *rotated(0.0, 1.0, i * 45)))
+        return bullets
+    return []
+
+def single_shot(rng, enemy_type, x, y):
+    """Enemy.fire_single_shot(): elites track 25% of the time, others aim 35% of the time"""
+    elite = enemy_type['name'].startswith('Elite') or enemy_type['name'] == 'Fortress Ship'
+    if (elite and rng.random() < 0.25) or rng.random() < 0.35:
+        return (x, y + 20, *toward_player(x, y + 20))
+    return (x, y + 20, 0.0, 1.0)
+
+def is_on_screen(x, y):
+    """Enemy.is_on_screen(): no side margin, 50px above and below"""
+    return 0.0 < x < VIEWPORT_WIDTH and -CLEANUP_MARGIN < y < VIEWPORT_HEIGHT + CLEANUP_MARGIN
+
+def enemy_path(enemy_type, x0, y0, speed):
+    """(position(t), cleanup time) of one enemy from its spawn point"""
+    pattern = enemy_type['movement_pattern']
+    dx, dy = toward_player(x0, y0) if pattern == 'dive' else (0.0, 1.0)
+
+    if pattern == 'stop_and_shoot':
+        phase = STOP_AND_SHOOT_PHASE
+        def travelled(t):
+            return speed * (phase * (t // (2 * phase)) + min(t % (2 * phase), phase))
+        def time_to_travel(distance):
+            moving = distance / speed
+            return 2 * phase * (moving // phase) + moving % phase
+    else:
+        def travelled(t):
+            return speed * t
+        def time_to_travel(distance):
+            return distance / speed
+
+    if pattern == 'zigzag':
+        def position(t):
+            return x0 + math.sin(t * 3) * 100, y0 + dy * travelled(t)
+    else:
+        def position(t):
+            distance = travelled(t)
+            return x0 + dx * distance, y0 + dy * distance
+
+    # Off screen for CLEANUP_SECONDS, or CLEANUP_DISTANCE past the viewport, whichever comes first
+    margin, far = CLEANUP_MARGIN, CLEANUP_DISTANCE
+    off_screen = ray_box_exit(x0, y0, dx, dy, -margin, -margin, VIEWPORT_WIDTH + margin, VIEWPORT_HEIGHT + margin)
+    too_far = ray_box_exit(x0, y0, dx, dy, -far, -far, VIEWPORT_WIDTH + far, VIEWPORT_HEIGHT + far)
+    cleanup = math.inf
+    if off_screen:
+        cleanup = time_to_travel(max(off_screen[1], 0.0)) + CLEANUP_SECONDS
+    if too_far:
+        cleanup = min(cleanup, time_to_travel(too_far[1]))
+    return position, cleanup
+
+def simulate_run(seed, config=None):
+    """Peak live enemies, bullets, drones and nodes per wave for one seeded game
+
+    config holds 'waves', 'bands' (see assets.build_spawn_bands), 'types'
+    (per type: name, movement_pattern, weapon_type, base_speed,
+    spawns_enemies, spawned_enemy_type, node_cost, max_simultaneous),
+    'bullet_nodes' and 'base_nodes'.
+    """
+    config = config or _config
+    rng = random.Random(seed)
+    types = config['types']
+    timeouts, spawns = schedule_spawns(rng, config)
+    end_time = timeouts[-1]
+    bins = int(end_time / BIN_SECONDS) + 2
+
+    # Difference arrays of live counts; a slot is +1 from birth until death
+    enemies = [0] * bins
+    drones = [0] * bins
+    bullets = [0] * bins
+    nodes = [0] * bins
+    limited = {name: [0] * bins for name, data in types.items() if data['max_simultaneous'] > 0}
+    bullet_nodes = config['bullet_nodes']
+    leaked_bullets = 0
+    total_bullets = 0
+
+    def live(counts, start, end, amount=1):
+        first = int(start / BIN_SECONDS)
+        if first >= bins:
+            return
+        counts[first] += amount
+        last = int(end / BIN_SECONDS) if end < end_time else bins
+        if last < bins:
+            counts[last] -= amount
+
+    def fire(time, bullet_list):
+        nonlocal leaked_bullets, total_bullets
+        for bx, by, dx, dy in bullet_list:
+            total_bullets += 1
+            lifetime = bullet_lifetime(bx, by, dx, dy)
+            if lifetime is None:
+                leaked_bullets += 1
+                lifetime = math.inf
+            live(bullets, time, time + lifetime)
+            live(nodes, time, time + lifetime, bullet_nodes)
+
+    pending = [(spawn_time, x, SPAWN_Y, type_name, wave, False) for spawn_time, x, type_name, wave in spawns]
+    spawned = 0
+    while pending:
+        spawn_time, x0, y0, type_name, wave, is_drone = pending.pop()
+        if spawn_time >= end_time:
+            continue
+        enemy_type = types[type_name]
+        spawned += 1
+        speed = enemy_type['base_speed'] + min(math.log(wave + 1) * 20, 100)
+        position, cleanup = enemy_path(enemy_type, x0, y0, speed)
+        death = spawn_time + cleanup
+        live(enemies, spawn_time, death)
+        live(nodes, spawn_time, death, enemy_type['node_cost'])
+        if is_drone:
+            live(drones, spawn_time, death)
+        if type_name in limited:
+            live(limited[type_name], spawn_time, death)
+
+        # ShootTimer: first timeout from the scene, then the interval _ready() picked
+        interval = rng.uniform(*SHOOT_INTERVAL_RANGE)
+        t = SHOOT_FIRST_SECONDS
+        while t < cleanup and spawn_time + t < end_time:
+            x, y = position(t)
+            if is_on_screen(x, y):
+                fire(spawn_time + t, shot_directions(rng, enemy_type, x, y))
+            t += interval
+
+        # stop_and_shoot: five single shots 0.1s apart each time the enemy stops
+        if enemy_type['movement_pattern'] == 'stop_and_shoot':
+            t = STOP_AND_SHOOT_PHASE
+            while t < cleanup and spawn_time + t < end_time:
+                for shot in range(5):
+                    x, y = position(t + shot * 0.1)
+                    if is_on_screen(x, y):
+                        fire(spawn_time + t + shot * 0.1, [single_shot(rng, enemy_type, x, y)])
+                t += 2 * STOP_AND_SHOOT_PHASE
+
+        # Support carriers launch a drone every DRONE_INTERVAL for as long as they live
+        if enemy_type['spawns_enemies'] and enemy_type['spawned_enemy_type'] in types:
+            t = DRONE_INTERVAL
+            while t < cleanup and spawn_time + t < end_time:
+                x, y = position(t)
+                pending.append((spawn_time + t, x + rng.uniform(-50, 50), y + 30,
+                                enemy_type['spawned_enemy_type'], wave, True))
+                t += DRONE_INTERVAL
+
+    # Running totals, reduced to the peak of each wave's time window
+    wave_ends = [int(t / BIN_SECONDS) for t in timeouts]
+    peaks = {'enemies': [], 'bullets': [], 'drones': [], 'nodes': []}
+    running = {'enemies': 0, 'bullets': 0, 'drones': 0, 'nodes': config['base_nodes']}
+    series = {'enemies': enemies, 'bullets': bullets, 'drones': drones, 'nodes': nodes}
+    wave_peak = dict(running)
+    wave_index = 0
+    for index in range(bins):
+        if wave_index < len(wave_ends) and index >= wave_ends[wave_index]:
+            for key in peaks:
+                peaks[key].append(wave_peak[key])
+            wave_peak = {key: 0 for key in running}
+            wave_index += 1
+            if wave_index == len(wave_ends):
+                break
+        for key, counts in series.items():
+            running[key] += counts[index]
+            if running[key] > wave_peak[key]:
+                wave_peak[key] = running[key]
+
+    type_peaks = {}
+    for type_name, counts in limited.items():
+        total = peak = 0
+        for amount in counts:
+            total += amount
+            peak = max(peak, total)
+        type_peaks[type_name] = peak
+
+    return {
+        'seed': seed,
+        'peaks': peaks,
+        'type_peaks': type_peaks,
+        'spawned': spawned,
+        'bullets_fired': total_bullets,
+        'leaked_bullets': leaked_bullets
+    }
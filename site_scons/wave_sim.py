@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Wave Sim Module - SCons Build System
+Monte Carlo estimate of live enemies, enemy bullets and nodes per wave
+"""
+
+import os
+import re
+import json
+from concurrent.futures import ProcessPoolExecutor
+from SCons.Script import *
+
+# Plain module next to this one, importable by pool workers
+import wave_model
+
+# Import the environment
+Import('env')
+
+# Seeded runs and waves per run (override with sim_runs=N sim_waves=N)
+WAVE_SIM_RUNS = 2000
+WAVE_SIM_WAVES = 30
+WAVE_SIM_SEED = 1337
+
+# Fail validation when the p99 peak node count of a wave exceeds this (node_budget=N)
+WAVE_SIM_NODE_BUDGET = 4000
+WAVE_SIM_BUDGET_PERCENTILE = 99
+
+# Waves shown in the report table; the worst wave is always added
+WAVE_SIM_REPORT_EVERY = 5
+
+# Scenes whose node counts make up the budget
+ENEMY_SCENE = 'scenes/enemies/Enemy.tscn'
+ENEMY_SCRIPT = 'scripts/enemies/Enemy.gd'
+ENEMY_BULLET_SCENE = 'scenes/projectiles/EnemyBullet.tscn'
+GAME_SCENE = 'scenes/main/Game.tscn'
+
+VISUALS_FUNCTION = re.compile(r'^func (setup_\w+_visuals|setup_engine_effects)\(')
+
+def positive_int_argument(name, default):
+    """Read a positive integer command-line argument, exiting with a clear message otherwise"""
+    value = ARGUMENTS.get(name, str(default))
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        print(f"❌ Error: {name} must be a positive integer, got '{value}'")
+        Exit(1)
+    return number
+
+def setup_wave_sim(env):
+    """Setup wave simulation functions"""
+
+    env['WAVE_SIM_RUNS'] = positive_int_argument('sim_runs', WAVE_SIM_RUNS)
+    env['WAVE_SIM_WAVES'] = positive_int_argument('sim_waves', WAVE_SIM_WAVES)
+    env['WAVE_SIM_NODE_BUDGET'] = positive_int_argument('node_budget', WAVE_SIM_NODE_BUDGET)
+    env['WAVE_SIM_REPORT'] = env['TEMP_DIR'].File('wave_sim.json')
+
+    # Add wave simulation functions to environment
+    env.AddMethod(simulate_waves, "SimulateWaves")
+
+def percentile(sorted_samples, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_samples:
+        return 0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_samples))))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+def tres_value(properties, key, default):
+    """A scalar from parse_tres_properties() output as a Python value"""
+    value = properties.get(key)
+    if value is None:
+        return default
+    if value.startswith('"'):
+        return value.strip('"')
+    if value in ('true', 'false'):
+        return value == 'true'
+    try:
+        return float(value) if '.' in value else int(value)
+    except ValueError:
+        return default
+
+def scene_node_count(env, scene_path):
+    """Number of [node] sections in a scene"""
+    return sum(1 for line in env.ProjectFileLines(scene_path) if line.startswith('[node '))
+
+def enemy_visual_nodes(env):
+    """Nodes each Enemy.gd visuals function adds, keyed by function name
+
+    Counted statically: an add_child() inside a loop counts once.
+    """
+    counts = {}
+    function = None
+    for line in env.ProjectFileLines(ENEMY_SCRIPT):
+        match = VISUALS_FUNCTION.match(line)
+        if match:
+            function = match.group(1)
+            counts[function] = 0
+        elif line.startswith('func '):
+            function = None
+        elif function and 'add_child(' in line:
+            counts[function] += 1
+    return counts
+
+def wave_sim_config(env):
+    """Plain-data run configuration for the pool workers, or None if the enemy data is invalid"""
+    enemy_types, bands, issues = env.LoadEnemySpawnData()
+    if issues:
+        print(f"    ❌ Cannot simulate waves, enemy types have {len(issues)} issues:")
+        for issue in issues:
+            print(f"      - {issue}")
+        return None
+
+    enemy_nodes = scene_node_count(env, ENEMY_SCENE)
+    visual_nodes = enemy_visual_nodes(env)
+    types = {}
+    for type_name, enemy_type in enemy_types.items():
+        properties = enemy_type['properties']
+        name = tres_value(properties, 'enemy_name', type_name)
+        visuals = f"setup_{name.lower().replace(' ', '_')}_visuals"
+        types[type_name] = {
+            'name': name,
+            'movement_pattern': tres_value(properties, 'movement_pattern', 'straight'),
+            'weapon_type': tres_value(properties, 'weapon_type', 'single_shot'),
+            'base_speed': float(tres_value(properties, 'base_speed', 150.0)),
+            'max_simultaneous': int(tres_value(properties, 'max_simultaneous', -1)),
+            'spawns_enemies': enemy_type['spawns_enemies'],
+            'spawned_enemy_type': enemy_type['spawned_enemy_type'],
+            'node_cost': enemy_nodes + visual_nodes.get(visuals, 0) + visual_nodes.get('setup_engine_effects', 0)
+        }
+
+    return {
+        'waves': env['WAVE_SIM_WAVES'],
+        'bands': bands,
+        'types': types,
+        'bullet_nodes': scene_node_count(env, ENEMY_BULLET_SCENE),
+        'base_nodes': scene_node_count(env, GAME_SCENE)
+    }
+
+def summarize_wave_runs(runs, waves):
+    """Per-wave p50/p95/p99/max of each peak series across runs"""
+    summary = []
+    for wave_index in range(waves):
+        row = {'wave': wave_index + 1}
+        for key in ('enemies', 'bullets', 'drones', 'nodes'):
+            values = sorted(run['peaks'][key][wave_index] for run in runs)
+            row[key] = {
+                'p50': percentile(values, 50),
+                'p95': percentile(values, 95),
+                'p99': percentile(values, 99),
+                'max': values[-1] if values else 0
+            }
+        summary.append(row)
+    return summary
+
+def simulate_waves(env, runs=None, waves=None, budget=None):
+    """Simulate seeded games in a process pool and fail when the p99 node peak exceeds the budget"""
+    runs = runs or env['WAVE_SIM_RUNS']
+    waves = waves or env['WAVE_SIM_WAVES']
+    budget = budget or env['WAVE_SIM_NODE_BUDGET']
+
+    config = wave_sim_config(env)
+    if config is None:
+        return 1
+    config['waves'] = waves
+
+    workers = env['JOBS'] or os.cpu_count() or 1
+    print(f"    🎲 Simulating {runs} games of {waves} waves on {workers} workers...")
+    seeds = range(WAVE_SIM_SEED, WAVE_SIM_SEED + runs)
+    with env.TraceSpan('wave simulation', 'validation', runs=runs, waves=waves, workers=workers):
+        with ProcessPoolExecutor(max_workers=workers, initializer=wave_model.init_worker,
+                                 initargs=(config,)) as pool:
+            results = list(pool.map(wave_model.simulate_run, seeds, chunksize=max(1, runs // (workers * 8))))
+
+    summary = summarize_wave_runs(results, waves)
+    type_peaks = {}
+    for type_name in sorted(results[0]['type_peaks']):
+        type_peaks[type_name] = percentile(sorted(run['type_peaks'][type_name] for run in results),
+                                           WAVE_SIM_BUDGET_PERCENTILE)
+    leaked_runs = sum(1 for run in results if run['leaked_bullets'])
+
+    report_path = str(env['WAVE_SIM_REPORT'].abspath)
+    os.makedirs(os.path.dirname(report_path), exist_ok=True)
+    with open(report_path, 'w') as f:
+        json.dump({'runs': runs, 'waves': waves, 'seed': WAVE_SIM_SEED, 'node_budget': budget,
+                   'node_costs': {name: data['node_cost'] for name, data in config['types'].items()},
+                   'per_wave': summary, 'type_peaks_p99': type_peaks,
+                   'runs_with_leaked_bullets': leaked_runs}, f, indent=2)
+
+    pct = f"p{WAVE_SIM_BUDGET_PERCENTILE}"
+    worst = max(summary, key=lambda row: row['nodes'][pct])
+    shown = [row for row in summary if row['wave'] == 1 or row['wave'] % WAVE_SIM_REPORT_EVERY == 0]
+    if worst not in shown:
+        shown.append(worst)
+
+    print(f"    {'Wave':>4} {'Enemies p50/p95/p99':>20} {'Bullets p50/p95/p99':>20} "
+          f"{'Drones p99':>10} {'Nodes p99':>9}")
+    for row in shown:
+        enemies, bullets = row['enemies'], row['bullets']
+        print(f"    {row['wave']:>4} {enemies['p50']:>8}/{enemies['p95']:>4}/{enemies['p99']:>4} "
+              f"{bullets['p50']:>8}/{bullets['p95']:>4}/{bullets['p99']:>4} "
+              f"{row['drones']['p99']:>10} {row['nodes']['p99']:>9}")
+
+    for type_name, peak in type_peaks.items():
+        limit = config['types'][type_name]['max_simultaneous']
+        if peak > limit:
+            print(f"    ⚠️  {type_name}: {pct} of {peak} alive at once, max_simultaneous is {limit} (not enforced)")
+    if leaked_runs:
+        print(f"    ⚠️  {leaked_runs}/{runs} games fire bullets that start off screen, never enter it and are never freed")
+
+    print(f"    📊 Report: {report_path}")
+    if worst['nodes'][pct] > budget:
+        print(f"    ❌ Wave {worst['wave']} peaks at {worst['nodes'][pct]} nodes ({pct}), budget is {budget}")
+        return 1
+
+    print(f"    ✅ Peak of {worst['nodes'][pct]} nodes ({pct}, wave {worst['wave']}) within budget of {budget}")
+    return 0
+
+# Initialize wave simulation
+setup_wave_sim(env)
+
+print("✅ Wave sim module loaded")
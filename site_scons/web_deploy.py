@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Web Deploy Module - SCons Build System
+Post-processes the Web export into a cache-friendly, precompressed deploy directory
+"""
+
+import os
+import json
+import time
+import shutil
+import mimetypes
+from concurrent.futures import ProcessPoolExecutor
+from SCons.Script import *
+
+# Plain module next to this one, importable by pool workers
+import web_payload
+
+# Import the environment
+Import('env')
+
+# Hashed files never change under their name; the shell must be revalidated
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+ENTRY_CACHE_CONTROL = 'no-cache'
+
+WEB_CONTENT_TYPES = {'.wasm': 'application/wasm', '.pck': 'application/octet-stream'}
+
+def setup_web_deploy(env):
+    """Setup Web deploy functions"""
+
+    env['WEB_EXPORT_DIR'] = env['BUILD_DIR'].Dir('web')
+    env['WEB_DEPLOY_DIR'] = env['BUILD_DIR'].Dir('web-deploy')
+
+    # Builder: manifest.json target from the exported index.html source
+    env['BUILDERS']['WebDeploy'] = Builder(action=Action(web_deploy_action, None))
+
+    # Add Web deploy functions to environment
+    env.AddMethod(prepare_web_deploy, "PrepareWebDeploy")
+
+def content_type(name):
+    ext = os.path.splitext(name)[1]
+    return WEB_CONTENT_TYPES.get(ext) or mimetypes.guess_type(name)[0] or 'application/octet-stream'
+
+def prepare_web_deploy(env, export_html, deploy_dir, workers=None):
+    """Copy a Web export into deploy_dir with hashed names, rewritten loader references,
+    gzip/brotli variants and manifest.json (names, hashes, sizes, cache headers)"""
+    export_dir = os.path.dirname(export_html)
+    entry = os.path.basename(export_html)
+    print(f"🌐 Preparing Web deploy from {export_dir}...")
+
+    try:
+        renames, config_updates = web_payload.plan_renames(export_dir, entry)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Cannot post-process the Web export: {e}")
+        return 1
+
+    if os.path.exists(deploy_dir):
+        shutil.rmtree(deploy_dir)
+    os.makedirs(deploy_dir)
+    for old, new in renames.items():
+        shutil.copyfile(os.path.join(export_dir, old), os.path.join(deploy_dir, new))
+
+    with open(export_html, 'r', encoding='utf-8') as f:
+        html = web_payload.rewrite_html(f.read(), renames, config_updates)
+    with open(os.path.join(deploy_dir, entry), 'w', encoding='utf-8') as f:
+        f.write(html)
+
+    encodings = web_payload.available_encodings()
+    if 'br' not in encodings:
+        print("⚠️  Brotli not installed - writing gzip variants only (pip install brotli)")
+
+    sources = {new: old for old, new in renames.items()}
+    sources[entry] = entry
+    tasks = [(os.path.join(deploy_dir, name), encoding)
+             for name in sorted(sources) if web_payload.should_compress(os.path.join(deploy_dir, name))
+             for encoding in encodings]
+    workers = workers or env['JOBS'] or os.cpu_count() or 1
+    wall_start = time.perf_counter()
+    with env.TraceSpan('web precompression', 'package', files=len(tasks), workers=workers):
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            variants = list(pool.map(web_payload.compress_variant, tasks))
+    wall_seconds = time.perf_counter() - wall_start
+
+    files = {}
+    for name, source in sources.items():
+        path = os.path.join(deploy_dir, name)
+        files[name] = {
+            'source': source,
+            'bytes': os.path.getsize(path),
+            'sha256': web_payload.file_sha256(path),
+            'content_type': content_type(name),
+            'cache_control': ENTRY_CACHE_CONTROL if name == entry else IMMUTABLE_CACHE_CONTROL,
+            'encodings': {}
+        }
+    compress_seconds = {}
+    for path, encoding, size, seconds in variants:
+        name = os.path.basename(path)
+        compress_seconds[name] = compress_seconds.get(name, 0.0) + seconds
+        if size is not None:
+            files[name]['encodings'][encoding] = {
+                'file': name + web_payload.ENCODING_EXTENSIONS[encoding],
+                'bytes': size
+            }
+
+    manifest = {
+        'entry': entry,
+        'executable': config_updates['executable'],
+        'main_pack': config_updates['mainPack'],
+        'encodings': encodings,
+        'files': dict(sorted(files.items()))
+    }
+    with open(os.path.join(deploy_dir, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    print_web_report(manifest, compress_seconds, wall_seconds, workers)
+    print(f"📁 Web deploy: {deploy_dir} (serve locally: python tools/web_server.py)")
+    return 0
+
+def print_web_report(manifest, compress_seconds, wall_seconds, workers):
+    print("\n📊 Web Payload:")
+    print("=" * 80)
+    print(f"  {'File':<44} {'Raw KB':>9} {'gzip KB':>9} {'br KB':>9} {'CPU s':>7}")
+    raw_total = 0
+    best_total = 0
+    for name, info in manifest['files'].items():
+        encoded = info['encodings']
+        gzip_kb = f"{encoded['gzip']['bytes'] / 1024:.1f}" if 'gzip' in encoded else '-'
+        br_kb = f"{encoded['br']['bytes'] / 1024:.1f}" if 'br' in encoded else '-'
+        print(f"  {name:<44} {info['bytes'] / 1024:>9.1f} {gzip_kb:>9} {br_kb:>9} "
+              f"{compress_seconds.get(name, 0.0):>7.2f}")
+        raw_total += info['bytes']
+        best_total += min([info['bytes']] + [variant['bytes'] for variant in encoded.values()])
+    print("=" * 80)
+    saved = 1.0 - best_total / raw_total if raw_total else 0.0
+    print(f"  First load: {raw_total / 1048576:.2f} MB raw, {best_total / 1048576:.2f} MB "
+          f"with the best encoding ({saved:.0%} smaller)")
+    print(f"  Compression wall-clock: {wall_seconds:.2f}s on {workers} workers")
+
+def web_deploy_action(target, source, env):
+    """Builder action: post-process the exported shell (source) into the manifest's directory (target)"""
+    return prepare_web_deploy(env, source[0].abspath, os.path.dirname(target[0].abspath))
+
+# Initialize Web deploy
+setup_web_deploy(env)
+
+print("✅ Web deploy module loaded")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Web Payload - SCons Build System
+Content-hashed names, loader rewrites and precompressed variants for Web exports
+
+Kept as a plain module so web_deploy.py can run compress_variant() in a
+process pool. Godot's loader derives the engine files (.js, .wasm, audio
+worklets) from GODOT_CONFIG.executable and reads the pack from
+GODOT_CONFIG.mainPack, so those are renamed through the config; everything
+else the HTML shell references is renamed in place.
+"""
+
+import os
+import re
+import gzip
+import json
+import time
+import hashlib
+
+# Brotli is optional: without it only gzip variants are written
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Files the loader finds as <executable><suffix>
+ENGINE_SUFFIXES = ('.js', '.wasm', '.side.wasm', '.worker.js', '.audio.worklet.js', '.audio.position.worklet.js')
+
+# Hex digits of SHA-256 put into hashed names
+HASH_LENGTH = 12
+
+# One-line config object the HTML shell passes to the Engine
+CONFIG_PATTERN = re.compile(r'(const GODOT_CONFIG = )(\{.*?\})(;)')
+
+# Only these are precompressed, and only from this size up
+COMPRESSIBLE_EXTENSIONS = {'.wasm', '.pck', '.js', '.html', '.json', '.svg', '.css', '.txt'}
+COMPRESS_MIN_BYTES = 1024
+
+# Encoding -> variant file extension
+ENCODING_EXTENSIONS = {'br': '.br', 'gzip': '.gz'}
+
+def available_encodings():
+    return ['br', 'gzip'] if brotli else ['gzip']
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def hashed_name(name, digest):
+    """name.ext -> name.<hash>.ext"""
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{digest[:HASH_LENGTH]}{ext}"
+
+def read_godot_config(html):
+    match = CONFIG_PATTERN.search(html)
+    if not match:
+        raise ValueError("no GODOT_CONFIG in the HTML shell")
+    return json.loads(match.group(2))
+
+def plan_renames(export_dir, entry):
+    """Old name -> new name for every exported file except the HTML entry, plus the new config values
+
+    The engine files share one executable name hashed from all of them, so
+    the loader still finds each one by suffix.
+    """
+    with open(os.path.join(export_dir, entry), 'r', encoding='utf-8') as f:
+        config = read_godot_config(f.read())
+    executable = config['executable']
+    names = sorted(name for name in os.listdir(export_dir)
+                   if name != entry and os.path.isfile(os.path.join(export_dir, name)))
+
+    engine_files = [name for name in names if any(name == executable + suffix for suffix in ENGINE_SUFFIXES)]
+    if executable + '.wasm' not in engine_files:
+        raise ValueError(f"{executable}.wasm not found next to {entry}")
+    engine_digest = hashlib.sha256()
+    for name in engine_files:
+        engine_digest.update(name.encode('utf-8'))
+        engine_digest.update(file_sha256(os.path.join(export_dir, name)).encode('ascii'))
+    new_executable = f"{executable}.{engine_digest.hexdigest()[:HASH_LENGTH]}"
+
+    renames = {}
+    for name in names:
+        if name in engine_files:
+            renames[name] = new_executable + name[len(executable):]
+        else:
+            renames[name] = hashed_name(name, file_sha256(os.path.join(export_dir, name)))
+
+    main_pack = config.get('mainPack') or executable + '.pck'
+    return renames, {
+        'executable': new_executable,
+        'mainPack': renames.get(main_pack, main_pack),
+        'fileSizes': {renames.get(name, name): size for name, size in config.get('fileSizes', {}).items()}
+    }
+
+def rewrite_html(html, renames, config_updates):
+    """Point the shell at the renamed files: config values first, then plain references"""
+    match = CONFIG_PATTERN.search(html)
+    config = json.loads(match.group(2))
+    config.update(config_updates)
+    html = html[:match.start(2)] + json.dumps(config, separators=(',', ':')) + html[match.end(2):]
+
+    for old, new in sorted(renames.items(), key=lambda item: -len(item[0])):
+        html = re.sub(r'(?<![\w.-])' + re.escape(old) + r'(?![\w.-])', new, html)
+    return html
+
+def should_compress(path):
+    return os.path.splitext(path)[1] in COMPRESSIBLE_EXTENSIONS and os.path.getsize(path) >= COMPRESS_MIN_BYTES
+
+def compress_variant(task):
+    """Write path.br or path.gz at maximum level; returns (path, encoding, bytes or None, seconds)
+
+    The variant is dropped (None) when it is not smaller than the original.
+    """
+    path, encoding = task
+    start = time.perf_counter()
+    with open(path, 'rb') as f:
+        data = f.read()
+    if encoding == 'br':
+        compressed = brotli.compress(data, quality=11, lgwin=24)
+    else:
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    seconds = time.perf_counter() - start
+
+    if len(compressed) >= len(data):
+        return path, encoding, None, seconds
+    with open(path + ENCODING_EXTENSIONS[encoding], 'wb') as f:
+        f.write(compressed)
+    return path, encoding, len(compressed), seconds
@@ -0,0 +1,187 @@
+extends SceneTree
+## Headless gameplay benchmark driven by `scons bench` (site_scons/bench.py)
+##
+## godot --headless --fixed-fps 60 --path . -s res://test/bench/BenchRunner.gd -- \
+##     --scenario=heavy_waves --frames=1200 --warmup=120 --seed=1337 --output=/abs/result.json
+##
+## Runs the real Game scene with a fixed seed and scripted input, and records
+## per-frame process/physics time, node count and static memory as JSON,
+## plus SoundManager's stream cache and voice pool counters, NodePool's
+## per-pool reuse counters and high-water marks, and EnemyManager's registry
+## counters. enemy_queries also times nearest-enemy lookups every frame through
+## the registry and through a scan of the "enemies" group.
+
+const SCENARIOS = ["heavy_waves", "bombs", "vulcan_max", "chain_max", "enemy_queries"]
+
+# enemy_queries: lookups per frame from a grid of probe points, and their range
+const QUERY_PROBES = 64
+const QUERY_RANGE = 250.0
+
+var scenario = ""
+var frames = 1200
+var warmup = 120
+var bench_seed = 1337
+var output_path = ""
+
+var game: Node
+var frame = 0
+var samples = {"process_ms": [], "physics_ms": [], "nodes": [], "static_memory_mb": []}
+
+func _initialize():
+	var args = parse_user_args()
+	scenario = args.get("scenario", "")
+	frames = int(args.get("frames", str(frames)))
+	warmup = int(args.get("warmup", str(warmup)))
+	bench_seed = int(args.get("seed", str(bench_seed)))
+	output_path = args.get("output", "")
+
+	if not scenario in SCENARIOS or output_path == "":
+		printerr("BenchRunner: usage --scenario=<", ", ".join(SCENARIOS), "> --output=<path>")
+		quit(1)
+		return
+
+	game = load("res://scenes/main/Game.tscn").instantiate()
+	root.add_child(game)
+	current_scene = game
+
+	# Game._ready() calls randomize(); reseed so every run spawns the same enemies
+	seed(bench_seed)
+	setup_scenario()
+	Input.action_press("shoot")
+	print("BenchRunner: ", scenario, " for ", frames, " frames after ", warmup, " warmup frames")
+
+func parse_user_args() -> Dictionary:
+	var args = {}
+	for arg in OS.get_cmdline_user_args():
+		if arg.begins_with("--") and "=" in arg:
+			var parts = arg.substr(2).split("=", true, 1)
+			args[parts[0]] = parts[1]
+	return args
+
+func setup_scenario():
+	match scenario:
+		"heavy_waves":
+			EnemyManager.wave_number = 30
+		"bombs":
+			EnemyManager.wave_number = 20
+			game.bombs = 999
+		"enemy_queries":
+			EnemyManager.wave_number = 30
+			samples["registry_query_ms"] = []
+			samples["group_scan_ms"] = []
+			game.current_player.weapon_type = "chain"
+			game.current_player.weapon_level = 10
+			game.current_player.adjust_fire_rate()
+		"vulcan_max", "chain_max":
+			EnemyManager.wave_number = 10
+			var player = game.current_player
+			player.weapon_type = "vulcan" if scenario == "vulcan_max" else "chain"
+			player.weapon_level = 10
+			player.adjust_fire_rate()
+
+func _process(_delta):
+	frame += 1
+	drive_input()
+	keep_player_alive()
+
+	if frame == warmup:
+		SoundManager.reset_audio_stats()
+		NodePool.reset_pool_stats()
+		EnemyManager.enemy_registry.reset_stats()
+	if frame > warmup:
+		record_frame()
+	if frame >= warmup + frames:
+		write_results()
+		return true
+	return false
+
+func set_action(action: String, pressed: bool):
+	if pressed and not Input.is_action_pressed(action):
+		Input.action_press(action)
+	elif not pressed and Input.is_action_pressed(action):
+		Input.action_release(action)
+
+func drive_input():
+	# Sweep across the screen, changing direction every 90 frames
+	var sweep_right = (frame / 90) % 2 == 0
+	set_action("move_right", sweep_right)
+	set_action("move_left", not sweep_right)
+
+	match scenario:
+		"heavy_waves":
+			if frame % 60 == 0:
+				EnemyManager.spawn_wave()
+		"bombs":
+			if frame % 30 == 0:
+				EnemyManager.spawn_random_enemies()
+			set_action("bomb", frame % 90 == 0)
+		"enemy_queries":
+			if frame % 30 == 0:
+				EnemyManager.spawn_wave()
+		"vulcan_max", "chain_max":
+			if frame % 45 == 0:
+				EnemyManager.spawn_random_enemies()
+
+func keep_player_alive():
+	# Deaths would change what is on screen between runs
+	game.lives = 99
+	if is_instance_valid(game.current_player):
+		game.current_player.invulnerable = true
+
+func record_frame():
+	samples["process_ms"].append(Performance.get_monitor(Performance.TIME_PROCESS) * 1000.0)
+	samples["physics_ms"].append(Performance.get_monitor(Performance.TIME_PHYSICS_PROCESS) * 1000.0)
+	samples["nodes"].append(int(Performance.get_monitor(Performance.OBJECT_NODE_COUNT)))
+	samples["static_memory_mb"].append(Performance.get_monitor(Performance.MEMORY_STATIC) / 1048576.0)
+	if scenario == "enemy_queries":
+		time_enemy_queries()
+
+func probe_point(index: int) -> Vector2:
+	var viewport_size = root.get_visible_rect().size
+	var columns = int(sqrt(QUERY_PROBES))
+	return Vector2((index % columns + 0.5) * viewport_size.x / columns,
+		(index / columns + 0.5) * viewport_size.y / columns)
+
+func scan_nearest_enemy(from_pos: Vector2, max_range: float) -> Node2D:
+	# How PlasmaBullet found chain targets before the registry
+	var nearest_enemy: Node2D = null
+	var nearest_distance = max_range
+	for enemy in get_nodes_in_group("enemies"):
+		var distance = from_pos.distance_to(enemy.global_position)
+		if distance < nearest_distance:
+			nearest_enemy = enemy
+			nearest_distance = distance
+	return nearest_enemy
+
+func time_enemy_queries():
+	var start = Time.get_ticks_usec()
+	for i in QUERY_PROBES:
+		EnemyManager.find_nearest_enemy(probe_point(i), QUERY_RANGE)
+	samples["registry_query_ms"].append((Time.get_ticks_usec() - start) / 1000.0)
+
+	start = Time.get_ticks_usec()
+	for i in QUERY_PROBES:
+		scan_nearest_enemy(probe_point(i), QUERY_RANGE)
+	samples["group_scan_ms"].append((Time.get_ticks_usec() - start) / 1000.0)
+
+func write_results():
+	var result = {
+		"scenario": scenario,
+		"seed": bench_seed,
+		"frames": frames,
+		"warmup": warmup,
+		"godot_version": Engine.get_version_info().string,
+		"physics_ticks_per_second": Engine.physics_ticks_per_second,
+		"samples": samples,
+		"audio": SoundManager.get_audio_stats(),
+		"pools": NodePool.get_pool_stats(),
+		"registry": EnemyManager.get_registry_stats()
+	}
+	var file = FileAccess.open(output_path, FileAccess.WRITE)
+	if file == null:
+		printerr("BenchRunner: cannot write ", output_path)
+		quit(1)
+		return
+	file.store_string(JSON.stringify(result))
+	file.close()
+	print("BenchRunner: wrote ", output_path)
@@ -0,0 +1,265 @@
+extends SceneTree
+## Persistent headless worker for the SCons build (site_scons/godot_daemon.py)
+##
+## Started with: godot --headless --path . -s res://test/tools/BuildDaemon.gd -- --port=N --token=T
+## Accepts one newline-delimited JSON request per connection on 127.0.0.1 and
+## streams back {"output": ...} lines followed by a final {"result": {...}}.
+
+const REQUEST_TIMEOUT_MSEC = 10000
+const WATCHED_EXTENSIONS = ["gd", "tscn", "tres"]
+const VALIDATED_DIRS = ["res://scripts/", "res://scenes/", "res://resources/"]
+
+var server := TCPServer.new()
+var token := ""
+var running := true
+var file_mtimes: Dictionary = {}
+
+func _initialize():
+	var args = parse_user_args()
+	token = args.get("token", "")
+	var port = int(args.get("port", "0"))
+
+	if server.listen(port, "127.0.0.1") != OK:
+		printerr("BuildDaemon: cannot listen on port ", port)
+		quit(1)
+		return
+
+	# Baseline for detecting scripts and scenes edited between requests
+	for path in list_project_files("res://"):
+		file_mtimes[path] = FileAccess.get_modified_time(path)
+
+	print("BuildDaemon: listening on 127.0.0.1:", server.get_local_port())
+	serve()
+
+func parse_user_args() -> Dictionary:
+	var args = {}
+	for arg in OS.get_cmdline_user_args():
+		if arg.begins_with("--") and "=" in arg:
+			var parts = arg.substr(2).split("=", true, 1)
+			args[parts[0]] = parts[1]
+	return args
+
+func serve():
+	while running:
+		if server.is_connection_available():
+			await handle_connection(server.take_connection())
+		await process_frame
+	server.stop()
+	quit(0)
+
+func handle_connection(peer: StreamPeerTCP):
+	var request = await read_request(peer)
+	if request.is_empty() or request.get("token", "") != token:
+		send(peer, {"result": {"code": 1, "error": "invalid request"}})
+		peer.disconnect_from_host()
+		return
+
+	var command = request.get("command", "")
+	var args = request.get("args", {})
+	var result: Dictionary
+	match command:
+		"ping":
+			result = {"code": 0, "version": Engine.get_version_info().string, "pid": OS.get_process_id()}
+		"validate":
+			result = validate_project(peer)
+		"run_tests":
+			result = await run_tests(peer, args.get("suites", []), args.get("report_dir", ""))
+		"shutdown":
+			running = false
+			result = {"code": 0}
+		_:
+			result = {"code": 1, "error": "unknown command: %s" % command}
+
+	send(peer, {"result": result})
+	peer.disconnect_from_host()
+
+func read_request(peer: StreamPeerTCP) -> Dictionary:
+	var buffer = PackedByteArray()
+	var deadline = Time.get_ticks_msec() + REQUEST_TIMEOUT_MSEC
+	while Time.get_ticks_msec() < deadline:
+		peer.poll()
+		if peer.get_status() != StreamPeerTCP.STATUS_CONNECTED:
+			return {}
+		var available = peer.get_available_bytes()
+		if available > 0:
+			buffer.append_array(peer.get_partial_data(available)[1])
+			var newline = buffer.find(10)
+			if newline >= 0:
+				var parsed = JSON.parse_string(buffer.slice(0, newline).get_string_from_utf8())
+				return parsed if parsed is Dictionary else {}
+		await process_frame
+	return {}
+
+func send(peer: StreamPeerTCP, message: Dictionary):
+	peer.put_data((JSON.stringify(message) + "\n").to_utf8_buffer())
+
+func output(peer: StreamPeerTCP, line: String):
+	send(peer, {"output": line})
+
+func list_project_files(dir_path: String) -> Array:
+	"""Scripts, scenes and resources below dir_path, skipping addons and .gdignore'd dirs"""
+	var files = []
+	var dir = DirAccess.open(dir_path)
+	if dir == null or dir.file_exists(".gdignore"):
+		return files
+
+	for sub_dir in dir.get_directories():
+		if not sub_dir.begins_with(".") and dir_path.path_join(sub_dir) != "res://addons":
+			files.append_array(list_project_files(dir_path.path_join(sub_dir)))
+	for file in dir.get_files():
+		if file.get_extension() in WATCHED_EXTENSIONS:
+			files.append(dir_path.path_join(file))
+	return files
+
+func refresh_changed_resources(peer: StreamPeerTCP) -> int:
+	"""Reload scripts and scenes edited since the previous request"""
+	var reloaded = 0
+	for path in list_project_files("res://"):
+		var mtime = FileAccess.get_modified_time(path)
+		if file_mtimes.get(path, -1) != mtime and ResourceLoader.has_cached(path):
+			if path.ends_with(".gd"):
+				var script = load(path)
+				script.source_code = FileAccess.get_file_as_string(path)
+				script.reload(true)
+			else:
+				ResourceLoader.load(path, "", ResourceLoader.CACHE_MODE_REPLACE)
+			reloaded += 1
+		file_mtimes[path] = mtime
+
+	if reloaded > 0:
+		output(peer, "Reloaded %d changed scripts/resources" % reloaded)
+	return reloaded
+
+func validate_project(peer: StreamPeerTCP) -> Dictionary:
+	"""Load every script, scene and resource and report the ones that fail"""
+	refresh_changed_resources(peer)
+
+	var errors = []
+	var checked = 0
+	for path in list_project_files("res://"):
+		if not VALIDATED_DIRS.any(func(prefix): return path.begins_with(prefix)):
+			continue
+		checked += 1
+		var resource = ResourceLoader.load(path, "", ResourceLoader.CACHE_MODE_REPLACE)
+		if resource == null:
+			errors.append("%s: failed to load" % path)
+		elif (resource is Script or resource is PackedScene) and not resource.can_instantiate():
+			errors.append("%s: cannot be instantiated" % path)
+
+	for error in errors:
+		output(peer, error)
+	return {"code": 1 if errors else 0, "checked": checked, "errors": errors}
+
+func global_class(class_name_to_find: String):
+	"""Load a global class script by name (gdUnit4 is optional, so never referenced statically)"""
+	for entry in ProjectSettings.get_global_class_list():
+		if entry["class"] == class_name_to_find:
+			return load(entry["path"])
+	return null
+
+func run_tests(peer: StreamPeerTCP, suite_paths: Array, report_dir: String) -> Dictionary:
+	"""Run gdUnit4 suites in this process and write a JUnit report to report_dir"""
+	var scanner_class = global_class("GdUnitTestSuiteScanner")
+	var executor_class = global_class("GdUnitTestSuiteExecutor")
+	var event_class = global_class("GdUnitEvent")
+	var signals_class = global_class("GdUnitSignals")
+	if scanner_class == null or executor_class == null or event_class == null or signals_class == null:
+		return {"code": 1, "unsupported": true, "error": "gdUnit4 executor API not available"}
+
+	var scanner = scanner_class.new()
+	var executor = executor_class.new()
+	if not scanner.has_method("scan") or not executor.has_method("execute"):
+		return {"code": 1, "unsupported": true, "error": "unsupported gdUnit4 version"}
+
+	refresh_changed_resources(peer)
+
+	var event_types = event_class.get_script_constant_map()
+	var suites = {}
+	var on_event = func(event):
+		var suite = suites.get_or_add(event.suite_name(), {"cases": [], "seconds": 0.0})
+		if event.type() == event_types["TESTCASE_AFTER"]:
+			var status = "passed"
+			if event.is_error():
+				status = "error"
+			elif event.is_failed():
+				status = "failed"
+			elif event.is_skipped():
+				status = "skipped"
+			var messages = []
+			for report in event.reports():
+				messages.append(str(report.message()) if report.has_method("message") else str(report))
+			suite["cases"].append({
+				"name": event.test_name(),
+				"status": status,
+				"seconds": event.elapsed_time() / 1000.0,
+				"message": "\n".join(messages)
+			})
+			if status != "passed" and status != "skipped":
+				output(peer, "FAILED %s::%s" % [event.suite_name(), event.test_name()])
+		elif event.type() == event_types["TESTSUITE_AFTER"]:
+			suite["seconds"] = event.elapsed_time() / 1000.0
+
+	var gdunit_signals = signals_class.instance()
+	gdunit_signals.gdunit_event.connect(on_event)
+
+	var start = Time.get_ticks_msec()
+	for suite_path in suite_paths:
+		var resource_path = suite_path if suite_path.begins_with("res://") else "res://" + suite_path
+		output(peer, "Running %s" % resource_path)
+		for test_suite in scanner.scan(resource_path):
+			await executor.execute(test_suite)
+
+	gdunit_signals.gdunit_event.disconnect(on_event)
+
+	var totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+	for suite in suites.values():
+		for case in suite["cases"]:
+			totals["tests"] += 1
+			match case["status"]:
+				"failed": totals["failures"] += 1
+				"error": totals["errors"] += 1
+				"skipped": totals["skipped"] += 1
+
+	var report_path = write_junit_report(report_dir, suites) if report_dir else ""
+	output(peer, "Total: %d  Failed: %d  Errors: %d" % [totals["tests"], totals["failures"], totals["errors"]])
+	return {
+		"code": 1 if totals["failures"] + totals["errors"] > 0 else 0,
+		"totals": totals,
+		"seconds": (Time.get_ticks_msec() - start) / 1000.0,
+		"report": report_path
+	}
+
+func write_junit_report(report_dir: String, suites: Dictionary) -> String:
+	"""Write results in the gdUnit4 report layout (report_N/results.xml)"""
+	var index = 1
+	while DirAccess.dir_exists_absolute(report_dir.path_join("report_%d" % index)):
+		index += 1
+	var dir_path = report_dir.path_join("report_%d" % index)
+	DirAccess.make_dir_recursive_absolute(dir_path)
+
+	var xml = PackedStringArray(['<?xml version="1.0" encoding="UTF-8"?>', '<testsuites name="continuum">'])
+	for suite_name in suites:
+		var suite = suites[suite_name]
+		var counts = {"failed": 0, "error": 0, "skipped": 0}
+		for case in suite["cases"]:
+			if case["status"] in counts:
+				counts[case["status"]] += 1
+		xml.append('<testsuite name="%s" tests="%d" failures="%d" errors="%d" skipped="%d" time="%.3f">' % [
+			suite_name.xml_escape(true), suite["cases"].size(), counts["failed"], counts["error"],
+			counts["skipped"], suite["seconds"]])
+		for case in suite["cases"]:
+			xml.append('<testcase name="%s" classname="%s" time="%.3f">' % [
+				case["name"].xml_escape(true), suite_name.xml_escape(true), case["seconds"]])
+			match case["status"]:
+				"failed": xml.append('<failure message="%s"/>' % case["message"].xml_escape(true))
+				"error": xml.append('<error message="%s"/>' % case["message"].xml_escape(true))
+				"skipped": xml.append('<skipped/>')
+			xml.append('</testcase>')
+		xml.append('</testsuite>')
+	xml.append('</testsuites>')
+
+	var report_path = dir_path.path_join("results.xml")
+	var file = FileAccess.open(report_path, FileAccess.WRITE)
+	file.store_string("\n".join(xml))
+	file.close()
+	return report_path
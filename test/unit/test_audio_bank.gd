@@ -0,0 +1,70 @@
+extends GdUnitTestSuite
+## Golden test for the audio bank baked by `scons process-assets` (site_scons/assets.py)
+##
+## Every baked variant is re-synthesized in GDScript with the same noise seed
+## and compared sample by sample.
+
+# NumPy and Godot may round the last bit of sin()/pow() differently
+const MAX_SAMPLE_ERROR = 1
+
+var sound_manager: Node
+
+func before():
+	sound_manager = SoundManager
+
+func bank_loaded() -> bool:
+	"""Fails the calling test when there is no bank, so a missing bake never passes silently"""
+	assert_bool(sound_manager.baked_streams.is_empty()) \
+		.override_failure_message("No audio bank at %s - run `scons process-assets` with NumPy installed"
+			% sound_manager.AUDIO_BANK_PATH) \
+		.is_false()
+	return not sound_manager.baked_streams.is_empty()
+
+func max_sample_error(baked: PackedByteArray, synthesized: PackedByteArray) -> int:
+	var worst = 0
+	for offset in range(0, min(baked.size(), synthesized.size()), 2):
+		worst = max(worst, abs(baked.decode_s16(offset) - synthesized.decode_s16(offset)))
+	return worst
+
+func test_bank_covers_every_sound_type():
+	if not bank_loaded():
+		return
+	for sound_name in sound_manager.voice_pools:
+		assert_bool(sound_manager.baked_streams.has(sound_name)) \
+			.override_failure_message("Audio bank has no '%s'" % sound_name).is_true()
+
+func test_baked_sounds_match_gdscript_synthesis():
+	if not bank_loaded():
+		return
+	var previous_seed = sound_manager.noise_seed
+	for sound_name in sound_manager.baked_streams:
+		for baked in sound_manager.baked_streams[sound_name]:
+			sound_manager.noise_seed = baked.get_meta("noise_seed")
+			var synthesized = sound_manager.generate_sound(sound_name)
+			var label = "%s (seed %d)" % [sound_name, sound_manager.noise_seed]
+
+			assert_int(baked.data.size()).override_failure_message(label + " length differs") \
+				.is_equal(synthesized.data.size())
+			assert_int(baked.mix_rate).is_equal(synthesized.mix_rate)
+			assert_int(baked.loop_mode).is_equal(synthesized.loop_mode)
+			assert_int(max_sample_error(baked.data, synthesized.data)) \
+				.override_failure_message(label + " differs from the GDScript synthesis") \
+				.is_less_equal(MAX_SAMPLE_ERROR)
+	sound_manager.noise_seed = previous_seed
+
+func test_noisy_sounds_have_seed_variants():
+	if not bank_loaded():
+		return
+	var variants = sound_manager.baked_streams["enemy_destroy"]
+	assert_int(variants.size()).is_greater(1)
+	assert_bool(variants[0].data == variants[1].data).is_false()
+
+func test_baked_stream_survives_playback_cleanup():
+	if not bank_loaded():
+		return
+	var voice = sound_manager.play_sound("enemy_hit", -80.0)
+	var stream = voice.stream
+	assert_bool(stream.get_meta("baked", false)).is_true()
+
+	sound_manager._on_voice_finished(voice)
+	assert_int(stream.data.size()).is_greater(0)
@@ -0,0 +1,52 @@
+extends GdUnitTestSuite
+
+var registry: EnemyRegistry
+
+func before_test():
+	registry = EnemyRegistry.new()
+
+func make_enemy(pos: Vector2) -> Node2D:
+	var enemy = auto_free(Node2D.new())
+	enemy.position = pos
+	add_child(enemy)
+	registry.register(enemy)
+	return enemy
+
+func test_register_and_unregister_keep_the_count():
+	var first = make_enemy(Vector2(10, 10))
+	var second = make_enemy(Vector2(20, 20))
+	var third = make_enemy(Vector2(30, 30))
+
+	assert_bool(registry.register(first)).is_false()
+	assert_int(registry.count()).is_equal(3)
+
+	assert_bool(registry.unregister(first)).is_true()
+	assert_bool(registry.unregister(first)).is_false()
+	assert_int(registry.count()).is_equal(2)
+	assert_array(registry.get_enemies()).contains_exactly_in_any_order([second, third])
+	assert_int(registry.get_stats()["peak"]).is_equal(3)
+
+func test_query_radius_spans_cells():
+	var near = make_enemy(Vector2(120, 120))  # Next to the boundary of the first cell
+	var across = make_enemy(Vector2(140, 130))  # In the neighbouring cell
+	make_enemy(Vector2(600, 600))
+
+	assert_array(registry.query_radius(Vector2(130, 125), 50.0)).contains_exactly_in_any_order([near, across])
+
+func test_find_nearest_respects_range_and_filter():
+	var closest = make_enemy(Vector2(100, 100))
+	var further = make_enemy(Vector2(180, 100))
+
+	assert_object(registry.find_nearest(Vector2(90, 100), 200.0)).is_same(closest)
+	assert_object(registry.find_nearest(Vector2(90, 100), 200.0, func(enemy): return enemy != closest)).is_same(further)
+	assert_object(registry.find_nearest(Vector2(90, 100), 5.0)).is_null()
+
+func test_grid_sees_enemies_registered_and_removed_after_a_query():
+	var first = make_enemy(Vector2(50, 50))
+	registry.query_radius(Vector2.ZERO, 10.0)  # Builds the grid for this frame
+
+	var late = make_enemy(Vector2(60, 60))
+	registry.unregister(first)
+
+	assert_array(registry.query_radius(Vector2(55, 55), 30.0)).contains_exactly([late])
+	assert_int(registry.get_stats()["rebuilds"]).is_equal(1)
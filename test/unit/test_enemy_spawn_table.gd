@@ -0,0 +1,73 @@
+extends GdUnitTestSuite
+
+const SPAWN_TABLE_PATH = "res://resources/enemies/spawn_table.tres"
+
+func make_type(spawn_weight: float, min_wave: int) -> EnemyTypeData:
+	var data = EnemyTypeData.new()
+	data.spawn_weight = spawn_weight
+	data.min_wave = min_wave
+	return data
+
+func make_table() -> EnemySpawnTable:
+	# Band from wave 1: a(3) b(10); band from wave 5: a(3) b(10) c(5)
+	return EnemySpawnTable.from_enemy_types({
+		"b": make_type(1.0, 1),
+		"a": make_type(0.3, 1),
+		"c": make_type(0.5, 5)
+	})
+
+func test_bands_start_at_each_min_wave():
+	var table = make_table()
+
+	assert_array(Array(table.band_start_waves)).is_equal([1, 5])
+	assert_array(Array(table.band_offsets)).is_equal([0, 2, 5])
+	assert_array(Array(table.entry_cumulative)).is_equal([3, 13, 3, 13, 18])
+
+func test_band_lookup():
+	var table = make_table()
+
+	assert_int(table.get_band(0)).is_equal(-1)
+	assert_int(table.get_band(1)).is_equal(0)
+	assert_int(table.get_band(4)).is_equal(0)
+	assert_int(table.get_band(5)).is_equal(1)
+	assert_int(table.get_band(100)).is_equal(1)
+
+func test_pick_type_follows_cumulative_weights():
+	var table = make_table()
+
+	assert_str(table.pick_type(1, 0)).is_equal("a")
+	assert_str(table.pick_type(1, 2)).is_equal("a")
+	assert_str(table.pick_type(1, 3)).is_equal("b")
+	assert_str(table.pick_type(1, 12)).is_equal("b")
+	assert_str(table.pick_type(1, 13)).is_equal("a")  # Rolls wrap around the band total
+	assert_str(table.pick_type(6, 13)).is_equal("c")
+	assert_str(table.pick_type(6, 17)).is_equal("c")
+
+func test_nothing_spawns_before_the_first_band():
+	var table = EnemySpawnTable.from_enemy_types({"late": make_type(1.0, 3)})
+
+	assert_str(table.pick_type(1, 7)).is_equal("")
+	assert_array(table.get_available_types(1)).is_empty()
+	assert_array(table.get_available_types(3)).is_equal(["late"])
+
+func test_types_without_tickets_never_spawn():
+	var table = EnemySpawnTable.from_enemy_types({"rare": make_type(0.05, 1), "common": make_type(1.0, 1)})
+
+	assert_array(table.get_available_types(1)).is_equal(["common"])
+
+func test_compiled_table_matches_runtime_table():
+	# The test targets build the table first, so a missing one means a broken build
+	assert_bool(ResourceLoader.exists(SPAWN_TABLE_PATH)) \
+		.override_failure_message("No compiled spawn table at %s - run `scons process-assets`"
+			% SPAWN_TABLE_PATH) \
+		.is_true()
+	if not ResourceLoader.exists(SPAWN_TABLE_PATH):
+		return
+	var compiled = load(SPAWN_TABLE_PATH)
+	var runtime = EnemySpawnTable.from_enemy_types(EnemyManager.load_enemy_type_resources())
+
+	assert_array(compiled.enemy_types.keys()).contains_exactly_in_any_order(runtime.enemy_types.keys())
+	assert_array(Array(compiled.band_start_waves)).is_equal(Array(runtime.band_start_waves))
+	assert_array(Array(compiled.band_offsets)).is_equal(Array(runtime.band_offsets))
+	assert_array(Array(compiled.entry_types)).is_equal(Array(runtime.entry_types))
+	assert_array(Array(compiled.entry_cumulative)).is_equal(Array(runtime.entry_cumulative))
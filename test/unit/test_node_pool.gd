@@ -0,0 +1,72 @@
+extends GdUnitTestSuite
+
+var node_pool: Node
+var holder: Node
+
+func before():
+	node_pool = NodePool
+
+func before_test():
+	holder = auto_free(Node2D.new())
+	add_child(holder)
+	node_pool.reset_pool_stats()
+
+func after_test():
+	for node in holder.get_children():
+		node_pool.release(node)
+	await await_idle_frame()
+
+func test_released_node_is_reused():
+	var bullet = node_pool.acquire("enemy_bullet")
+	holder.add_child(bullet)
+	node_pool.release(bullet)
+	await await_idle_frame()
+
+	assert_object(bullet.get_parent()).is_null()
+	assert_object(node_pool.acquire("enemy_bullet")).is_same(bullet)
+	assert_int(node_pool.get_pool_stats()["enemy_bullet"]["reused"]).is_greater_equal(1)
+	node_pool.release(bullet)
+
+func test_double_release_is_ignored():
+	var bullet = node_pool.acquire("enemy_bullet")
+	holder.add_child(bullet)
+	node_pool.release(bullet)
+	node_pool.release(bullet)
+	await await_idle_frame()
+
+	assert_int(node_pool.get_pool_stats()["enemy_bullet"]["released"]).is_equal(1)
+	assert_int(node_pool.pools["enemy_bullet"]["idle"].count(bullet)).is_equal(1)
+
+func test_release_restores_defaults():
+	var bullet = node_pool.acquire("enemy_bullet")
+	var default_speed = bullet.speed
+	bullet.speed = default_speed * 3
+	bullet.rotation = 1.0
+	holder.add_child(bullet)
+	node_pool.release(bullet)
+	await await_idle_frame()
+
+	assert_int(bullet.speed).is_equal(default_speed)
+	assert_float(bullet.rotation).is_equal(0.0)
+
+func test_high_water_tracks_peak_active_nodes():
+	var bullets = []
+	for i in range(5):
+		bullets.append(node_pool.acquire("enemy_bullet"))
+	for bullet in bullets:
+		holder.add_child(bullet)
+		node_pool.release(bullet)
+	holder.add_child(node_pool.acquire("enemy_bullet"))
+
+	assert_int(node_pool.get_pool_stats()["enemy_bullet"]["high_water"]).is_equal(5)
+
+func test_nodes_not_from_a_pool_are_freed():
+	var bullet = load("res://scenes/projectiles/EnemyBullet.tscn").instantiate()
+	holder.add_child(bullet)
+	node_pool.release(bullet)
+	await await_idle_frame()
+
+	assert_bool(is_instance_valid(bullet) and not bullet.is_queued_for_deletion()).is_false()
+
+func test_unknown_pool_returns_null():
+	assert_object(node_pool.get_pool("missing")).is_null()
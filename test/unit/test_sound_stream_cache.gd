@@ -0,0 +1,94 @@
+extends GdUnitTestSuite
+
+var sound_manager: Node
+var saved_bank: Dictionary
+
+func before():
+	sound_manager = SoundManager
+
+func before_test():
+	# Exercise the synthesis cache, not the baked bank
+	saved_bank = sound_manager.baked_streams
+	sound_manager.baked_streams = {}
+	sound_manager.stop_all_sounds()
+	sound_manager.clear_stream_cache()
+	sound_manager.stream_cache_budget = sound_manager.STREAM_CACHE_BUDGET_BYTES
+	sound_manager.reset_audio_stats()
+
+func after_test():
+	sound_manager.stop_all_sounds()
+	sound_manager.clear_stream_cache()
+	sound_manager.stream_cache_budget = sound_manager.STREAM_CACHE_BUDGET_BYTES
+	sound_manager.baked_streams = saved_bank
+
+func test_second_play_hits_the_cache():
+	var first = sound_manager.get_sound_stream("player_hit")
+	var second = sound_manager.get_sound_stream("player_hit")
+
+	assert_object(second).is_same(first)
+	var stats = sound_manager.get_audio_stats()
+	assert_int(stats["cache_misses"]).is_equal(1)
+	assert_int(stats["cache_hits"]).is_equal(1)
+	assert_float(stats["hit_rate"]).is_equal(0.5)
+
+func test_noisy_sounds_cache_a_bounded_number_of_variants():
+	for i in range(50):
+		sound_manager.get_sound_stream("enemy_hit")
+
+	assert_int(sound_manager.get_audio_stats()["cache_misses"]).is_less_equal(sound_manager.SYNTH_VARIANTS)
+	assert_int(sound_manager.stream_cache.size()).is_less_equal(sound_manager.SYNTH_VARIANTS)
+
+func test_least_recently_used_stream_is_evicted_over_budget():
+	var hit_sound = sound_manager.get_sound_stream("player_hit")
+	var fanfare_size = sound_manager.create_fanfare(0.5).data.size()
+	sound_manager.stream_cache_budget = hit_sound.data.size() + fanfare_size
+	sound_manager.get_sound_stream("powerup")
+	sound_manager.get_sound_stream("player_hit")  # Now more recent than powerup
+	sound_manager.get_sound_stream("wave_start")
+
+	assert_bool(sound_manager.stream_cache.has("player_hit:0")).is_true()
+	assert_bool(sound_manager.stream_cache.has("powerup:0")).is_false()
+	assert_int(sound_manager.get_audio_stats()["evictions"]).is_greater(0)
+	assert_int(sound_manager.stream_cache_bytes).is_less_equal(sound_manager.stream_cache_budget)
+
+func test_rapid_fire_uses_separate_voices():
+	var first = sound_manager.play_sound("shoot", -80.0)
+	var second = sound_manager.play_sound("shoot", -80.0)
+
+	assert_object(first).is_not_same(second)
+	assert_int(sound_manager.get_audio_stats()["active_voices"]).is_equal(2)
+
+func test_oldest_voice_is_stolen_when_pool_is_full():
+	var voice_count = sound_manager.voice_pools["shoot"].size()
+	var first = sound_manager.play_sound("shoot", -80.0)
+	for i in range(voice_count - 1):
+		sound_manager.play_sound("shoot", -80.0)
+
+	var stolen = sound_manager.play_sound("shoot", -80.0)
+
+	assert_object(stolen).is_same(first)
+	var stats = sound_manager.get_audio_stats()
+	assert_int(stats["voice_steals"]).is_equal(1)
+	assert_int(stats["active_voices"]).is_equal(voice_count)
+	assert_int(stats["peak_voices"]).is_equal(voice_count)
+
+func test_oldest_voice_is_stolen_across_a_stats_reset():
+	var voice_count = sound_manager.voice_pools["shoot"].size()
+	var first = sound_manager.play_sound("shoot", -80.0)
+	sound_manager.play_sound("shoot", -80.0)
+	sound_manager.reset_audio_stats()  # As BenchRunner does after warmup
+	for i in range(voice_count - 2):
+		sound_manager.play_sound("shoot", -80.0)
+
+	assert_object(sound_manager.play_sound("shoot", -80.0)).is_same(first)
+	assert_int(sound_manager.get_audio_stats()["voice_steals"]).is_equal(1)
+
+func test_finished_voice_is_reused():
+	var voice = sound_manager.play_sound("player_hit", -80.0)
+	sound_manager._on_voice_finished(voice)
+
+	assert_object(sound_manager.play_sound("player_hit", -80.0)).is_same(voice)
+	assert_int(sound_manager.get_audio_stats()["voice_steals"]).is_equal(0)
+
+func test_unknown_sound_is_ignored():
+	assert_object(sound_manager.play_sound("no_such_sound")).is_null()
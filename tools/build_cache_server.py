@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Build Cache Server
+Minimal HTTP stand-in for the shared build cache (GET/HEAD/PUT of cache archives)
+
+Usage:
+  python tools/build_cache_server.py --port 8765 --dir .temp/build_cache_server
+  scons build-release cache=http://localhost:8765
+"""
+
+import os
+import re
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Only cache archives named by key are served or accepted
+BLOB_PATH = re.compile(r'^/([a-z]+-[0-9a-f]{40,64})\.tar\.gz$')
+
+# Refuse uploads larger than this (bytes)
+MAX_UPLOAD_SIZE = 2 * 1024 * 1024 * 1024
+
+class BuildCacheHandler(BaseHTTPRequestHandler):
+    """Serve cache archives from the storage directory"""
+
+    storage_dir = '.'
+
+    def blob_path(self):
+        match = BLOB_PATH.match(self.path)
+        if not match:
+            return None
+        key = match.group(1)
+        return os.path.join(self.storage_dir, key.split('-', 1)[1][:2], f"{key}.tar.gz")
+
+    def send_blob(self, include_body):
+        path = self.blob_path()
+        if path is None:
+            self.send_error(400, "Invalid cache key")
+            return
+        if not os.path.isfile(path):
+            self.send_error(404, "Not in cache")
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/gzip')
+        self.send_header('Content-Length', str(os.path.getsize(path)))
+        self.end_headers()
+        if include_body:
+            with open(path, 'rb') as f:
+                while chunk := f.read(1024 * 1024):
+                    self.wfile.write(chunk)
+
+    def do_GET(self):
+        self.send_blob(include_body=True)
+
+    def do_HEAD(self):
+        self.send_blob(include_body=False)
+
+    def do_PUT(self):
+        path = self.blob_path()
+        length = int(self.headers.get('Content-Length', 0))
+        if path is None:
+            self.send_error(400, "Invalid cache key")
+            return
+        if length <= 0 or length > MAX_UPLOAD_SIZE:
+            self.send_error(413, "Invalid upload size")
+            return
+
+        # Write to a temporary file first so readers never see a partial archive
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        remaining = length
+        with open(temp_path, 'wb') as f:
+            while remaining > 0:
+                chunk = self.rfile.read(min(remaining, 1024 * 1024))
+                if not chunk:
+                    break
+                f.write(chunk)
+                remaining -= len(chunk)
+        if remaining:
+            os.remove(temp_path)
+            self.send_error(400, "Incomplete upload")
+            return
+        os.replace(temp_path, path)
+
+        self.send_response(201)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+def main():
+    parser = argparse.ArgumentParser(description="Local HTTP server for the Continuum build cache")
+    parser.add_argument('--host', default='127.0.0.1', help="Address to bind (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8765, help="Port to listen on (default: 8765)")
+    parser.add_argument('--dir', default=os.path.join('.temp', 'build_cache_server'),
+                        help="Directory that stores cache archives")
+    args = parser.parse_args()
+
+    os.makedirs(args.dir, exist_ok=True)
+    BuildCacheHandler.storage_dir = os.path.abspath(args.dir)
+
+    server = ThreadingHTTPServer((args.host, args.port), BuildCacheHandler)
+    print(f"🗃️  Build cache server on http://{args.host}:{args.port} (storing in {args.dir})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Web Server
+Local static server for the Web build, honoring the deploy manifest's encodings and cache headers
+
+Usage:
+  scons build-web
+  python tools/web_server.py --port 8060 --dir build/web-deploy
+  python tools/web_server.py --dir build/web --throttle-kbps 4000   # Plain export, for comparison
+
+With a manifest.json in the directory, precompressed .br/.gz variants are
+served when the browser accepts them, with the manifest's Cache-Control and
+an ETag. Without one, files are served as-is with no-cache, like the current
+deployment. --throttle-kbps simulates a slow link, and every response is
+logged with its encoding, size and time, so load times can be compared offline.
+"""
+
+import os
+import json
+import time
+import argparse
+import mimetypes
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import unquote, urlsplit
+
+# Served instead of the directory root
+DEFAULT_ENTRY = 'index.html'
+
+# Preferred first when the browser accepts several
+ENCODING_PREFERENCE = ['br', 'gzip']
+
+# Godot's threaded Web builds need a cross-origin isolated page
+ISOLATION_HEADERS = {
+    'Cross-Origin-Opener-Policy': 'same-origin',
+    'Cross-Origin-Embedder-Policy': 'require-corp'
+}
+
+CONTENT_TYPES = {'.wasm': 'application/wasm', '.pck': 'application/octet-stream'}
+
+SEND_CHUNK_SIZE = 16 * 1024
+
+class WebHandler(BaseHTTPRequestHandler):
+    """Serve the deploy directory, choosing encodings from the manifest"""
+
+    root_dir = '.'
+    manifest = None
+    throttle_bytes_per_second = 0
+
+    def resolve(self):
+        """(name, manifest entry or None) for the request path, or (None, None) if it is not served"""
+        name = unquote(urlsplit(self.path).path).lstrip('/')
+        entry = self.manifest['entry'] if self.manifest else DEFAULT_ENTRY
+        name = name or entry
+        if '/' in name or name.startswith('.') or not os.path.isfile(os.path.join(self.root_dir, name)):
+            return None, None
+        info = self.manifest['files'].get(name) if self.manifest else None
+        if self.manifest and info is None:
+            return None, None  # Only manifest files are published
+        return name, info
+
+    def choose_encoding(self, info):
+        if not info:
+            return None
+        accepted = [part.split(';')[0].strip() for part in self.headers.get('Accept-Encoding', '').split(',')]
+        for encoding in ENCODING_PREFERENCE:
+            if encoding in accepted and encoding in info['encodings']:
+                return encoding
+        return None
+
+    def send_file(self, include_body):
+        name, info = self.resolve()
+        if name is None:
+            self.send_error(404, "Not found")
+            return
+
+        if info and self.headers.get('If-None-Match') == f'"{info["sha256"]}"':
+            self.send_response(304)
+            self.send_header('ETag', f'"{info["sha256"]}"')
+            self.end_headers()
+            self.log_transfer(name, '-', 0, 0.0)
+            return
+
+        encoding = self.choose_encoding(info)
+        path = os.path.join(self.root_dir, info['encodings'][encoding]['file'] if encoding else name)
+        size = os.path.getsize(path)
+
+        self.send_response(200)
+        ext = os.path.splitext(name)[1]
+        self.send_header('Content-Type', info['content_type'] if info else
+                         CONTENT_TYPES.get(ext) or mimetypes.guess_type(name)[0] or 'application/octet-stream')
+        self.send_header('Content-Length', str(size))
+        self.send_header('Cache-Control', info['cache_control'] if info else 'no-cache')
+        if info:
+            self.send_header('ETag', f'"{info["sha256"]}"')
+            self.send_header('Vary', 'Accept-Encoding')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        for header, value in ISOLATION_HEADERS.items():
+            self.send_header(header, value)
+        self.end_headers()
+
+        start = time.perf_counter()
+        if include_body:
+            self.send_body(path, start)
+        self.log_transfer(name, encoding or 'identity', size, time.perf_counter() - start)
+
+    def send_body(self, path, start):
+        sent = 0
+        with open(path, 'rb') as f:
+            while chunk := f.read(SEND_CHUNK_SIZE):
+                self.wfile.write(chunk)
+                sent += len(chunk)
+                if self.throttle_bytes_per_second:
+                    # Sleep until the link would have carried everything sent so far
+                    delay = sent / self.throttle_bytes_per_second - (time.perf_counter() - start)
+                    if delay > 0:
+                        time.sleep(delay)
+
+    def log_transfer(self, name, encoding, size, seconds):
+        print(f"  {self.command} /{name:<40} {encoding:<8} {size / 1024:>10.1f} KB {seconds * 1000:>8.0f} ms")
+
+    def log_message(self, format, *args):
+        pass  # log_transfer() reports every response
+
+    def do_GET(self):
+        self.send_file(include_body=True)
+
+    def do_HEAD(self):
+        self.send_file(include_body=False)
+
+def main():
+    parser = argparse.ArgumentParser(description="Local static server for the Continuum Web build")
+    parser.add_argument('--host', default='127.0.0.1', help="Address to bind (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8060, help="Port to listen on (default: 8060)")
+    parser.add_argument('--dir', default=os.path.join('build', 'web-deploy'),
+                        help="Directory to serve (default: build/web-deploy)")
+    parser.add_argument('--throttle-kbps', type=int, default=0,
+                        help="Limit each response to this many kilobits per second (0 = unlimited)")
+    args = parser.parse_args()
+
+    WebHandler.root_dir = os.path.abspath(args.dir)
+    WebHandler.throttle_bytes_per_second = args.throttle_kbps * 1000 // 8
+    manifest_path = os.path.join(args.dir, 'manifest.json')
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r') as f:
+            WebHandler.manifest = json.load(f)
+
+    server = ThreadingHTTPServer((args.host, args.port), WebHandler)
+    mode = "manifest encodings and caching" if WebHandler.manifest else "plain files, no-cache"
+    throttle = f", throttled to {args.throttle_kbps} kbps" if args.throttle_kbps else ""
+    print(f"🌐 Web server on http://{args.host}:{args.port} serving {args.dir} ({mode}{throttle})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == '__main__':
+    main()